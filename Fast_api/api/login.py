@@ -1,24 +1,23 @@
 from fastapi import APIRouter, HTTPException, Request, Response
 from Fast_api.schemas.user import LoginRequest
-from Fast_api.db.session import get_db
+from Fast_api.db.session import get_async_db
 from fastapi import Depends
 from Fast_api.auth.jwt_handle import create_refresh_token, create_access_token, verify_refresh_token
+from Fast_api.auth.user_cache import user_cache
 from jose import jwt
-from Fast_api.models.user import User
+from Fast_api.services.async_user_service import get_user_by_username, update_password_hash
 from datetime import datetime, timedelta
 import zoneinfo
 from Fast_api.core.config import settings
+from Fast_api.core.json_response import FastJSONResponse
 from pydantic import BaseModel
-from passlib.context import CryptContext
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-import asyncio
+from Fast_api.core.rate_limit import limiter
+from Fast_api.services.password_service import password_hasher
+import logging
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+logger = logging.getLogger(__name__)
 
-limiter = Limiter(key_func=get_remote_address)
-
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class TokenResponse(BaseModel):
@@ -31,40 +30,35 @@ async def login_for_access_token(
     request: Request,
     login_request: LoginRequest,
     response: Response,
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """
     사용자의 로그인 요청을 처리하고, 인증 정보가 올바르면 JWT 액세스 토큰을 반환합니다.
 
     Args:
         login_request (LoginRequest): 사용자명과 비밀번호가 포함된 로그인 요청.
-        db (Session): 데이터베이스 세션 의존성.
+        db (AsyncSession): 비동기 데이터베이스 세션 의존성.
 
     Returns:
         dict: 액세스 토큰과 토큰 타입을 포함하는 딕셔너리.
     """
-    # 사용자 조회 (SQLite는 빠르므로 동기로 유지)
-    user = db.query(User).filter(User.username == login_request.username).first()
+    # 사용자 조회 (AsyncSession: 이벤트 루프를 막지 않음)
+    user = await get_user_by_username(db, login_request.username)
 
     # 타이밍 공격 방지: 항상 비밀번호 검증 수행
-    # 비밀번호 해싱은 CPU-intensive 작업이므로 비동기 처리
-    loop = asyncio.get_event_loop()
-
+    # 비밀번호 해싱은 CPU-intensive 작업이므로 전용 프로세스 풀에서 처리 (포화 시 503)
     if user:
-        # user.verify_password() 메서드를 별도 스레드에서 실행 (User 모델에 정의됨)
-        password_valid = await loop.run_in_executor(
-            None,
-            user.verify_password,  # User.verify_password(password) 실행
-            login_request.password
-        )
+        password_valid, new_hash = await password_hasher.verify_and_update(login_request.password, user.hashed_password)
+        if new_hash:
+            # 반복 횟수가 현재 설정과 다른 해시는 로그인 성공 시 새 해시로 교체
+            try:
+                await update_password_hash(db, user.id, new_hash)
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f"비밀번호 재해싱 저장 실패: user={user.username}, error={str(e)}")
     else:
         # 사용자가 없어도 더미 해시 검증으로 동일한 시간 소요
-        await loop.run_in_executor(
-            None,
-            pwd_context.verify,
-            login_request.password,
-            "$pbkdf2-sha256$29000$N2bMWQtBaA0hRAihlBJiLA$1t8iyB2A.WF/Z5JZv.lfCIhXXN8SjSNLW3pn.ljxF6g"
-        )
+        await password_hasher.verify_dummy(login_request.password)
         password_valid = False
 
     # 사용자 정보 또는 비밀번호가 올바르지 않은 경우 예외 발생
@@ -72,7 +66,7 @@ async def login_for_access_token(
         raise HTTPException(status_code=401, detail="사용자명 또는 비밀번호를 확인하세요.")
 
     # Access Token 생성
-    access_token = create_access_token(user.username)
+    access_token = create_access_token(user.username, paid_user=user.paid_user)
 
     # Refresh Token 생성 및 HttpOnly 쿠키 설정
     refresh_token = create_refresh_token(user.username)
@@ -92,12 +86,13 @@ async def login_for_access_token(
 
 @router.post("/refresh", response_model=TokenResponse)
 @limiter.limit("30/minute;200/hour;1000/day")
-async def refresh_access_token(request: Request):
+async def refresh_access_token(request: Request, db=Depends(get_async_db)):
     """
     Refresh Token을 사용하여 새로운 Access Token을 발급합니다.
 
     Args:
         request (Request): FastAPI Request 객체 (쿠키 접근용)
+        db (AsyncSession): 비동기 데이터베이스 세션 의존성 (현재 유료 여부 조회)
 
     Returns:
         TokenResponse: 새로 발급된 Access Token
@@ -118,8 +113,18 @@ async def refresh_access_token(request: Request):
     # refresh_token 검증
     username = verify_refresh_token(refresh_token)
 
+    # 유료 여부는 refresh token에 넣지 않고 발급 시점의 값을 사용 (user_cache → DB)
+    snapshot = user_cache.get(username)
+    if snapshot is not None:
+        paid_user = snapshot.paid_user
+    else:
+        user = await get_user_by_username(db, username)
+        if user is None:
+            raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+        paid_user = user.paid_user
+
     # 새 Access Token 생성
-    new_access_token = create_access_token(username)
+    new_access_token = create_access_token(username, paid_user=paid_user)
 
     # 응답 반환
     return TokenResponse(access_token=new_access_token, token_type="bearer")
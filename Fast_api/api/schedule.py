@@ -1,39 +1,108 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from Fast_api.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from Fast_api.db.session import get_async_db
+from Fast_api.db import write_queue
+from Fast_api.db.shards import get_schedule_db, get_async_schedule_db
 from Fast_api.auth.jwt_handle import get_current_user
-from Fast_api.models.user import User
-from Fast_api.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse, NaturalLanguageInput
-from Fast_api.services import schedule_service
+from Fast_api.auth.user_cache import UserSnapshot
+from Fast_api.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse, NaturalLanguageInput, ScheduleSummary, DailySummary, ScheduleChanges, ScheduleBatchRequest, ScheduleBatchResponse
+from Fast_api.services import schedule_service, async_schedule_service, quota_service
 from Fast_api.services.llm_schedule_parser import parse_natural_language_to_schedules
-from typing import List
+from Fast_api.core.json_response import FastJSONResponse, make_row_encoder
+from typing import Iterator, List, Literal, Optional
+from contextlib import contextmanager
+from datetime import datetime, date
+from zoneinfo import ZoneInfo
 import logging
 import json
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from Fast_api.core.rate_limit import limiter, tiered_limit, user_key
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 logger = logging.getLogger(__name__)
-limiter = Limiter(key_func=get_remote_address)
+
+# DB에서 projection으로 읽은 Row를 ScheduleResponse 필드 순서의 dict로 변환 (재검증 생략)
+encode_schedules = make_row_encoder(ScheduleResponse)
+
+
+def make_etag(user_id: int, version: int) -> str:
+    # 사용자별 일정 버전 기반 weak ETag (같은 URL이면 같은 버전 = 같은 내용)
+    return f'W/"{user_id}-{version}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak 비교: W/ 접두사 무시
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+@contextmanager
+def write_queue_errors() -> Iterator[None]:
+    # group-commit 큐 대기 시간 초과: 클라이언트가 재시도해도 되는지 알 수 있도록 반영 여부를 구분해 응답
+    try:
+        yield
+    except write_queue.WriteNotAppliedError:
+        raise HTTPException(
+            status_code=503,
+            detail="요청이 많아 일정 변경을 처리하지 못했습니다. 변경되지 않았으니 다시 시도해주세요.",
+            headers={"Retry-After": "1"}
+        )
+    except write_queue.WriteOutcomeUnknownError:
+        raise HTTPException(
+            status_code=504,
+            detail="일정 변경 처리 시간이 초과되었습니다. 변경이 반영되었을 수 있으니 일정을 확인한 뒤 다시 시도해주세요."
+        )
 
 @router.post("/schedules", response_model=ScheduleResponse)
 def create_schedule(
     schedule: ScheduleCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
+):
+    with write_queue_errors():
+        return schedule_service.save_schedule(db, schedule, current_user.id)
+
+@router.post("/schedules/batch", response_model=ScheduleBatchResponse)
+def batch_schedules(
+    batch: ScheduleBatchRequest,
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
-    return schedule_service.create_schedule(db, schedule, current_user.id)
+    try:
+        version, results = schedule_service.apply_schedule_batch(db, current_user.id, batch.operations)
+        db.commit()
+    except schedule_service.DuplicateBatchIdError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="하나의 일정 id는 배치에서 한 번만 사용할 수 있습니다.")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"일정 배치 처리 실패: user={current_user.username}, error={str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="일정 일괄 처리 중 오류가 발생했습니다. 다시 시도해주세요.")
+    return ScheduleBatchResponse(version=version, results=results)
 
 @router.post("/schedules/parse-and-create", response_model=List[ScheduleResponse])
-@limiter.limit("20/minute;100/hour;300/day")
+# 사용자별 제한 (같은 IP의 다른 사용자와 한도를 나누지 않음), 유료 사용자는 더 높은 한도
+@limiter.limit(tiered_limit(free="20/minute;100/hour;300/day", paid="60/minute;600/hour;3000/day"), key_func=user_key)
 async def parse_and_create_schedules(
     request: Request,
     input_data: NaturalLanguageInput,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    schedule_db: AsyncSession = Depends(get_async_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
+    # 무료 사용자는 LLM 호출 전에 오늘 요청 1건을 예약 (한도 초과 시 LLM을 호출하지 않고 429)
+    reservation = await quota_service.reserve_request(db, current_user)
+
     try:
-        parsed_schedules = await parse_natural_language_to_schedules(input_data.text)
+        # LLM 호출/검증이 실패하면 예약한 요청 수 환불
+        async with quota_service.refund_on_error(db, reservation):
+            parsed_schedules = await parse_natural_language_to_schedules(input_data.text)
     except HTTPException as he:
         # 이미 HTTPException으로 처리된 오류는 그대로 전달
         raise he
@@ -49,70 +118,118 @@ async def parse_and_create_schedules(
         # 기타 모든 오류는 일반 메시지로 처리, 서버 로그에만 상세 기록
         logger.error(f"LLM 파싱 실패: user={current_user.username}, error={str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="일정 파싱 중 오류가 발생했습니다. 다시 시도해주세요.")
-    
-    # 무료 사용자만 제한 체크
-    if not current_user.paid_user:
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-        KST = ZoneInfo('Asia/Seoul')
-        today = datetime.now(KST).date()
-
-        # 날짜 리셋
-        if current_user.last_reset_date != today:
-            current_user.request_count = 0
-            current_user.last_reset_date = today
-
-        # 제한 체크
-        if current_user.request_count >= current_user.daily_limit:
-            raise HTTPException(
-                status_code=429,
-                detail=f"무료 사용자 일일 요청 한도를 초과했습니다. (오늘: {current_user.request_count}/{current_user.daily_limit})"
-            )
-        # 카운트 증가
-        current_user.request_count += 1
-
-    created_schedules = []
-    for schedule in parsed_schedules:
-        db_schedule = schedule_service.create_schedule(db, schedule, current_user.id)
-        created_schedules.append(db_schedule)
+
     try:
-        db.commit()
+        # 샤딩 시 일정은 사용자의 샤드에 저장 (샤딩을 끄면 db와 같은 세션)
+        created_schedules = await async_schedule_service.create_schedules(schedule_db, parsed_schedules, current_user.id)
+        await schedule_db.commit()
     except Exception as e:
-        db.rollback()
+        await schedule_db.rollback()
+        await quota_service.refund_request(db, reservation)
         logger.error(f"일정 생성 커밋 실패: user={current_user.username}, error={str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="일정 생성 중 오류가 발생했습니다. 다시 시도해주세요.")
 
-
     return created_schedules
 
 @router.get("/schedules", response_model=List[ScheduleResponse])
 def get_schedules(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    limit: int = Query(100, ge=1, le=1000),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
-    return schedule_service.get_user_schedules(db, current_user.id, skip, limit)
+    # from/to는 [from, to) 반열린 구간, 결과는 scheduled_at 오름차순
+    if start is not None and end is not None and schedule_service.to_kst_naive(start) >= schedule_service.to_kst_naive(end):
+        raise HTTPException(status_code=400, detail="'from'은 'to'보다 이전이어야 합니다.")
+
+    # 버전이 같으면 목록 쿼리/직렬화 없이 304
+    etag = make_etag(current_user.id, schedule_service.get_schedule_version(db, current_user.id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    try:
+        schedules = schedule_service.get_user_schedules(db, current_user.id, skip, limit, start, end, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효하지 않은 cursor입니다.")
+
+    # 페이지가 가득 찼으면 다음 페이지 커서를 헤더로 전달 (응답 본문은 기존 리스트 형식 유지)
+    if len(schedules) == limit:
+        headers["X-Next-Cursor"] = schedule_service.encode_cursor(schedules[-1])
+    # DB 행을 바로 인코딩 (response_model 재검증/jsonable_encoder 생략)
+    return FastJSONResponse(encode_schedules(schedules), headers=headers)
+
+@router.get("/schedules/changes", response_model=ScheduleChanges)
+def get_schedule_changes(
+    since: int = Query(0, ge=0),
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
+):
+    # 버전을 먼저 읽어야 그 사이 커밋된 변경이 누락되지 않음 (중복은 클라이언트에서 멱등 처리)
+    version = schedule_service.get_schedule_version(db, current_user.id)
+    if since > version:
+        raise HTTPException(status_code=410, detail="동기화 기준 버전이 유효하지 않습니다. 전체 일정을 다시 조회하세요.")
+    changed, deleted = schedule_service.get_schedule_changes(db, current_user.id, since)
+    return FastJSONResponse({"version": version, "changed": encode_schedules(changed), "deleted": deleted})
+
+@router.get("/schedules/summary", response_model=ScheduleSummary)
+def get_schedule_summary(
+    period: Literal["week", "month"] = "week",
+    anchor: Optional[date] = None,
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
+):
+    # anchor 미지정 시 오늘(KST)이 속한 기간
+    if anchor is None:
+        anchor = datetime.now(ZoneInfo('Asia/Seoul')).date()
+    start, end = schedule_service.get_period_range(period, anchor)
+    rows = schedule_service.get_daily_summary(db, current_user.id, start, end)
+
+    days = [DailySummary(date=day, total=total, completed=completed) for day, total, completed in rows]
+    total = sum(d.total for d in days)
+    completed = sum(d.completed for d in days)
+    return ScheduleSummary(
+        period=period,
+        start=start,
+        end=end,
+        total=total,
+        completed=completed,
+        completion_rate=round(completed / total * 100, 1) if total else 0.0,
+        days=days
+    )
 
 @router.get("/schedules/{schedule_id}", response_model=ScheduleResponse)
 def get_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
+    etag = make_etag(current_user.id, schedule_service.get_schedule_version(db, current_user.id))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     schedule = schedule_service.get_schedule(db, schedule_id, current_user.id)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
     return schedule
 
 @router.put("/schedules/{schedule_id}", response_model=ScheduleResponse)
 def update_schedule(
     schedule_id: int,
     schedule_update: ScheduleUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
-    schedule = schedule_service.update_schedule(db, schedule_id, current_user.id, schedule_update)
+    with write_queue_errors():
+        schedule = schedule_service.update_schedule(db, schedule_id, current_user.id, schedule_update)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
     return schedule
@@ -120,10 +237,11 @@ def update_schedule(
 @router.delete("/schedules/{schedule_id}")
 def delete_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_schedule_db),
+    current_user: UserSnapshot = Depends(get_current_user)
 ):
-    success = schedule_service.delete_schedule(db, schedule_id, current_user.id)
+    with write_queue_errors():
+        success = schedule_service.delete_schedule(db, schedule_id, current_user.id)
     if not success:
         raise HTTPException(status_code=404, detail="Schedule not found")
     return {"message": "Schedule deleted successfully"}
@@ -1,30 +1,25 @@
-import asyncio
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from Fast_api.schemas.user import UserCreate, UserSchema
-from Fast_api.services.user_service import get_user_by, create_user
-from passlib.context import CryptContext
-from Fast_api.db.session import get_db
+from Fast_api.services.async_user_service import get_user_by, create_user
+from Fast_api.db.session import get_async_db
+from Fast_api.core.json_response import FastJSONResponse
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 @router.post("/signup", response_model=UserSchema)
-async def signup(user: UserCreate, db: Session = Depends(get_db)):
-    user_info = get_user_by(db, email=user.email)
+async def signup(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    user_info = await get_user_by(db, email=user.email)
     user_email = user_info.email if user_info else None
 
     if user_email == user.email:
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    # 해싱 풀 포화(503 + Retry-After) 등 HTTPException은 그대로 전달, 중복 username만 400
     try:
-        loop = asyncio.get_event_loop()
-        new_user = await loop.run_in_executor(
-            None,
-            create_user,
-            db,
-            user
-        )
-    except Exception as e:
+        new_user = await create_user(db, user)
+    except IntegrityError:
         raise HTTPException(status_code=400, detail="중복된 사용자 이름입니다.")
     return new_user
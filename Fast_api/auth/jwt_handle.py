@@ -3,18 +3,25 @@ from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from Fast_api.core.config import settings
 from datetime import datetime
+import time
 import zoneinfo
 from Fast_api.db.session import get_db
+from Fast_api.auth.token_cache import token_cache
+from Fast_api.auth.user_cache import UserSnapshot, user_cache
 from sqlalchemy.orm import Session
 
 def verify_token(token: str):
     """
     JWT 토큰을 검증하고, 유효한 경우 토큰의 페이로드를 반환합니다.
+    한 번 검증한 토큰은 만료 시각까지 token_cache에서 바로 반환합니다.
     
     Args:
         token (str): 검증할 JWT 토큰 문자열.
 
     """
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
 
     try:
         #JWT 토큰 디코딩
@@ -35,14 +42,14 @@ def verify_token(token: str):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        current_time = datetime.now(tz=zoneinfo.ZoneInfo("UTC"))
-
-        if datetime.fromtimestamp(exp_time, tz=zoneinfo.ZoneInfo("UTC")) < current_time:
+        # epoch 초끼리 비교 (UTC datetime 생성 불필요)
+        if exp_time < time.time():
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="토큰이 만료되었습니다.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        token_cache.put(token, payload)
         return payload
     except JWTError:
         raise HTTPException(
@@ -56,16 +63,17 @@ security = HTTPBearer()
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-):
+) -> UserSnapshot:
     """
     JWT 토큰을 검증하고 현재 사용자를 반환하는 의존성 함수.
+    사용자 정보는 user_cache에서 먼저 찾고, 없을 때만 DB를 조회합니다.
 
     Args:
         credentials: HTTPBearer로부터 추출된 인증 자격 증명
         db: 데이터베이스 세션
 
     Returns:
-        User: 인증된 사용자 객체
+        UserSnapshot: 인증된 사용자 정보 (id, username, paid_user, daily_limit)
     """
     from Fast_api.models.user import User
 
@@ -73,6 +81,10 @@ def get_current_user(
     payload = verify_token(token)
     username = payload.get("sub")
 
+    snapshot = user_cache.get(username)
+    if snapshot is not None:
+        return snapshot
+
     user = db.query(User).filter(User.username == username).first()
     if not user:
         raise HTTPException(
@@ -81,15 +93,19 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user
+    snapshot = UserSnapshot.from_user(user)
+    user_cache.put(snapshot)
+    return snapshot
 
 
-def create_access_token(username: str) -> str:
+def create_access_token(username: str, paid_user: bool = False) -> str:
     """
     Access Token을 생성합니다.
+    paid_user 클레임은 등급별 rate limit 키에 사용합니다. (등급 변경은 다음 발급 토큰부터 반영)
 
     Args:
         username (str): 사용자 이름
+        paid_user (bool): 유료 사용자 여부
 
     Returns:
         str: 생성된 Access Token
@@ -102,7 +118,8 @@ def create_access_token(username: str) -> str:
     access_token = jwt.encode(
         {
             "sub": username,
-            "exp": int(expire_time.timestamp())
+            "exp": int(expire_time.timestamp()),
+            "paid_user": bool(paid_user)
         },
         settings.SECRET_KEY,
         algorithm=settings.ALGORITHM,
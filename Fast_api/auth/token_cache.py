@@ -0,0 +1,74 @@
+"""
+검증된 JWT 메모이제이션 (verify_token용)
+
+클라이언트는 같은 access token을 만료(ACCESS_TOKEN_EXPIRE_MINUTES)까지 반복해서 보내므로
+한 번 서명/만료 검증을 통과한 토큰의 페이로드를 토큰 digest 기준으로 exp까지 보관합니다.
+- 키는 토큰 원문이 아닌 SHA-256 digest (메모리에 토큰 문자열을 남기지 않음)
+- 조회할 때마다 exp를 다시 확인하므로 만료된 페이로드는 반환하지 않음
+- 최대 TOKEN_CACHE_SIZE개, 넘치면 가장 오래 쓰지 않은 항목부터 제거
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from Fast_api.core.config import settings
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class TokenCache:
+    """
+    토큰 digest → (페이로드, exp) LRU 캐시 (스레드 안전)
+
+    Args:
+        max_size: 최대 항목 수 (0이면 캐시하지 않음)
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        """검증된 페이로드 (읽기 전용으로 사용), 없거나 만료됐으면 None"""
+        key = token_digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def put(self, token: str, payload: dict) -> None:
+        if self.max_size <= 0:
+            return
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (payload, payload["exp"])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_SIZE)
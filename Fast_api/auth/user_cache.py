@@ -0,0 +1,124 @@
+"""
+인증 사용자 스냅샷 캐시 (get_current_user용)
+
+JWT로 신원이 확인된 요청마다 users 테이블을 조회하지 않도록 username → 사용자 스냅샷을
+프로세스 안의 LRU(USER_CACHE_SIZE개, USER_CACHE_TTL_SECONDS초)에 보관합니다.
+- 스냅샷에는 자주 바뀌지 않는 값(id, username, paid_user, daily_limit)만 담고, 요청 수 같은 값은 매번 DB에서 읽습니다.
+- ORM으로 User 행을 수정/삭제하면 flush 시점에 session.info에 기록해 두었다가 commit 후에 해당 사용자 항목을 지웁니다.
+  (commit 전에 다른 요청이 이전 값을 다시 캐시하는 경우를 막고, rollback 되면 기록만 버림)
+  (update()/delete() 문으로 바꿀 때는 invalidate_user를 직접 호출, 다른 워커에는 TTL 이후 반영)
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from Fast_api.core.config import settings
+from Fast_api.models.user import User
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """get_current_user가 반환하는 인증 사용자 정보 (세션에 묶이지 않은 읽기 전용 값)"""
+    id: int
+    username: str
+    paid_user: bool
+    daily_limit: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(id=user.id, username=user.username, paid_user=bool(user.paid_user), daily_limit=user.daily_limit)
+
+
+class UserCache:
+    """
+    username → UserSnapshot LRU + TTL 캐시 (스레드 안전)
+
+    Args:
+        max_size: 최대 항목 수 (0이면 캐시하지 않음)
+        ttl: 항목 유효 시간 (초)
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> Optional[UserSnapshot]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[username]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(username)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def put(self, snapshot: UserSnapshot) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[snapshot.username] = (snapshot, time.monotonic() + self.ttl)
+            self._entries.move_to_end(snapshot.username)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, user_id: Optional[int] = None, username: Optional[str] = None) -> None:
+        """username 또는 id가 일치하는 항목 제거 (id로 찾을 때는 전체 순회, 사용자 정보 변경 시에만 호출)"""
+        with self._lock:
+            keys = [
+                key for key, (snapshot, _) in self._entries.items()
+                if key == username or (user_id is not None and snapshot.id == user_id)
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.stats["invalidations"] += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_cache = UserCache(max_size=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user_id: Optional[int] = None, username: Optional[str] = None) -> None:
+    user_cache.invalidate(user_id=user_id, username=username)
+
+
+_PENDING_KEY = "user_cache_invalidations"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _record_changed_user(mapper, connection, target: User) -> None:
+    # flush 시점에는 아직 커밋 전이므로 기록만 해 두고 after_commit에서 제거
+    session = object_session(target)
+    if session is None:
+        invalidate_user(user_id=target.id, username=target.username)
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add((target.id, target.username))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # username이 바뀐 경우에도 이전 키가 남지 않도록 id 기준으로 제거
+    for user_id, username in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user(user_id=user_id, username=username)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_users(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+완료 일정 아카이브(hot/cold 분리) 벤치마크
+사용자 여러 명이 2년치 일정을 가진 DB에서 아카이브 전/후의
+최근 한 달 목록 조회 시간과 hot 테이블 크기(페이지 수) 비교
+
+실행: python -m Fast_api.benchmarks.bench_archive
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.db.base_class import Base
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.models.schedule import Schedule
+from Fast_api.models.user import User
+from Fast_api.services import schedule_service
+from Fast_api.services.archive_service import archive_completed_schedules
+
+USERS = 200
+SCHEDULES_PER_USER = 1000
+QUERIES = 2000
+NOW = datetime(2025, 10, 20, 9)
+
+
+def populate(engine):
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": uid, "username": f"u{uid}", "email": f"u{uid}@example.com"} for uid in range(1, USERS + 1)])
+        rows = []
+        for uid in range(1, USERS + 1):
+            for _ in range(SCHEDULES_PER_USER):
+                scheduled_at = NOW - timedelta(days=rng.uniform(-30, 730))
+                rows.append({
+                    "title": "일정",
+                    "description": "설명 " * 10,
+                    "scheduled_at": scheduled_at,
+                    # 지난 일정은 대부분 완료
+                    "is_completed": scheduled_at < NOW and rng.random() < 0.9,
+                    "user_id": uid,
+                    "created_at": scheduled_at,
+                    "updated_at": scheduled_at,
+                })
+        rng.shuffle(rows)  # 사용자들이 번갈아 입력한 것처럼 섞어서 삽입
+        conn.execute(insert(Schedule), rows)
+
+
+def measure(session_factory):
+    rng = random.Random(1)
+    db = session_factory()
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        schedule_service.get_user_schedules(
+            db, rng.randint(1, USERS), limit=100, start=NOW - timedelta(days=30), end=NOW + timedelta(days=30)
+        )
+    elapsed = time.perf_counter() - start
+    pages = db.execute(text("SELECT count(*) FROM dbstat WHERE name = 'schedules'")).scalar()
+    rows = db.execute(text("SELECT count(*) FROM schedules")).scalar()
+    db.close()
+    return elapsed / QUERIES * 1000, pages, rows
+
+
+def main():
+    print("=" * 60)
+    print(f"일정 아카이브 벤치마크 (사용자 {USERS}명 x 일정 {SCHEDULES_PER_USER}개, 최근 두 달 조회 {QUERIES}회)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory(dir=".") as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'archive.db')}")
+        populate(engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        ms, pages, rows = measure(session_factory)
+        print(f"  아카이브 전   조회 {ms:.3f} ms | hot 테이블 {rows}행, {pages} 페이지")
+
+        db = session_factory()
+        start = time.perf_counter()
+        moved = archive_completed_schedules(db, before=NOW - timedelta(days=90))
+        print(f"  아카이브 작업 {moved}행 이동, {time.perf_counter() - start:.1f}초")
+        db.execute(text("VACUUM"))
+        db.close()
+
+        ms, pages, rows = measure(session_factory)
+        print(f"  아카이브 후   조회 {ms:.3f} ms | hot 테이블 {rows}행, {pages} 페이지")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+요청당 인증 비용 벤치마크
+같은 access token으로 반복 요청할 때
+1) 토큰 검증: jwt.decode + UTC datetime 비교 (캐시 이전) vs verify_token (token_cache 적중)
+2) get_current_user 전체: 토큰 검증 + users 조회 (캐시 이전) vs token_cache + user_cache 적중
+
+실행: python -m Fast_api.benchmarks.bench_auth
+"""
+import os
+import tempfile
+import time
+import zoneinfo
+from datetime import datetime
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.auth.jwt_handle import create_access_token, get_current_user, verify_token
+from Fast_api.auth.token_cache import token_cache
+from Fast_api.auth.user_cache import user_cache
+from Fast_api.core.config import settings
+from Fast_api.db.base_class import Base
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.models.user import User
+
+ITERATIONS = 20000
+
+
+def uncached_verify(token):
+    # user-018 이전 verify_token의 검증 경로
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    current_time = datetime.now(tz=zoneinfo.ZoneInfo("UTC"))
+    if datetime.fromtimestamp(payload["exp"], tz=zoneinfo.ZoneInfo("UTC")) < current_time:
+        raise RuntimeError("expired")
+    return payload
+
+
+def per_call_us(fn, iterations=ITERATIONS):
+    fn()  # 캐시 채우기
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    token = create_access_token("bench")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    uncached = per_call_us(lambda: uncached_verify(token))
+    cached = per_call_us(lambda: verify_token(token))
+    print(f"token verify   uncached: {uncached:7.2f} us   cached: {cached:5.2f} us   ({uncached / cached:.0f}x)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'auth.db')}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = session_factory()
+        db.add(User(username="bench", email="bench@example.com", hashed_password="x"))
+        db.commit()
+
+        def uncached_current_user():
+            payload = uncached_verify(token)
+            return db.query(User).filter(User.username == payload["sub"]).first()
+
+        iterations = ITERATIONS // 10
+        before = per_call_us(uncached_current_user, iterations)
+        after = per_call_us(lambda: get_current_user(credentials, db), iterations)
+        print(f"current user   uncached: {before:7.2f} us   cached: {after:5.2f} us   ({before / after:.0f}x)")
+        print(f"token_cache={token_cache.stats} user_cache={user_cache.stats}")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+group-commit 쓰기 큐 벤치마크
+요청마다 세션을 열어 커밋하는 기존 방식과 GroupCommitWriter(단일 writer, 배치 커밋)로
+동시 일정 생성을 보냈을 때의 처리량/지연 비교 (둘 다 engine_profile 적용)
+
+실행: python -m Fast_api.benchmarks.bench_group_commit
+"""
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.db.base_class import Base
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.db.write_queue import GroupCommitWriter
+from Fast_api.schemas.schedule import ScheduleCreate
+from Fast_api.models.user import User
+from Fast_api.services import schedule_service
+
+WRITERS = 16
+DURATION = 5.0
+
+
+def setup_database(engine):
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = session_factory()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return session_factory, user_id
+
+
+def run_writers(write_once):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + DURATION
+
+    def worker():
+        i = 0
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                write_once(i)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                continue
+            elapsed = time.perf_counter() - start
+            i += 1
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker) for _ in range(WRITERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, errors[0]
+
+
+def report(label, latencies, errors, extra=""):
+    p50 = statistics.median(latencies) * 1000
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(f"  {label:<22} {len(latencies) / DURATION:8.1f} ops/s | p50 {p50:6.2f} ms | p99 {p99:6.2f} ms | 오류 {errors}{extra}")
+
+
+def make_schedule(i):
+    return ScheduleCreate(title=f"일정 {i}", scheduled_at=datetime(2025, 10, 20, 9))
+
+
+def run_direct(url):
+    engine = create_sqlite_engine(url)
+    session_factory, user_id = setup_database(engine)
+
+    def write_once(i):
+        db = session_factory()
+        try:
+            schedule_service.create_schedule(db, make_schedule(i), user_id)
+            db.commit()
+        finally:
+            db.close()
+
+    report("요청별 커밋", *run_writers(write_once))
+    engine.dispose()
+
+
+def run_group_commit(url):
+    engine = create_sqlite_engine(url)
+    _, user_id = setup_database(engine)
+    engine.dispose()
+    writer = GroupCommitWriter(url)
+
+    def write_once(i):
+        writer.submit(lambda db: schedule_service.create_schedule(db, make_schedule(i), user_id)).result()
+
+    latencies, errors = run_writers(write_once)
+    writer.close()
+    stats = writer.stats
+    report("group commit", latencies, errors, f" | 배치당 평균 {stats['operations'] / max(stats['batches'], 1):.1f}건")
+
+
+def main():
+    print("=" * 60)
+    print(f"group-commit 쓰기 큐 벤치마크 (쓰기 {WRITERS} 스레드, {DURATION:.0f}초)")
+    print("=" * 60)
+    # DB 파일은 실제 디스크 fsync 비용이 반영되도록 현재 디렉토리 아래에 생성
+    with tempfile.TemporaryDirectory(dir=".") as tmp:
+        run_direct(f"sqlite:///{os.path.join(tmp, 'direct.db')}")
+    with tempfile.TemporaryDirectory(dir=".") as tmp:
+        run_group_commit(f"sqlite:///{os.path.join(tmp, 'group.db')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+일정 목록 JSON 응답 벤치마크 (1,000개)
+기본 경로(response_model=List[ScheduleResponse] 검증 + 직렬화)와
+FastJSONResponse + 미리 만든 행 인코더 경로의 초당 처리량 비교
+
+실행: python -m Fast_api.benchmarks.bench_json_response
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.core import json_response
+from Fast_api.core.json_response import FastJSONResponse, make_row_encoder
+from Fast_api.db.base_class import Base
+from Fast_api.models.schedule import Schedule
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleResponse
+from Fast_api.services import schedule_service
+
+ROWS = 1000
+REQUESTS = 300
+
+
+def build_app(session_factory, user_id):
+    app = FastAPI()
+    encode_schedules = make_row_encoder(ScheduleResponse)
+
+    @app.get("/default", response_model=List[ScheduleResponse])
+    def default_list():
+        db = session_factory()
+        try:
+            return schedule_service.get_user_schedules(db, user_id, limit=ROWS)
+        finally:
+            db.close()
+
+    @app.get("/fast")
+    def fast_list():
+        db = session_factory()
+        try:
+            return FastJSONResponse(encode_schedules(schedule_service.get_user_schedules(db, user_id, limit=ROWS)))
+        finally:
+            db.close()
+
+    return app
+
+
+def measure(client, path):
+    assert len(client.get(path).json()) == ROWS  # 워밍업 + 검증
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(path)
+    elapsed = time.perf_counter() - start
+    return REQUESTS / elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        db = session_factory()
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+        base = datetime(2025, 1, 1, 9)
+        db.execute(insert(Schedule.__table__), [
+            {"title": f"일정 {i}", "description": "벤치마크", "scheduled_at": base + timedelta(hours=i), "user_id": user_id}
+            for i in range(ROWS)
+        ])
+        db.commit()
+        db.close()
+
+        client = TestClient(build_app(session_factory, user_id))
+        assert client.get("/default").json() == client.get("/fast").json()
+
+        print("=" * 60)
+        print(f"목록 응답 벤치마크 ({ROWS}개, {REQUESTS}회, orjson={'사용' if json_response.orjson else '미설치'})")
+        print("=" * 60)
+        default_rps = measure(client, "/default")
+        fast_rps = measure(client, "/fast")
+        print(f"  response_model 기본 경로 : {default_rps:8.1f} req/s")
+        print(f"  FastJSONResponse 경로    : {fast_rps:8.1f} req/s ({fast_rps / default_rps:.2f}x)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
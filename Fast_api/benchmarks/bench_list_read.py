@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+일정 목록 읽기 경로 벤치마크
+ORM 인스턴스 조회(db.query(Schedule))와 컬럼 projection(select(...) → Row) 방식의
+행당 CPU 시간과 최대 메모리 비교 (응답 모델 검증 포함)
+
+실행: python -m Fast_api.benchmarks.bench_list_read
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.db.base_class import Base
+from Fast_api.models.schedule import Schedule
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleResponse
+from Fast_api.services import schedule_service
+
+ROWS = 5000
+REPEAT = 10
+
+
+def orm_read(db, user_id):
+    """projection 도입 전 get_user_schedules (비교용)"""
+    return db.query(Schedule).filter(
+        Schedule.user_id == user_id,
+        Schedule.deleted_at.is_(None)
+    ).order_by(Schedule.scheduled_at, Schedule.id).limit(ROWS).all()
+
+
+def projection_read(db, user_id):
+    return schedule_service.get_user_schedules(db, user_id, limit=ROWS)
+
+
+def measure(label, session_factory, read_fn, user_id):
+    adapter = TypeAdapter(List[ScheduleResponse])
+
+    # CPU 시간: 요청마다 새 세션 + 응답 모델 검증 (FastAPI response_model과 동일)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        db = session_factory()
+        rows = read_fn(db, user_id)
+        adapter.validate_python(rows, from_attributes=True)
+        db.close()
+    elapsed = (time.perf_counter() - start) / REPEAT
+
+    # 메모리: 조회 결과를 들고 있는 동안의 최대 사용량
+    db = session_factory()
+    tracemalloc.start()
+    rows = read_fn(db, user_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(rows) == ROWS
+    db.close()
+
+    print(f"  {label:<22} 요청당 {elapsed * 1000:8.2f} ms, 행당 {elapsed / ROWS * 1e6:6.2f} µs, 최대 메모리 {peak / 1024 / 1024:6.2f} MiB")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        db = session_factory()
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+        base = datetime(2025, 1, 1, 9)
+        db.execute(insert(Schedule.__table__), [
+            {"title": f"일정 {i}", "description": "벤치마크", "scheduled_at": base + timedelta(hours=i), "user_id": user_id}
+            for i in range(ROWS)
+        ])
+        db.commit()
+        db.close()
+
+        print("=" * 60)
+        print(f"목록 읽기 벤치마크 ({ROWS}행 x {REPEAT}회)")
+        print("=" * 60)
+        measure("ORM 인스턴스", session_factory, orm_read, user_id)
+        measure("컬럼 projection (Row)", session_factory, projection_read, user_id)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+LLM 호출 방식 벤치마크 (로컬 HTTP 서버가 DELAY초 후 응답하는 OpenAI API 역할)
+동시에 CALLS건의 파싱 요청이 들어올 때
+1) run_in_executor(None, LLM_Agent.__call__) (이전 파서 동작, 기본 스레드풀 점유)
+2) LLM_Agent.acall (AsyncOpenAI, llm_clients.max_concurrency개로 제한)
+의 전체 소요 시간, 프로세스 스레드 수 최대값, 그동안 기본 스레드풀에 들어온 다른 작업의 대기 시간을 비교
+
+실행: python -m Fast_api.benchmarks.bench_llm_async
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CALLS = 200
+DELAY = 0.2
+MAX_CONCURRENCY = 32
+
+RESPONSE = json.dumps({
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "bench-model",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": "[]"}
+    }]
+}).encode()
+
+
+class SlowStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(DELAY)  # LLM 응답 대기 흉내
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def app_threads():
+    # 로컬 서버의 요청 처리 스레드는 제외
+    return sum("process_request_thread" not in thread.name for thread in threading.enumerate())
+
+
+async def measure(call):
+    loop = asyncio.get_running_loop()
+    peak_threads = app_threads()
+    done = asyncio.Event()
+
+    async def watch_threads():
+        nonlocal peak_threads
+        while not done.is_set():
+            peak_threads = max(peak_threads, app_threads())
+            await asyncio.sleep(0.01)
+
+    async def other_executor_job():
+        # 동기 엔드포인트 / 파일 I/O 등 기본 스레드풀을 쓰는 다른 작업
+        submitted = time.perf_counter()
+        started = await loop.run_in_executor(None, time.perf_counter)
+        return (started - submitted) * 1000
+
+    watcher = asyncio.create_task(watch_threads())
+    start = time.perf_counter()
+    calls = [asyncio.create_task(call()) for _ in range(CALLS)]
+    await asyncio.sleep(0.05)
+    other_wait = await other_executor_job()
+    results = await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - start
+    done.set()
+    await watcher
+    assert all(result == "[]" for result in results), results[:3]
+    return elapsed, peak_threads, other_wait
+
+
+async def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+
+    from module.llm_agent import LLM_Agent, llm_clients
+    llm_clients.max_concurrency = MAX_CONCURRENCY
+    agent = LLM_Agent(model_name="bench-model", provider="openai", api_key="bench-key")
+    loop = asyncio.get_running_loop()
+
+    # 클라이언트 생성 / 첫 연결 제외
+    agent("bench", "warmup")
+    await agent.acall("bench", "warmup")
+
+    async def executor_call():
+        return await loop.run_in_executor(None, agent, "bench", "내일 오전 9시 회의")
+
+    async def async_call():
+        return await agent.acall("bench", "내일 오전 9시 회의")
+
+    print(f"cpu count: {os.cpu_count()}, {CALLS} concurrent calls, stand-in delay {DELAY * 1000:.0f} ms, "
+          f"acall limit {MAX_CONCURRENCY}")
+    for name, call in (("run_in_executor", executor_call), ("acall", async_call)):
+        elapsed, peak_threads, other_wait = await measure(call)
+        print(f"{name:<16} total {elapsed:5.2f}s  peak threads {peak_threads:4d}  other executor job wait {other_wait:8.1f} ms")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
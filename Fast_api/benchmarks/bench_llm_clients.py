@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+LLM 클라이언트 재사용 벤치마크 (로컬 HTTP 서버를 OpenAI API 대신 사용)
+같은 설정으로 CALLS번 호출할 때
+1) 호출마다 OpenAI(...) 생성 (이전 LLM_Agent 동작)
+2) LLM_Agent + llm_clients 저장소 (클라이언트 / keep-alive 연결 재사용)
+의 호출당 지연 시간과 서버가 받은 TCP 연결 수를 비교 (OpenAI(...) 생성 비용도 따로 출력: SSL 컨텍스트 / 인증서 로드)
+로컬 평문 HTTP라 실제 API의 DNS 조회 / TLS 핸드셰이크 비용은 포함되지 않음 (실제 차이는 더 큼)
+
+실행: python -m Fast_api.benchmarks.bench_llm_clients
+"""
+import gc
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CALLS = 200
+
+RESPONSE = json.dumps({
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "bench-model",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": "[]"}
+    }],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # 헤더 / 본문을 나눠 보내도 delayed ACK 대기 없음
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        StandInHandler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(call):
+    call()  # 첫 호출 (import / 클라이언트 생성) 제외
+    StandInHandler.connections = 0
+    timings = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    gc.collect()
+    return statistics.median(timings), statistics.mean(timings), StandInHandler.connections
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+
+    from openai import OpenAI
+    from module.llm_agent import LLM_Agent, llm_clients
+
+    messages = [{"role": "system", "content": "bench"}, {"role": "user", "content": "내일 오전 9시 회의"}]
+
+    def per_call_client():
+        client = OpenAI(api_key="bench-key")
+        return client.chat.completions.create(model="bench-model", messages=messages).choices[0].message.content
+
+    agent = LLM_Agent(model_name="bench-model", provider="openai", api_key="bench-key")
+
+    def registry_client():
+        result = agent("bench", "내일 오전 9시 회의")
+        assert result == "[]", result
+        return result
+
+    start = time.perf_counter()
+    for _ in range(20):
+        OpenAI(api_key="bench-key")
+    print(f"OpenAI(...) construction {(time.perf_counter() - start) / 20 * 1000:6.2f} ms")
+
+    for name, call in (("new client per call", per_call_client), ("llm_clients registry", registry_client)):
+        p50, mean, connections = measure(call)
+        print(f"{name:<22} p50 {p50:6.2f} ms  mean {mean:6.2f} ms  TCP connections {connections:4d} / {CALLS} calls")
+
+    llm_clients.clear()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
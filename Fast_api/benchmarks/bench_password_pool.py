@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+로그인 폭주 시 비밀번호 검증 위치에 따른 영향 벤치마크
+로그인 BURST건의 pbkdf2 검증을 동시에 보내는 동안
+- 이벤트 루프 지연 (10ms 주기 타이머가 늦어진 정도)
+- LLM 호출을 흉내 낸 기본 스레드풀 작업(0.05초 sleep)의 대기 시간
+을 측정해 1) 기본 스레드풀(run_in_executor(None)) 2) password_hasher(전용 프로세스 풀)를 비교
+
+실행: python -m Fast_api.benchmarks.bench_password_pool
+"""
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from Fast_api.core.security import pwd_context
+from Fast_api.services.password_service import PasswordHasher
+
+BURST = 40
+LLM_CALLS = 5
+
+
+async def measure(verify):
+    loop = asyncio.get_running_loop()
+    lags, llm_waits = [], []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append((time.perf_counter() - start - 0.01) * 1000)
+
+    async def llm_call():
+        submitted = time.perf_counter()
+        started = await loop.run_in_executor(None, lambda: (time.perf_counter(), time.sleep(0.05))[0])
+        llm_waits.append((started - submitted) * 1000)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    logins = [asyncio.create_task(verify("password")) for _ in range(BURST)]
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*(llm_call() for _ in range(LLM_CALLS)))
+    await asyncio.gather(*logins)
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    return elapsed, statistics.median(lags), max(lags), statistics.median(llm_waits)
+
+
+def report(name, result):
+    elapsed, lag_p50, lag_max, llm_wait = result
+    print(
+        f"{name:<22} burst {elapsed:5.2f}s  loop lag p50 {lag_p50:6.1f} ms  max {lag_max:7.1f} ms  "
+        f"LLM executor wait p50 {llm_wait:7.1f} ms"
+    )
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+
+    dummy_hash = pwd_context.hash("dummy")
+
+    async def default_pool(password):
+        return await loop.run_in_executor(None, pwd_context.verify, password, dummy_hash)
+
+    hasher = PasswordHasher(workers=2, max_pending=BURST)
+    await hasher.verify_dummy("warmup")  # 워커 프로세스 기동 시간 제외
+
+    report("default thread pool", await measure(default_pool))
+    report("password_hasher pool", await measure(hasher.verify_dummy))
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    print(f"cpu count: {os.cpu_count()}, burst: {BURST} logins, {LLM_CALLS} LLM-like executor calls")
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+rate limit 저장소 벤치마크
+1) 요청 1건당 확인 + 증가 비용: 워커별 인메모리(MemoryStorage) vs 공유 SQLite(SQLiteStorage)
+2) 워커 WORKERS개가 같은 키로 동시에 요청할 때 통과한 요청 수 (한도 LIMIT)
+   - 인메모리: 워커마다 카운터가 따로라 한도 × 워커 수까지 통과
+   - SQLite: 모든 워커가 한도 하나를 공유
+
+실행: python -m Fast_api.benchmarks.bench_rate_limit
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+from Fast_api.core.rate_limit import SQLiteStorage
+
+ITERATIONS = 5000
+WORKERS = 4
+LIMIT = 10
+REQUESTS_PER_WORKER = 25
+
+
+def per_hit_us(storage):
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = parse("1000000/minute")
+    limiter.hit(item, "bench")
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        limiter.hit(item, "bench")
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def worker(uri):
+    storage = SQLiteStorage(uri) if uri else MemoryStorage()
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = parse(f"{LIMIT}/minute")
+    return sum(limiter.hit(item, "127.0.0.1") for _ in range(REQUESTS_PER_WORKER))
+
+
+def allowed_across_workers(uri):
+    with multiprocessing.get_context("spawn").Pool(WORKERS) as pool:
+        return sum(pool.map(worker, [uri] * WORKERS))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{os.path.join(tmp, 'rate_limits.db')}"
+        memory = per_hit_us(MemoryStorage())
+        sqlite = per_hit_us(SQLiteStorage(uri))
+        print(f"per hit        memory: {memory:6.1f} us   sqlite: {sqlite:6.1f} us")
+
+        shared_uri = f"sqlite:///{os.path.join(tmp, 'shared.db')}"
+        print(
+            f"allowed ({WORKERS} workers x {REQUESTS_PER_WORKER} requests, limit {LIMIT}/minute)   "
+            f"memory: {allowed_across_workers(None)}   sqlite: {allowed_across_workers(shared_uri)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
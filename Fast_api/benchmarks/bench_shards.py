@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+사용자별 일정 샤딩 벤치마크
+여러 사용자가 동시에 일정을 생성할 때 샤드 수(1/2/4/8)에 따른 쓰기 처리량 비교
+(요청마다 사용자 샤드 세션 → save_schedule → 커밋, engine_profile 적용)
+GIL이 아닌 파일별 쓰기 락 경합을 보기 위해 쓰기 작업자는 별도 프로세스로 실행
+
+실행: python -m Fast_api.benchmarks.bench_shards
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from Fast_api.core.config import settings
+from Fast_api.db import shards
+from Fast_api.schemas.schedule import ScheduleCreate
+from Fast_api.services import schedule_service
+
+WRITERS = 8
+USERS = 256
+DURATION = 5.0
+SHARD_COUNTS = (1, 2, 4, 8)
+
+
+def worker(n, stop_at, counts):
+    # 프로세스마다 자기 엔진/커넥션 풀 사용 (fork 이후 생성)
+    writes = errors = 0
+    i = 0
+    while time.time() < stop_at:
+        user_id = (n + i * WRITERS) % USERS + 1
+        db = shards.shard_session(user_id)
+        try:
+            schedule_service.save_schedule(
+                db, ScheduleCreate(title=f"일정 {i}", scheduled_at=datetime(2025, 10, 20, 9)), user_id
+            )
+            writes += 1
+        except Exception:
+            errors += 1
+        finally:
+            db.close()
+        i += 1
+    shards.dispose_shards()
+    counts.put((writes, errors))
+
+
+def run(shard_count, shard_dir):
+    settings.SCHEDULE_SHARD_COUNT = shard_count
+    settings.SCHEDULE_SHARD_DIR = shard_dir
+    # 엔진 생성/스키마 초기화와 사용자 버전 행 생성은 측정에서 제외
+    for user_id in range(1, USERS + 1):
+        shards.shard_session(user_id).close()
+    shards.dispose_shards()
+
+    ctx = multiprocessing.get_context("fork")
+    counts = ctx.Queue()
+    stop_at = time.time() + DURATION
+    processes = [ctx.Process(target=worker, args=(n, stop_at, counts)) for n in range(WRITERS)]
+    for p in processes:
+        p.start()
+    results = [counts.get() for _ in processes]
+    for p in processes:
+        p.join()
+    return {"write": sum(r[0] for r in results), "error": sum(r[1] for r in results)}
+
+
+def main():
+    print("=" * 60)
+    print(f"일정 샤딩 벤치마크 (쓰기 {WRITERS} 프로세스, 사용자 {USERS}명, {DURATION:.0f}초)")
+    print("=" * 60)
+    baseline = None
+    for shard_count in SHARD_COUNTS:
+        # DB 파일은 실제 디스크 fsync 비용이 반영되도록 현재 디렉토리 아래에 생성
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            counts = run(shard_count, tmp)
+        rate = counts["write"] / DURATION
+        baseline = baseline or rate
+        print(f"  샤드 {shard_count}개  쓰기 {rate:8.1f} ops/s (x{rate / baseline:.2f}) | 오류 {counts['error']}")
+
+
+if __name__ == "__main__":
+    main()
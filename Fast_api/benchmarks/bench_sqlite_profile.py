@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+SQLite 엔진 프로파일 벤치마크
+기본 엔진(rollback journal, PRAGMA 없음)과 engine_profile 엔진(WAL + PRAGMA + 풀 설정)에서
+읽기/쓰기를 동시에 보냈을 때의 처리량 비교
+1) 일정 API (TestClient, 요청 처리 CPU 포함)
+2) schedule_service 직접 호출 (DB 비용만)
+
+실행: python -m Fast_api.benchmarks.bench_sqlite_profile
+"""
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.main import app
+from Fast_api.auth.jwt_handle import create_access_token
+from Fast_api.db.base_class import Base
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.db.session import get_db
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleCreate
+from Fast_api.services import schedule_service
+
+READERS = 8
+WRITERS = 4
+DURATION = 5.0
+
+
+def setup_database(engine):
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = session_factory()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return session_factory, user_id
+
+
+def run_threads(read_once, write_once):
+    counts = {"read": 0, "write": 0, "error": 0}
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + DURATION
+
+    def worker(kind, op):
+        i = 0
+        while time.perf_counter() < stop_at:
+            try:
+                ok = op(i)
+            except Exception:
+                ok = False
+            i += 1
+            with lock:
+                counts[kind if ok else "error"] += 1
+
+    threads = [threading.Thread(target=worker, args=("read", read_once)) for _ in range(READERS)]
+    threads += [threading.Thread(target=worker, args=("write", write_once)) for _ in range(WRITERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts
+
+
+def report(label, counts):
+    print(f"  {label:<28} 읽기 {counts['read'] / DURATION:7.1f} ops/s | 쓰기 {counts['write'] / DURATION:7.1f} ops/s | 오류 {counts['error']}")
+
+
+def run_service_workload(label, engine):
+    session_factory, user_id = setup_database(engine)
+
+    def read_once(i):
+        db = session_factory()
+        try:
+            schedule_service.get_user_schedules(db, user_id, limit=50)
+            return True
+        finally:
+            db.close()
+
+    def write_once(i):
+        db = session_factory()
+        try:
+            schedule_service.create_schedule(db, ScheduleCreate(title=f"일정 {i}", scheduled_at=datetime(2025, 10, 20, 9)), user_id)
+            db.commit()
+            return True
+        finally:
+            db.close()
+
+    report(label, run_threads(read_once, write_once))
+    engine.dispose()
+
+
+def run_endpoint_workload(label, engine):
+    session_factory, _ = setup_database(engine)
+    headers = {"Authorization": f"Bearer {create_access_token('bench')}"}
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    local = threading.local()
+
+    def client():
+        # 스레드마다 TestClient 하나 (각자 이벤트 루프/스레드풀)
+        if not hasattr(local, "client"):
+            local.client = TestClient(app, raise_server_exceptions=False)
+            clients.append(local.client)
+        return local.client
+
+    def read_once(i):
+        return client().get("/api/schedules", params={"limit": 50}, headers=headers).status_code == 200
+
+    def write_once(i):
+        response = client().post(
+            "/api/schedules",
+            json={"title": f"일정 {i}", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=headers
+        )
+        return response.status_code == 200
+
+    clients = []
+    counts = run_threads(read_once, write_once)
+    for c in clients:
+        c.close()
+    app.dependency_overrides.clear()
+    report(label, counts)
+    engine.dispose()
+
+
+def main():
+    print("=" * 60)
+    print(f"SQLite 엔진 프로파일 벤치마크 (읽기 {READERS} / 쓰기 {WRITERS} 스레드, {DURATION:.0f}초)")
+    print("=" * 60)
+    for title, run in (("[일정 API]", run_endpoint_workload), ("[schedule_service 직접 호출]", run_service_workload)):
+        print(title)
+        # DB 파일은 실제 디스크 fsync 비용이 반영되도록 현재 디렉토리 아래에 생성
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'baseline.db')}"
+            run("기본 (rollback journal)", create_engine(url, connect_args={"check_same_thread": False}))
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'profile.db')}"
+            run("engine_profile (WAL+PRAGMA)", create_sqlite_engine(url))
+
+
+if __name__ == "__main__":
+    main()
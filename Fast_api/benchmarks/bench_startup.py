@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+서버 시작 시 스키마 처리 비용 벤치마크
+이미 최신 스키마인 DB에 대해, 워커마다 새 엔진으로
+1) 기존 방식: Base.metadata.create_all + upgrade_schema (테이블/컬럼/인덱스 리플렉션)
+2) migrations.ensure_schema (schema_version 행 하나 조회)
+를 실행했을 때의 시간 비교
+
+실행: python -m Fast_api.benchmarks.bench_startup
+"""
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from sqlalchemy import inspect, text
+
+from Fast_api.db import migrations
+from Fast_api.db.base_class import Base
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.models.schedule import Schedule
+
+RUNS = 50
+
+
+def legacy_startup(engine):
+    # user-016 이전 main.py의 import 시점 작업
+    Base.metadata.create_all(bind=engine)
+    inspector = inspect(engine)
+    user_columns = {c["name"] for c in inspector.get_columns("users")}
+    schedule_columns = {c["name"] for c in inspector.get_columns("schedules")}
+    with engine.begin() as conn:
+        if "schedule_version" not in user_columns:
+            conn.execute(text("ALTER TABLE users ADD COLUMN schedule_version INTEGER NOT NULL DEFAULT 0"))
+        if "version" not in schedule_columns:
+            conn.execute(text("ALTER TABLE schedules ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+        if "deleted_at" not in schedule_columns:
+            conn.execute(text("ALTER TABLE schedules ADD COLUMN deleted_at DATETIME"))
+        for index in Schedule.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+def measure(url, startup):
+    timings = []
+    for _ in range(RUNS):
+        engine = create_sqlite_engine(url)  # 워커마다 새 엔진 / 새 커넥션
+        start = time.perf_counter()
+        startup(engine)
+        timings.append((time.perf_counter() - start) * 1000)
+        engine.dispose()
+    return statistics.median(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        engine = create_sqlite_engine(url)
+        migrations.migrate(engine)
+        engine.dispose()
+
+        legacy = measure(url, legacy_startup)
+        check = measure(url, migrations.ensure_schema)
+        print(f"create_all + upgrade_schema: {legacy:.2f} ms (median of {RUNS})")
+        print(f"ensure_schema:               {check:.2f} ms (median of {RUNS})")
+        print(f"speedup: {legacy / check:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+일정 시각 저장 형식 벤치마크
+같은 데이터를 KST naive 텍스트(DateTime)와 UTC epoch 초(EpochDateTime)로 저장했을 때
+1) (user_id, scheduled_at) 범위 count 쿼리 (SQLite 실행 비용)  2) 범위 행 로드 (SQLAlchemy 타입 변환 포함)
+3) 테이블/인덱스 크기 비교
+
+실행: python -m Fast_api.benchmarks.bench_timestamps
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key_1234567890")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, insert, select, text
+
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.db.types import EpochDateTime
+
+USERS = 200
+SCHEDULES_PER_USER = 1000
+QUERIES = 3000
+REPEAT = 5
+NOW = datetime(2025, 10, 20, 9)
+
+
+def make_table(timestamp_type):
+    metadata = MetaData()
+    table = Table(
+        "schedules", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("title", String, nullable=False),
+        Column("scheduled_at", timestamp_type, nullable=False),
+        Column("user_id", Integer),
+        Column("created_at", timestamp_type),
+        Column("updated_at", timestamp_type),
+        Index("ix_schedules_user_id_scheduled_at", "user_id", "scheduled_at"),
+    )
+    return metadata, table
+
+
+def make_rows():
+    rng = random.Random(0)
+    rows = []
+    for uid in range(1, USERS + 1):
+        for _ in range(SCHEDULES_PER_USER):
+            scheduled_at = (NOW - timedelta(days=rng.uniform(-30, 730))).replace(microsecond=0)
+            rows.append({"title": "일정", "scheduled_at": scheduled_at, "user_id": uid,
+                         "created_at": scheduled_at, "updated_at": scheduled_at})
+    rng.shuffle(rows)
+    return rows
+
+
+def run(label, timestamp_type, rows, tmp):
+    engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, label + '.db')}")
+    metadata, table = make_table(timestamp_type)
+    metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), rows)
+
+    # 범위 count는 SQLite 비용만 보도록 DBAPI 커서로 직접 실행, 모든 측정은 REPEAT회 중 최솟값
+    bind = timestamp_type.process_bind_param if isinstance(timestamp_type, EpochDateTime) else (lambda v, d: str(v))
+    rng = random.Random(1)
+    ranges = []
+    for _ in range(QUERIES):
+        month_start = NOW - timedelta(days=rng.randint(0, 700))
+        ranges.append((rng.randint(1, USERS), bind(month_start, None), bind(month_start + timedelta(days=30), None)))
+    count_sql = "SELECT count(*) FROM schedules WHERE user_id = ? AND scheduled_at >= ? AND scheduled_at < ?"
+    load_stmt = select(table).order_by(table.c.scheduled_at)
+
+    with engine.connect() as conn:
+        cursor = conn.connection.dbapi_connection.cursor()
+        count_times = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            for params in ranges:
+                cursor.execute(count_sql, params).fetchone()
+            count_times.append(time.perf_counter() - start)
+        count_us = min(count_times) / QUERIES * 1e6
+
+        load_times = []
+        for _ in range(REPEAT):
+            loaded = 0
+            start = time.perf_counter()
+            for uid in range(1, USERS + 1):
+                loaded += len(conn.execute(
+                    load_stmt.where(table.c.user_id == uid, table.c.scheduled_at >= NOW - timedelta(days=365))
+                ).all())
+            load_times.append((time.perf_counter() - start) / loaded)
+        load_us = min(load_times) * 1e6
+
+        sizes = dict(conn.execute(text(
+            "SELECT name, sum(pgsize) FROM dbstat WHERE name IN ('schedules', 'ix_schedules_user_id_scheduled_at') GROUP BY name"
+        )).all())
+    engine.dispose()
+    print(f"  {label:<20} 범위 count {count_us:6.1f} µs | 행 로드 {load_us:5.2f} µs/행 | "
+          f"테이블 {sizes['schedules'] / 2**20:5.2f} MiB | 인덱스 {sizes['ix_schedules_user_id_scheduled_at'] / 2**20:5.2f} MiB")
+
+
+def main():
+    print("=" * 60)
+    print(f"일정 시각 저장 형식 벤치마크 (사용자 {USERS}명 x 일정 {SCHEDULES_PER_USER}개)")
+    print("=" * 60)
+    rows = make_rows()
+    with tempfile.TemporaryDirectory(dir=".") as tmp:
+        run("DateTime (텍스트)", DateTime(), rows, tmp)
+        run("EpochDateTime (정수)", EpochDateTime(), rows, tmp)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+일정 수정/삭제 쓰기 경로 마이크로 벤치마크
+기존 방식(SELECT → 변경 → COMMIT → refresh SELECT)과
+UPDATE ... RETURNING 방식의 요청당 SQL 문장 수와 소요 시간 비교
+
+실행: python -m Fast_api.benchmarks.bench_write_path
+"""
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from Fast_api.db.base_class import Base
+from Fast_api.models.schedule import Schedule, KST
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleUpdate
+from Fast_api.services import schedule_service
+
+ITERATIONS = 500
+
+
+def legacy_update_schedule(db, schedule_id, user_id, schedule_update):
+    """RETURNING 도입 전 update_schedule (비교용)"""
+    db_schedule = schedule_service.get_schedule(db, schedule_id, user_id)
+    if not db_schedule:
+        return None
+    for field, value in schedule_update.model_dump(exclude_unset=True).items():
+        setattr(db_schedule, field, value)
+    db_schedule.version = schedule_service.bump_schedule_version(db, user_id)
+    db.commit()
+    db.refresh(db_schedule)
+    return db_schedule
+
+
+def legacy_delete_schedule(db, schedule_id, user_id):
+    """RETURNING 도입 전 delete_schedule (비교용)"""
+    db_schedule = schedule_service.get_schedule(db, schedule_id, user_id)
+    if not db_schedule:
+        return False
+    db_schedule.deleted_at = datetime.now(KST)
+    db_schedule.version = schedule_service.bump_schedule_version(db, user_id)
+    db.commit()
+    return True
+
+
+def run(label, session_factory, counter, update_fn, delete_fn, user_id):
+    db = session_factory()
+    ids = []
+    for i in range(ITERATIONS):
+        schedule = Schedule(title=f"bench {i}", scheduled_at=datetime(2025, 10, 20, 9), user_id=user_id)
+        db.add(schedule)
+        ids.append(schedule)
+    db.commit()
+    ids = [s.id for s in ids]
+    db.close()
+
+    results = {}
+    for name, fn, make_args in (
+        ("PUT", update_fn, lambda sid: (sid, user_id, ScheduleUpdate(is_completed=True))),
+        ("DELETE", delete_fn, lambda sid: (sid, user_id)),
+    ):
+        counter["count"] = 0
+        start = time.perf_counter()
+        for schedule_id in ids:
+            # 요청마다 새 세션 (get_db와 동일)
+            db = session_factory()
+            result = fn(db, *make_args(schedule_id))
+            if name == "PUT":
+                # 응답 직렬화 시점의 속성 접근까지 포함
+                assert result.is_completed is True and result.updated_at is not None
+            else:
+                assert result is True
+            db.close()
+        elapsed = time.perf_counter() - start
+        results[name] = (counter["count"] / len(ids), elapsed / len(ids) * 1000)
+
+    print(f"[{label}]")
+    for name, (statements, ms) in results.items():
+        print(f"  {name:<6} 요청당 SQL {statements:.1f}개 (BEGIN/COMMIT 제외), 평균 {ms:.3f} ms")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        counter = {"count": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            counter["count"] += 1
+
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = session_factory()
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+        db.close()
+
+        print("=" * 60)
+        print(f"쓰기 경로 벤치마크 (요청 {ITERATIONS}회, 파일 SQLite)")
+        print("=" * 60)
+        run("기존: SELECT + UPDATE + refresh", session_factory, counter,
+            legacy_update_schedule, legacy_delete_schedule, user_id)
+        run("신규: UPDATE ... RETURNING", session_factory, counter,
+            schedule_service.update_schedule, schedule_service.delete_schedule, user_id)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,54 @@ class Settings(BaseSettings):
     provider: str = ""
     api_key: str = ""
 
+    # SQLite 엔진 프로파일 (db/engine_profile.py에서 커넥션마다 PRAGMA로 적용)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # WAL: 쓰기 중에도 읽기가 막히지 않음
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서는 NORMAL로도 커밋 내구성 유지 (체크포인트 시 fsync)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 쓰기 락 대기 시간
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MiB
+    SQLITE_CACHE_SIZE_KIB: int = 16384  # 커넥션당 페이지 캐시 (16MiB)
+    SQLITE_STATEMENT_CACHE_SIZE: int = 256  # pysqlite prepared statement 캐시
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+
+    # 일정 쓰기 group-commit 큐 (db/write_queue.py, 기본 비활성)
+    SCHEDULE_WRITE_QUEUE_ENABLED: bool = False
+    WRITE_QUEUE_MAX_BATCH: int = 64  # 한 트랜잭션에 묶을 최대 작업 수
+    WRITE_QUEUE_MAX_DELAY_MS: float = 2.0  # 첫 작업 이후 다음 작업을 기다리는 최대 시간
+    WRITE_QUEUE_RESULT_TIMEOUT_SECONDS: float = 30.0  # 요청 스레드가 배치 커밋 결과를 기다리는 최대 시간
+
+    # 사용자별 일정 샤딩 (db/shards.py, 0이면 기본 DB 하나만 사용)
+    SCHEDULE_SHARD_COUNT: int = 0
+    SCHEDULE_SHARD_DIR: str = ""  # 비어 있으면 기본 DB와 같은 디렉토리
+
+    # 일정 시각 컬럼 저장 형식 (db/types.py): "datetime"(KST naive 텍스트) 또는 "epoch"(UTC epoch 초 INTEGER)
+    SCHEDULE_TIMESTAMP_STORAGE: str = "datetime"
+
+    # 완료 일정 아카이브 (services/archive_service.py)
+    SCHEDULE_ARCHIVE_AFTER_DAYS: int = 90  # 이 일수보다 오래된 완료 일정을 schedules_archive로 이동
+    SCHEDULE_ARCHIVE_INTERVAL_MINUTES: int = 0  # 서버 내 주기 실행 간격 (0이면 비활성, cron으로 CLI 실행)
+
+    # 인증 사용자 스냅샷 캐시 (auth/user_cache.py, 0이면 매 요청 DB 조회)
+    USER_CACHE_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 60.0  # 다른 워커에서 바뀐 사용자 정보가 반영되기까지의 최대 시간
+
+    # 검증된 access token 페이로드 캐시 (auth/token_cache.py, 0이면 매 요청 서명 검증)
+    TOKEN_CACHE_SIZE: int = 4096
+
+    # 비밀번호 해싱 프로세스 풀 (services/password_service.py)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16  # 대기 + 실행 중 작업이 이 수 이상이면 503
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    # pbkdf2 반복 횟수 (python -m Fast_api.services.password_service --target-ms 50 으로 하드웨어에 맞게 보정)
+    PASSWORD_HASH_ROUNDS: int = 29000
+
+    # 공유 rate limit 카운터 저장소 (core/rate_limit.py, 비어 있으면 기본 DB 옆 rate_limits.db)
+    RATE_LIMIT_STORAGE_URI: str = ""
+
+    # 워커 프로세스당 동시에 진행하는 LLM 호출 수 (module/llm_agent.py, 나머지는 코루틴으로 대기)
+    LLM_MAX_CONCURRENCY: int = 32
+
     # Pydantic V2의 설정 방식:
     # model_config에 SettingsConfigDict를 사용하여 설정을 전달합니다.
     model_config = SettingsConfigDict(
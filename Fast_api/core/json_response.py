@@ -0,0 +1,66 @@
+"""
+orjson 기반 JSON 응답 클래스와 행(Row/ORM) 인코더
+orjson이 설치되어 있지 않으면 표준 json 모듈로 동일한 형식을 출력합니다.
+"""
+import json
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """datetime은 ISO 8601 문자열로 직렬화 (pydantic 출력과 동일)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """jsonable_encoder 변환 없이 바로 bytes로 직렬화하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def make_row_encoder(model: Type[BaseModel]) -> Callable[[Iterable[Any]], List[dict]]:
+    """
+    응답 모델의 필드 목록으로 attrgetter를 미리 만들어 두고, 행을 dict 리스트로 변환하는 함수를 반환합니다.
+    DB에서 읽은 신뢰할 수 있는 데이터 전용 (응답 모델 재검증을 생략).
+
+    Args:
+        model: 출력 필드를 정의한 pydantic 모델 (예: ScheduleResponse)
+
+    Returns:
+        Callable: 행 목록 → dict 목록 변환 함수
+    """
+    fields = tuple(model.model_fields)
+    getter = attrgetter(*fields)
+
+    if len(fields) == 1:
+        field = fields[0]
+        return lambda rows: [{field: getter(row)} for row in rows]
+
+    def encode(rows: Iterable[Any]) -> List[dict]:
+        return [dict(zip(fields, getter(row))) for row in rows]
+
+    return encode
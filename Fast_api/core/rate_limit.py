@@ -0,0 +1,202 @@
+"""
+앱 전체에서 공유하는 rate limiter (slowapi)
+
+카운터는 RATE_LIMIT_STORAGE_URI의 SQLite(WAL) 파일에 저장해 같은 호스트의 모든 uvicorn 워커가
+같은 한도를 공유합니다. (별도 네트워크 서비스 없음)
+- 전략: sliding-window-counter (이전/현재 고정 창 카운터를 가중 합산, 창 경계에서 한도의 2배가 통과하지 않음)
+- 확인 + 증가는 BEGIN IMMEDIATE 트랜잭션 하나에서 수행하므로 워커 간에도 원자적
+- 카운터는 잃어도 되는 값이라 synchronous=OFF (커밋마다 fsync 없음)
+
+키: login / refresh는 IP (get_remote_address), 인증이 필요한 라우터는 user_key로 사용자별 제한.
+user_key는 bearer 토큰의 sub / paid_user 클레임만 읽고 (verify_token 캐시) DB는 조회하지 않습니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from typing import Callable, Optional, Tuple
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+from fastapi import HTTPException, Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+from Fast_api.auth.jwt_handle import verify_token
+from Fast_api.core.config import settings
+
+PURGE_EVERY = 1000  # 이 횟수만큼 증가할 때마다 만료된 카운터 삭제
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    limits 저장소 구현: sqlite:///<파일 경로>
+
+    rate_limits(key, count, expires_at) 한 테이블에 고정 창 / sliding window 카운터를 저장합니다.
+    커넥션은 프로세스마다 하나(fork 후 새로 연결)이고 스레드 간에는 락으로 공유합니다.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+        self.path = uri.split("://", 1)[1].removeprefix("/") or ":memory:"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            # isolation_level=None: 트랜잭션은 직접 BEGIN IMMEDIATE로 시작
+            conn = sqlite3.connect(self.path, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _get(self, conn: sqlite3.Connection, key: str, now: float) -> Tuple[int, float]:
+        row = conn.execute("SELECT count, expires_at FROM rate_limits WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] <= now:
+            return 0, now
+        return row
+
+    def _incr(self, conn: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        return conn.execute(
+            "INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "count = CASE WHEN expires_at <= ? THEN excluded.count ELSE count + excluded.count END, "
+            "expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END "
+            "RETURNING count",
+            (key, amount, now + expiry, now, now)
+        ).fetchone()[0]
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return self._incr(conn, key, expiry, amount, time.time())
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            return self._get(self._connection(), key, time.time())[0]
+
+    def get_expiry(self, key: str) -> float:
+        with self._lock:
+            return self._get(self._connection(), key, time.time())[1]
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection().execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def _sliding_window(self, conn: sqlite3.Connection, key: str, expiry: int, now: float) -> Tuple[int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        counts = dict(conn.execute(
+            "SELECT key, count FROM rate_limits WHERE key IN (?, ?) AND expires_at > ?", (previous_key, current_key, now)
+        ).fetchall())
+        previous_count, current_count = counts.get(previous_key, 0), counts.get(current_key, 0)
+        # limits.MemoryStorage와 같은 계산 (이전 창이 현재 시점에 겹치는 비율)
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")  # 다른 워커의 확인 + 증가와 직렬화
+            try:
+                previous_count, previous_ttl, current_count, _ = self._sliding_window(conn, key, expiry, now)
+                if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                    conn.execute("COMMIT")
+                    return False
+                current_key = self.sliding_window_keys(key, expiry, now)[1]
+                self._incr(conn, current_key, 2 * expiry, amount, now)
+                conn.execute("COMMIT")
+                return True
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        with self._lock:
+            return self._sliding_window(self._connection(), key, expiry, time.time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
+
+
+def user_key(request: Request) -> str:
+    """
+    rate limit 키: 유효한 bearer 토큰이 있으면 "user:<sub>" (유료 사용자는 "paid:<sub>"), 없으면 클라이언트 IP
+
+    NAT/프록시 뒤의 여러 사용자가 한도를 나눠 쓰지 않고, 한 사용자가 IP를 바꿔도 같은 한도를 씁니다.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = verify_token(token)
+        except HTTPException:
+            payload = None
+        if payload is not None:
+            tier = "paid" if payload.get("paid_user") else "user"
+            return f"{tier}:{payload['sub']}"
+    return get_remote_address(request)
+
+
+def tiered_limit(free: str, paid: str) -> Callable[[str], str]:
+    """
+    user_key의 등급에 따라 한도를 고르는 limit provider (유료 사용자: paid, 그 외 IP 포함: free)
+
+    사용: @limiter.limit(tiered_limit("20/minute", "60/minute"), key_func=user_key)
+    """
+    def provider(key: str) -> str:
+        return paid if key.startswith("paid:") else free
+    return provider
+
+
+def default_storage_uri() -> str:
+    # 기본값: 앱 DB와 같은 디렉토리의 rate_limits.db (앱 DB와 쓰기 락을 공유하지 않도록 별도 파일)
+    if settings.RATE_LIMIT_STORAGE_URI:
+        return settings.RATE_LIMIT_STORAGE_URI
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return f"sqlite:///{os.path.join(base_dir, 'rate_limits.db')}"
+
+
+# login / refresh / parse-and-create 등 모든 라우터가 이 인스턴스 하나로 제한 (app.state.limiter와 동일)
+limiter = Limiter(
+    key_func=get_remote_address,
+    strategy="sliding-window-counter",
+    storage_uri=default_storage_uri()
+)
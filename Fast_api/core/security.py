@@ -0,0 +1,25 @@
+# in: app/core/security.py
+from passlib.context import CryptContext
+from Fast_api.core.config import settings
+
+# passlib pbkdf2_sha256 기본 반복 횟수 (설정 전 생성된 기존 해시와 동일), 보정값의 하한
+DEFAULT_PBKDF2_ROUNDS = 29000
+
+
+def build_pwd_context(rounds: int) -> CryptContext:
+    """
+    rounds회 반복하는 pbkdf2_sha256 컨텍스트
+    min/max를 같은 값으로 두어 반복 횟수가 다른 기존 해시는 needs_update로 잡히고 로그인 시 재해싱됩니다.
+    """
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=rounds,
+        pbkdf2_sha256__min_rounds=rounds,
+        pbkdf2_sha256__max_rounds=rounds,
+    )
+
+
+# 프로세스 전체에서 공유하는 비밀번호 해시 컨텍스트 (반복 횟수는 password_service의 보정 CLI로 결정)
+# bcrypt 대신 pbkdf2_sha256 사용 (Python 내장 라이브러리 기반으로 안정적)
+pwd_context = build_pwd_context(settings.PASSWORD_HASH_ROUNDS)
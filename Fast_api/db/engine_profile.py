@@ -0,0 +1,77 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from Fast_api.core.config import settings
+
+
+def sqlite_pragmas() -> dict:
+    """새 커넥션마다 적용할 PRAGMA 목록 (설정값 기반)"""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KIB,  # 음수 = KiB 단위
+        "temp_store": "MEMORY",
+    }
+
+
+def apply_sqlite_profile(engine: Engine) -> Engine:
+    """
+    엔진의 connect 이벤트에 PRAGMA 설정을 등록합니다. (동기 엔진 / AsyncEngine.sync_engine 공용)
+
+    Args:
+        engine: SQLite 엔진
+
+    Returns:
+        Engine: 같은 엔진 (체이닝용)
+    """
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def pool_options() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+def create_sqlite_engine(url: str, **kwargs) -> Engine:
+    """프로파일(PRAGMA + 풀 설정)이 적용된 동기 SQLite 엔진"""
+    options = {
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            "cached_statements": settings.SQLITE_STATEMENT_CACHE_SIZE,
+        },
+        **pool_options(),
+        **kwargs,
+    }
+    return apply_sqlite_profile(create_engine(url, **options))
+
+
+def create_async_sqlite_engine(url: str, **kwargs) -> AsyncEngine:
+    """프로파일(PRAGMA + 풀 설정)이 적용된 aiosqlite 엔진"""
+    options = {
+        "connect_args": {
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            "cached_statements": settings.SQLITE_STATEMENT_CACHE_SIZE,
+        },
+        **pool_options(),
+        **kwargs,
+    }
+    async_engine = create_async_engine(url, **options)
+    apply_sqlite_profile(async_engine.sync_engine)
+    return async_engine
@@ -1,12 +1,11 @@
 from Fast_api.db.session import engine
-from Fast_api.db.base_class import Base
-from Fast_api.models import user  # 이 임포트가 핵심!
-from Fast_api.models import schedule
+from Fast_api.db.migrations import LATEST_VERSION, migrate
 
 def init_db():
-    print("Creating all tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Tables created.")
+    """스키마를 최신 버전까지 마이그레이션 (python -m Fast_api.db.migrations 와 동일)"""
+    print("Applying schema migrations...")
+    applied = migrate(engine)
+    print(f"Schema version {LATEST_VERSION} (applied: {applied or 'none'}).")
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
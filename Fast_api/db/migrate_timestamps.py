@@ -0,0 +1,86 @@
+# in: app/db/migrate_timestamps.py
+"""
+일정 시각 컬럼 저장 형식 변환 도구 (db/types.py 참고)
+기본 DB와 모든 샤드 파일의 schedules / schedules_archive 행을 변환합니다.
+서버를 멈춘 상태에서 실행한 뒤 SCHEDULE_TIMESTAMP_STORAGE를 같은 값으로 바꾸고 재시작합니다.
+이미 변환된 값(typeof로 판별)은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+실행:
+  python -m Fast_api.db.migrate_timestamps --to epoch
+  python -m Fast_api.db.migrate_timestamps --to datetime   # 되돌리기
+"""
+import argparse
+from typing import Dict, List, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.db.session import SQLALCHEMY_DATABASE_URL
+from Fast_api.db.types import KST_OFFSET_SECONDS
+
+TIMESTAMP_COLUMNS = {
+    "schedules": ("scheduled_at", "created_at", "updated_at"),
+    "schedules_archive": ("scheduled_at", "created_at", "updated_at"),
+}
+
+
+def _conversion_sql(table: str, column: str, to: str) -> str:
+    if to == "epoch":
+        # KST naive 텍스트 → UTC epoch 초 (소수 초는 버림)
+        return (
+            f"UPDATE {table} SET {column} = CAST(strftime('%s', {column}) AS INTEGER) - {KST_OFFSET_SECONDS} "
+            f"WHERE typeof({column}) = 'text'"
+        )
+    # UTC epoch 초 → SQLAlchemy SQLite DateTime 저장 형식의 KST naive 텍스트
+    return (
+        f"UPDATE {table} SET {column} = strftime('%Y-%m-%d %H:%M:%S', {column} + {KST_OFFSET_SECONDS}, 'unixepoch') || '.000000' "
+        f"WHERE typeof({column}) = 'integer'"
+    )
+
+
+def convert_timestamps(engine: Engine, to: str) -> Dict[str, int]:
+    """
+    한 DB 파일의 일정 시각 컬럼을 to 형식으로 변환합니다. (테이블별 한 트랜잭션)
+
+    Args:
+        engine: SQLite 엔진
+        to: "epoch" 또는 "datetime"
+
+    Returns:
+        Dict[str, int]: 테이블별 변환된 값 개수
+    """
+    if to not in ("epoch", "datetime"):
+        raise ValueError(f"Unsupported timestamp storage: {to}")
+    existing = set(inspect(engine).get_table_names())
+    converted = {}
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table not in existing:
+            continue
+        with engine.begin() as conn:
+            converted[table] = sum(conn.execute(text(_conversion_sql(table, column, to))).rowcount for column in columns)
+    return converted
+
+
+def database_urls(shard_dir: Optional[str] = None) -> List[str]:
+    from Fast_api.db.rebalance_shards import existing_shards
+    from Fast_api.db.shards import shard_path
+    return [SQLALCHEMY_DATABASE_URL] + [f"sqlite:///{shard_path(i, shard_dir)}" for i in existing_shards(shard_dir)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="일정 시각 컬럼 저장 형식 변환")
+    parser.add_argument("--to", required=True, choices=["epoch", "datetime"])
+    parser.add_argument("--dir", default=None, dest="shard_dir", help="샤드 파일 디렉토리")
+    args = parser.parse_args(argv)
+
+    for url in database_urls(args.shard_dir):
+        engine = create_sqlite_engine(url)
+        try:
+            print(f"{url}: {convert_timestamps(engine, args.to)}")
+        finally:
+            engine.dispose()
+    print(f"이제 SCHEDULE_TIMESTAMP_STORAGE={args.to} 로 설정하고 서버를 재시작하세요. (공간 회수: VACUUM)")
+
+
+if __name__ == "__main__":
+    main()
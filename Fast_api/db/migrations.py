@@ -0,0 +1,176 @@
+# in: app/db/migrations.py
+"""
+버전 기반 스키마 마이그레이션
+
+DB의 schema_version 테이블(행 1개)에 적용된 마지막 단계 번호를 기록하고, MIGRATIONS의 단계를 순서대로 적용합니다.
+- 단계마다 BEGIN IMMEDIATE 트랜잭션 하나에서 실행 (SQLite DDL도 트랜잭션 안에서 롤백됨)
+- 락을 잡은 뒤 버전을 다시 읽으므로 여러 프로세스가 동시에 실행해도 같은 단계가 두 번 적용되지 않음
+- 서버 시작 시에는 ensure_schema로 버전 행 하나만 확인 (create_all/스키마 리플렉션 없음)
+
+새 단계 추가: 모델을 바꾼 뒤 MIGRATIONS 끝에 (다음 번호, 설명, 함수)를 추가합니다.
+1단계는 현재 모델 정의로 테이블을 만들기 때문에 이후 단계는 이미 반영된 상태에서도 안전해야 합니다.
+(_add_column처럼 존재 여부를 확인하거나 IF NOT EXISTS / IF EXISTS 사용)
+
+실행:
+  python -m Fast_api.db.migrations            # 최신 버전까지 적용
+  python -m Fast_api.db.migrations --status   # 현재/최신 버전만 출력
+"""
+import argparse
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from Fast_api.db.base_class import Base
+from Fast_api.db.session import SQLALCHEMY_DATABASE_URL, engine
+from Fast_api.models.schedule import Schedule, ScheduleArchive
+from Fast_api.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 모델 metadata(create_all 대상)와 분리된 버전 기록 테이블
+version_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    version_metadata,
+    Column("id", Integer, primary_key=True),  # 항상 1
+    Column("version", Integer, nullable=False),
+)
+
+
+def _add_column(conn: Connection, table: str, name: str, ddl: str) -> None:
+    if name not in {c["name"] for c in inspect(conn).get_columns(table)}:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def _create_base_tables(conn: Connection) -> None:
+    Base.metadata.create_all(bind=conn, tables=[User.__table__, Schedule.__table__])
+
+
+def _add_schedule_version_columns(conn: Connection) -> None:
+    # 버전 관리 이전에 만들어진 DB 보완 (기존 init_db.upgrade_schema)
+    _add_column(conn, "users", "schedule_version", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(conn, "schedules", "version", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(conn, "schedules", "deleted_at", "DATETIME")
+
+
+def _create_schedule_indexes(conn: Connection) -> None:
+    for index in Schedule.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
+
+
+def _create_archive_table(conn: Connection) -> None:
+    ScheduleArchive.__table__.create(bind=conn, checkfirst=True)
+
+
+def _drop_primary_key_indexes(conn: Connection) -> None:
+    # INTEGER PRIMARY KEY는 rowid 자체라 별도 인덱스가 조회에 쓰이지 않고 INSERT/DELETE마다 갱신 비용만 발생
+    conn.execute(text("DROP INDEX IF EXISTS ix_schedules_id"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_users_id"))
+
+
+Migration = Tuple[int, str, Callable[[Connection], None]]
+
+MIGRATIONS: List[Migration] = [
+    (1, "users / schedules 테이블", _create_base_tables),
+    (2, "일정 버전 / soft-delete 컬럼", _add_schedule_version_columns),
+    (3, "일정 기간 / 델타 조회 인덱스", _create_schedule_indexes),
+    (4, "schedules_archive 테이블", _create_archive_table),
+    (5, "중복 primary key 인덱스 제거", _drop_primary_key_indexes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(conn: Connection) -> int:
+    """적용된 스키마 버전 (schema_version 테이블이 없으면 0)"""
+    try:
+        return conn.execute(select(schema_version.c.version)).scalar() or 0
+    except OperationalError:
+        return 0
+
+
+def _set_version(conn: Connection, version: int) -> None:
+    if conn.execute(text("UPDATE schema_version SET version = :v WHERE id = 1"), {"v": version}).rowcount == 0:
+        conn.execute(schema_version.insert().values(id=1, version=version))
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[int]:
+    """
+    target 버전(기본: 최신)까지 남은 단계를 순서대로 적용합니다.
+
+    Args:
+        engine: SQLite 엔진
+        target: 적용할 마지막 단계 번호
+
+    Returns:
+        List[int]: 이번에 적용한 단계 번호 (이미 최신이면 빈 리스트)
+    """
+    target = LATEST_VERSION if target is None else target
+    applied = []
+    for version, description, step in MIGRATIONS:
+        if version > target:
+            break
+        with engine.connect() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            if current_version(conn) >= version:
+                conn.rollback()
+                continue
+            version_metadata.create_all(bind=conn)
+            step(conn)
+            _set_version(conn, version)
+            conn.commit()
+        logger.info(f"스키마 마이그레이션 {version} 적용: {description}")
+        applied.append(version)
+    return applied
+
+
+def ensure_schema(engine: Engine, auto_migrate: bool = False) -> int:
+    """
+    서버 시작 시 스키마 버전 확인 (schema_version 행 하나 조회)
+
+    Args:
+        engine: SQLite 엔진
+        auto_migrate: 버전이 뒤처졌을 때 바로 마이그레이션 (개발 환경용, 운영에서는 CLI로 먼저 실행)
+
+    Returns:
+        int: 확인(또는 적용) 후 스키마 버전
+
+    Raises:
+        RuntimeError: DB 버전이 코드보다 높거나, 뒤처졌는데 auto_migrate가 꺼져 있는 경우
+    """
+    with engine.connect() as conn:
+        version = current_version(conn)
+    if version == LATEST_VERSION:
+        return version
+    if version > LATEST_VERSION:
+        raise RuntimeError(f"Database schema version {version} is newer than this code ({LATEST_VERSION})")
+    if not auto_migrate:
+        raise RuntimeError(
+            f"Database schema version {version} is behind {LATEST_VERSION}; "
+            f"run `python -m Fast_api.db.migrations` first"
+        )
+    logger.warning(f"스키마 버전 {version} → {LATEST_VERSION} 자동 마이그레이션")
+    migrate(engine)
+    return LATEST_VERSION
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용하지 않고 현재/최신 버전만 출력")
+    parser.add_argument("--target", type=int, default=None, help="이 단계까지만 적용")
+    args = parser.parse_args(argv)
+
+    with engine.connect() as conn:
+        version = current_version(conn)
+    print(f"{SQLALCHEMY_DATABASE_URL}: 현재 버전 {version}, 최신 버전 {LATEST_VERSION}")
+    if args.status:
+        return
+    applied = migrate(engine, args.target)
+    print(f"적용한 단계: {applied or '없음'}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,173 @@
+# in: app/db/rebalance_shards.py
+"""
+일정 샤드 재분배 도구
+SCHEDULE_SHARD_COUNT를 바꾸기 전에 (서버를 멈춘 상태에서) 실행해 각 사용자의 일정과 버전 행을
+새 샤드 수 기준 위치로 옮깁니다. 대상 샤드에 먼저 커밋한 뒤 원본에서 지우므로 중단되면 다시 실행하면 됩니다.
+- 아카이브(schedules_archive) 행도 함께 이동
+- 일정 id는 그대로 유지, 대상 샤드에 같은 id의 다른 사용자 일정이 있을 때만 새 id로 발급(rekeyed)
+- 옮긴 사용자의 schedule_version은 증가시켜 클라이언트 캐시(ETag)를 무효화
+
+실행:
+  python -m Fast_api.db.rebalance_shards --to 4                 # 기존 샤드 파일 → 4개
+  python -m Fast_api.db.rebalance_shards --to 4 --from-primary  # 기본 DB의 일정을 샤드로 이전
+"""
+import argparse
+import glob
+import os
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, insert, select, union, update
+from sqlalchemy.engine import Engine
+from Fast_api.db.engine_profile import create_sqlite_engine
+from Fast_api.db.session import SQLALCHEMY_DATABASE_URL
+from Fast_api.db.shards import init_shard_schema, jump_hash, shard_path
+from Fast_api.models.schedule import Schedule, ScheduleArchive
+from Fast_api.models.user import User
+
+schedules = Schedule.__table__
+archive = ScheduleArchive.__table__
+users = User.__table__
+
+CHUNK_SIZE = 500  # IN 목록 / executemany 단위
+
+
+def existing_shards(shard_dir: Optional[str] = None) -> List[int]:
+    pattern = shard_path(0, shard_dir).replace("schedules_shard_0.db", "schedules_shard_*.db")
+    indexes = []
+    for path in glob.glob(pattern):
+        match = re.search(r"schedules_shard_(\d+)\.db$", path)
+        if match:
+            indexes.append(int(match.group(1)))
+    return sorted(indexes)
+
+
+def move_user(source: Engine, target: Engine, user_id: int, keep_user_row: bool) -> Dict[str, int]:
+    """한 사용자의 일정(hot + 아카이브)과 버전 행을 source → target으로 이동"""
+    with source.connect() as src:
+        rows = {
+            table: [dict(r) for r in src.execute(select(table).where(table.c.user_id == user_id)).mappings()]
+            for table in (schedules, archive)
+        }
+        version = src.execute(select(users.c.schedule_version).where(users.c.id == user_id)).scalar() or 0
+
+    rekeyed = 0
+    with target.begin() as dst:
+        current = dst.execute(select(users.c.schedule_version).where(users.c.id == user_id)).scalar()
+        new_version = max(current or 0, version) + 1
+        if current is None:
+            dst.execute(insert(users).values(id=user_id, schedule_version=new_version))
+        else:
+            dst.execute(update(users).where(users.c.id == user_id).values(schedule_version=new_version))
+
+        fresh = []
+        for table, table_rows in rows.items():
+            preserved = []
+            for start in range(0, len(table_rows), CHUNK_SIZE):
+                chunk = table_rows[start:start + CHUNK_SIZE]
+                chunk_ids = [r["id"] for r in chunk]
+                # id는 대상 파일의 hot/아카이브 테이블 전체에서 유일해야 함
+                owners = dict(dst.execute(
+                    union(
+                        select(schedules.c.id, schedules.c.user_id).where(schedules.c.id.in_(chunk_ids)),
+                        select(archive.c.id, archive.c.user_id).where(archive.c.id.in_(chunk_ids))
+                    )
+                ).all())
+                for row in chunk:
+                    owner = owners.get(row["id"])
+                    if owner is None:
+                        preserved.append(row)
+                    elif owner != user_id:
+                        # id 충돌: hot 테이블에 대상 샤드 구간의 새 id로 발급하고 델타 동기화에 잡히도록 버전 갱신
+                        fresh.append({**row, "version": new_version})
+                    # owner == user_id: 이전 실행에서 이미 옮겨진 행
+            for start in range(0, len(preserved), CHUNK_SIZE):
+                dst.execute(insert(table), preserved[start:start + CHUNK_SIZE])
+        for row in fresh:
+            row.pop("id")
+            dst.execute(insert(schedules).values(**row))
+            rekeyed += 1
+
+    with source.begin() as src:
+        src.execute(delete(schedules).where(schedules.c.user_id == user_id))
+        src.execute(delete(archive).where(archive.c.user_id == user_id))
+        if not keep_user_row:
+            src.execute(delete(users).where(users.c.id == user_id))
+
+    return {"schedules": sum(len(r) for r in rows.values()), "rekeyed": rekeyed}
+
+
+def rebalance(target_count: int, shard_dir: Optional[str] = None, from_primary: bool = False) -> Dict[str, int]:
+    """
+    기존 샤드 파일(및 선택적으로 기본 DB)의 일정을 target_count개 샤드 기준 위치로 이동합니다.
+
+    Args:
+        target_count: 새 샤드 수
+        shard_dir: 샤드 파일 디렉토리 (기본: 설정값)
+        from_primary: 기본 DB의 schedules도 이동 대상에 포함 (users 행은 기본 DB에 유지)
+
+    Returns:
+        Dict[str, int]: 이동한 사용자 수, 일정 수, 새 id로 발급한 일정 수
+    """
+    if target_count < 1:
+        raise ValueError("target_count must be at least 1")
+
+    engines: Dict[int, Engine] = {}
+
+    def shard_engine(index: int) -> Engine:
+        if index not in engines:
+            engines[index] = create_sqlite_engine(f"sqlite:///{shard_path(index, shard_dir)}")
+            init_shard_schema(engines[index], index)
+        return engines[index]
+
+    sources = [(index, shard_engine(index)) for index in existing_shards(shard_dir)]
+    primary = None
+    if from_primary:
+        primary = create_sqlite_engine(SQLALCHEMY_DATABASE_URL)
+        sources.insert(0, (None, primary))
+
+    stats = {"users": 0, "schedules": 0, "rekeyed": 0}
+    try:
+        for source_index, source in sources:
+            selects = [
+                select(schedules.c.user_id).where(schedules.c.user_id.is_not(None)),
+                select(archive.c.user_id)
+            ]
+            if source_index is not None:
+                selects.append(select(users.c.id))
+            query = union(*selects)
+            with source.connect() as conn:
+                user_ids = conn.execute(query).scalars().all()
+            for user_id in user_ids:
+                target_index = jump_hash(user_id, target_count)
+                if target_index == source_index:
+                    continue
+                moved = move_user(source, shard_engine(target_index), user_id, keep_user_row=source_index is None)
+                stats["users"] += 1
+                stats["schedules"] += moved["schedules"]
+                stats["rekeyed"] += moved["rekeyed"]
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+        if primary is not None:
+            primary.dispose()
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="일정 샤드 재분배")
+    parser.add_argument("--to", type=int, required=True, dest="target_count", help="새 샤드 수")
+    parser.add_argument("--dir", default=None, dest="shard_dir", help="샤드 파일 디렉토리")
+    parser.add_argument("--from-primary", action="store_true", help="기본 DB의 일정을 샤드로 이전")
+    args = parser.parse_args(argv)
+
+    stats = rebalance(args.target_count, args.shard_dir, args.from_primary)
+    print(f"사용자 {stats['users']}명, 일정 {stats['schedules']}개 이동 (새 id 발급 {stats['rekeyed']}개)")
+    leftover = [i for i in existing_shards(args.shard_dir) if i >= args.target_count]
+    if leftover:
+        print(f"비어 있는 이전 샤드 파일은 삭제해도 됩니다: {[os.path.basename(shard_path(i, args.shard_dir)) for i in leftover]}")
+    print(f"이제 SCHEDULE_SHARD_COUNT={args.target_count} 로 설정하고 서버를 재시작하세요.")
+
+
+if __name__ == "__main__":
+    main()
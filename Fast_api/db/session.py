@@ -1,16 +1,17 @@
 # in: app/db/session.py
 import os
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from Fast_api.db.engine_profile import create_sqlite_engine, create_async_sqlite_engine
 
 # 데이터베이스 파일을 프로젝트 루트에 생성 (절대 경로)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(BASE_DIR, "my_pipeline_service.db")
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# WAL/busy_timeout/mmap 등 PRAGMA와 풀 크기는 engine_profile에서 설정값 기반으로 적용
+engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -19,4 +20,14 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# async def 엔드포인트용 (aiosqlite: DB I/O를 이벤트 루프 밖 스레드에서 수행)
+async_engine = create_async_sqlite_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+
+# 커밋 후에도 응답 직렬화에서 추가 I/O(lazy load)가 없도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,184 @@
+# in: app/db/shards.py
+"""
+사용자별 일정 샤딩 (선택 기능, SCHEDULE_SHARD_COUNT > 0)
+
+일정 데이터를 user_id의 jump consistent hash로 고른 N개의 SQLite 파일에 나눠 저장해
+사용자들이 하나의 쓰기 락을 공유하지 않도록 합니다. 사용자/인증 데이터는 기본 DB에 그대로 둡니다.
+- 샤드 파일의 users 테이블은 일정 버전(schedule_version) 행만 보관 (id + 버전, 나머지 컬럼은 NULL)
+- 샤드 k의 일정 id는 (k + 1) * SHARD_ID_SPAN 부터 발급되어 재분배 시 id를 그대로 옮길 수 있음
+- 샤드 수를 바꿀 때는 먼저 rebalance_shards로 데이터를 옮긴 뒤 설정을 변경
+"""
+import os
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+from fastapi import Depends
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from Fast_api.auth.jwt_handle import get_current_user
+from Fast_api.auth.user_cache import UserSnapshot
+from Fast_api.core.config import settings
+from Fast_api.db.engine_profile import create_sqlite_engine, create_async_sqlite_engine
+from Fast_api.db.session import BASE_DIR, get_db, get_async_db
+from Fast_api.models.schedule import Schedule, ScheduleArchive
+from Fast_api.models.user import User
+
+SHARD_ID_SPAN = 2 ** 40  # 샤드별 일정 id 구간 (JS Number 안전 범위 내에서 8000개 이상 샤드 지원)
+
+# 샤드 파일 스키마: 기본 스키마의 users/schedules/schedules_archive 복사본, 일정 id는 AUTOINCREMENT (sqlite_sequence로 시작값 지정)
+shard_metadata = MetaData()
+User.__table__.to_metadata(shard_metadata)
+ScheduleArchive.__table__.to_metadata(shard_metadata)
+_shard_schedules = Schedule.__table__.to_metadata(shard_metadata)
+_shard_schedules.dialect_options["sqlite"]["autoincrement"] = True
+
+_lock = threading.Lock()
+_engines: Dict[int, Engine] = {}
+_session_factories: Dict[int, sessionmaker] = {}
+_async_session_factories: Dict[int, async_sessionmaker] = {}
+_async_engines: Dict[int, AsyncEngine] = {}
+_known_users: Set[Tuple[int, int]] = set()
+
+
+def is_enabled() -> bool:
+    return settings.SCHEDULE_SHARD_COUNT > 0
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach): 버킷 수를 N → M으로 늘리면 키의 (M - N) / M 만 이동
+
+    Args:
+        key: 해시할 정수 키 (user_id)
+        buckets: 버킷(샤드) 수
+
+    Returns:
+        int: 0 ~ buckets - 1
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941143 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+def shard_for_user(user_id: int, shard_count: Optional[int] = None) -> int:
+    return jump_hash(user_id, shard_count or settings.SCHEDULE_SHARD_COUNT)
+
+
+def shard_path(index: int, shard_dir: Optional[str] = None) -> str:
+    return os.path.join(shard_dir or settings.SCHEDULE_SHARD_DIR or BASE_DIR, f"schedules_shard_{index}.db")
+
+
+def init_shard_schema(engine: Engine, index: int) -> None:
+    """샤드 파일에 테이블을 만들고 일정 id 시작값을 샤드 구간으로 지정 (이미 있으면 유지)"""
+    shard_metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO sqlite_sequence (name, seq) "
+                "SELECT 'schedules', :seq WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'schedules')"
+            ),
+            {"seq": (index + 1) * SHARD_ID_SPAN}
+        )
+
+
+def get_shard_engine(index: int) -> Engine:
+    """샤드 엔진 (처음 사용할 때 생성하고 스키마 초기화)"""
+    engine = _engines.get(index)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(index)
+            if engine is None:
+                engine = create_sqlite_engine(f"sqlite:///{shard_path(index)}")
+                init_shard_schema(engine, index)
+                _session_factories[index] = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engines[index] = engine
+    return engine
+
+
+def shard_session_factory(index: int) -> sessionmaker:
+    get_shard_engine(index)
+    return _session_factories[index]
+
+
+def get_async_shard_engine(index: int) -> AsyncEngine:
+    async_engine = _async_engines.get(index)
+    if async_engine is None:
+        get_shard_engine(index)  # 스키마 초기화는 동기 엔진에서
+        with _lock:
+            async_engine = _async_engines.get(index)
+            if async_engine is None:
+                async_engine = create_async_sqlite_engine(f"sqlite+aiosqlite:///{shard_path(index)}")
+                _async_session_factories[index] = async_sessionmaker(
+                    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+                )
+                _async_engines[index] = async_engine
+    return async_engine
+
+
+def ensure_user_row(engine: Engine, index: int, user_id: int) -> None:
+    # 샤드에 사용자 버전 행이 없으면 생성 (프로세스당 한 번만 확인)
+    if (index, user_id) in _known_users:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("INSERT OR IGNORE INTO users (id, schedule_version) VALUES (:id, 0)"), {"id": user_id})
+    _known_users.add((index, user_id))
+
+
+def shard_session(user_id: int) -> Session:
+    """사용자의 샤드에 바인딩된 새 세션 (닫는 것은 호출한 쪽 책임)"""
+    index = shard_for_user(user_id)
+    ensure_user_row(get_shard_engine(index), index, user_id)
+    return _session_factories[index]()
+
+
+def async_shard_session(user_id: int) -> AsyncSession:
+    index = shard_for_user(user_id)
+    get_async_shard_engine(index)
+    ensure_user_row(_engines[index], index, user_id)
+    return _async_session_factories[index]()
+
+
+def get_schedule_db(
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """일정 API용 세션: 샤딩이 켜져 있으면 사용자의 샤드, 아니면 기본 DB 세션(get_db와 같은 객체)"""
+    if not is_enabled():
+        yield db
+        return
+    shard_db = shard_session(current_user.id)
+    try:
+        yield shard_db
+    finally:
+        shard_db.close()
+
+
+async def get_async_schedule_db(
+    current_user: UserSnapshot = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if not is_enabled():
+        yield db
+        return
+    async with async_shard_session(current_user.id) as shard_db:
+        yield shard_db
+
+
+def dispose_shards() -> None:
+    """샤드 엔진과 캐시를 정리 (테스트/재분배 후 설정 변경 시)"""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        for async_engine in _async_engines.values():
+            async_engine.sync_engine.dispose(close=False)  # 이벤트 루프 밖에서는 커넥션 close 불가
+        _engines.clear()
+        _session_factories.clear()
+        _async_engines.clear()
+        _async_session_factories.clear()
+        _known_users.clear()
@@ -0,0 +1,71 @@
+# in: app/db/types.py
+"""
+일정 시각 컬럼 저장 형식 (SCHEDULE_TIMESTAMP_STORAGE)
+- "datetime": 기존 방식, KST naive datetime을 텍스트로 저장
+- "epoch": UTC epoch 초(INTEGER)로 저장 → 범위 비교가 정수 비교, 인덱스/행 크기 감소, 읽을 때 문자열 파싱 없음
+어느 형식이든 애플리케이션에는 KST naive datetime으로 보이므로 서비스/응답 코드는 그대로 동작합니다.
+형식을 바꿀 때는 먼저 db/migrate_timestamps로 기존 행을 변환한 뒤 설정을 변경합니다.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, func
+from sqlalchemy.types import TypeDecorator, TypeEngine
+from Fast_api.core.config import settings
+
+# KST는 1988년 이후 서머타임이 없으므로 고정 오프셋으로 변환 (마이그레이션 SQL과 동일)
+KST_OFFSET = timedelta(hours=9)
+KST_OFFSET_SECONDS = 9 * 3600
+_EPOCH_KST_NAIVE = datetime(1970, 1, 1) + KST_OFFSET
+_ONE_SECOND = timedelta(seconds=1)
+
+
+class EpochDateTime(TypeDecorator):
+    """
+    UTC epoch 초(INTEGER)로 저장하는 datetime 타입
+    naive 값은 KST로, timezone-aware 값은 그 시각 그대로 변환해 저장하고, 읽을 때는 KST naive datetime을 반환합니다.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            # API 경계에서 들어온 aware 값 (예: created_at의 datetime.now(KST))
+            value = value.astimezone(timezone.utc).replace(tzinfo=None) + KST_OFFSET
+        return (value - _EPOCH_KST_NAIVE) // _ONE_SECOND
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return _EPOCH_KST_NAIVE + _ONE_SECOND * value
+
+    def result_processor(self, dialect, coltype):
+        # 행마다 호출되므로 TypeDecorator의 래퍼 없이 바로 변환 (Integer impl은 결과 변환이 없음)
+        epoch, second = _EPOCH_KST_NAIVE, _ONE_SECOND
+
+        def process(value):
+            return None if value is None else epoch + second * value
+
+        return process
+
+    @property
+    def python_type(self):
+        return datetime
+
+
+def epoch_storage() -> bool:
+    return settings.SCHEDULE_TIMESTAMP_STORAGE == "epoch"
+
+
+def timestamp_type() -> TypeEngine:
+    """일정 시각 컬럼(scheduled_at/created_at/updated_at) 타입 (모델 정의 시점의 설정값 기준)"""
+    return EpochDateTime() if epoch_storage() else DateTime()
+
+
+def kst_date(column):
+    """컬럼 값의 KST 날짜('YYYY-MM-DD') SQL 식 (일별 집계용)"""
+    if isinstance(column.type, EpochDateTime):
+        return func.date(column, "unixepoch", f"+{KST_OFFSET_SECONDS} seconds")
+    return func.date(column)
@@ -0,0 +1,206 @@
+"""
+SQLite group-commit 쓰기 큐 (선택 기능, SCHEDULE_WRITE_QUEUE_ENABLED)
+
+동시 요청의 쓰기를 단일 writer 스레드가 모아 WRITE_QUEUE_MAX_DELAY_MS 또는
+WRITE_QUEUE_MAX_BATCH개 단위로 한 트랜잭션(커밋 1회)에 적용합니다.
+- 작업마다 SAVEPOINT를 사용하므로 한 작업의 예외는 그 작업에만 전달되고 나머지는 커밋됩니다.
+- 호출한 쪽의 Future는 배치 커밋이 끝난 뒤에 결과로 완료됩니다 (커밋 전 결과 노출 없음).
+- writer는 전용 커넥션 1개만 사용하므로 요청 스레드끼리 쓰기 락을 두고 경쟁하지 않습니다.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from Fast_api.core.config import settings
+from Fast_api.db.engine_profile import create_sqlite_engine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteFn = Callable[[Session], T]
+
+_STOP = object()
+
+
+class WriteNotAppliedError(TimeoutError):
+    """대기 시간 안에 실행을 시작하지 못해 취소된 작업 (DB에 반영되지 않음, 재시도해도 안전)"""
+
+
+class WriteOutcomeUnknownError(TimeoutError):
+    """이미 실행 중인 배치가 대기 시간 안에 끝나지 않은 작업 (반영되었을 수 있음)"""
+
+
+class GroupCommitWriter:
+    """
+    쓰기 작업(세션을 받아 결과를 반환하는 함수)을 모아 한 번에 커밋하는 단일 writer
+
+    Args:
+        url: SQLite 데이터베이스 URL
+        max_batch: 한 트랜잭션에 담을 최대 작업 수
+        max_delay: 첫 작업 도착 후 다음 작업을 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, url: str, max_batch: int = 64, max_delay: float = 0.002):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = {"batches": 0, "operations": 0, "errors": 0}
+
+        # pysqlite의 자동 BEGIN을 끄고 직접 BEGIN IMMEDIATE를 보내야 SAVEPOINT가 정상 동작
+        self._engine = create_sqlite_engine(url, pool_size=1, max_overflow=0)
+
+        @event.listens_for(self._engine, "connect")
+        def _disable_pysqlite_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(self._engine, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        # 커밋 후 세션을 닫아도 결과 객체의 속성을 읽을 수 있도록 expire_on_commit=False
+        self._session_factory = sessionmaker(bind=self._engine, autoflush=False, expire_on_commit=False)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, write: WriteFn) -> Future:
+        """작업을 큐에 넣고 배치 커밋 후 결과(또는 예외)가 채워질 Future를 반환"""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("GroupCommitWriter is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sqlite-group-commit", daemon=True)
+                self._thread.start()
+            self._queue.put((write, future))
+        return future
+
+    def close(self) -> None:
+        """남은 작업을 모두 커밋한 뒤 writer 스레드와 엔진을 정리"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+        self._engine.dispose()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[Tuple[WriteFn, Future]]) -> None:
+        done = []
+        db: Optional[Session] = None
+        try:
+            db = self._session_factory()
+            for write, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                savepoint = db.begin_nested()
+                try:
+                    result = write(db)
+                    db.flush()
+                    savepoint.commit()
+                except Exception as e:
+                    savepoint.rollback()
+                    self.stats["errors"] += 1
+                    future.set_exception(e)
+                else:
+                    done.append((future, result))
+            db.commit()
+        except Exception as e:
+            logger.error(f"group commit 실패: 배치 {len(batch)}개 작업 롤백, error={str(e)}", exc_info=True)
+            if db is not None:
+                try:
+                    db.rollback()
+                except Exception:
+                    logger.error("group commit 롤백 실패", exc_info=True)
+            # 세션 생성 / SAVEPOINT 실패 등으로 중간에 멈춰도 배치의 모든 호출자가 깨어나도록
+            # (이미 예외가 전달됐거나 취소된 Future는 제외)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            if db is not None:
+                db.close()
+
+        self.stats["batches"] += 1
+        self.stats["operations"] += len(done)
+        for future, result in done:
+            future.set_result(result)
+
+
+_writers: Dict[str, GroupCommitWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return settings.SCHEDULE_WRITE_QUEUE_ENABLED
+
+
+def get_write_queue(url: str) -> GroupCommitWriter:
+    """DB 파일(URL)별 writer (처음 사용할 때 생성, 프로세스 종료 시 남은 작업 커밋)"""
+    writer = _writers.get(url)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(url)
+            if writer is None:
+                writer = GroupCommitWriter(
+                    url,
+                    max_batch=settings.WRITE_QUEUE_MAX_BATCH,
+                    max_delay=settings.WRITE_QUEUE_MAX_DELAY_MS / 1000
+                )
+                atexit.register(writer.close)
+                _writers[url] = writer
+    return writer
+
+
+def run(db: Session, write: WriteFn) -> T:
+    """
+    db와 같은 DB 파일의 writer 스레드에서 작업을 실행하고 배치 커밋이 끝날 때까지 대기
+    (동기 엔드포인트의 스레드풀에서 호출, 샤딩 시 샤드별로 writer가 따로 동작)
+
+    WRITE_QUEUE_RESULT_TIMEOUT_SECONDS 안에 끝나지 않으면
+    - 아직 시작하지 않은 작업: 취소하고 WriteNotAppliedError
+    - 이미 실행 중인 작업: 버리지 않고 배치가 끝날 때까지 같은 시간만큼 한 번 더 대기,
+      그래도 끝나지 않으면 WriteOutcomeUnknownError (요청 스레드를 무기한 붙잡지 않음)
+    """
+    url = db.get_bind().url.render_as_string(hide_password=False)
+    future = get_write_queue(url).submit(write)
+    timeout = settings.WRITE_QUEUE_RESULT_TIMEOUT_SECONDS
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        pass
+    if future.cancel():
+        raise WriteNotAppliedError("쓰기 큐 대기 시간을 초과해 작업을 취소했습니다.")
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        raise WriteOutcomeUnknownError("실행 중인 쓰기 배치가 대기 시간 안에 끝나지 않았습니다.")
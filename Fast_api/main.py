@@ -6,22 +6,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import logging
 logging.basicConfig(level=logging.INFO)
 
-# 데이터베이스 초기화 (API import 전에 먼저 실행)
+# 스키마 생성/변경은 db/migrations CLI에서 수행하고, 서버 시작(lifespan) 시에는 버전 행만 확인
 from Fast_api.db.session import engine, SQLALCHEMY_DATABASE_URL
-from Fast_api.db.base_class import Base
-from Fast_api.models import user
-from Fast_api.models import schedule as schedule_model  # 이름 충돌 방지
+from Fast_api.db import migrations
 
-logging.info(f"Database URL: {SQLALCHEMY_DATABASE_URL}")
-Base.metadata.create_all(bind=engine)
-logging.info("Database tables initialized")
-
-# DB 파일 존재 확인
-import os
-db_path = SQLALCHEMY_DATABASE_URL.replace("sqlite:///", "")
-logging.info(f"Database file exists: {os.path.exists(db_path)}, path: {db_path}")
-
-# 이제 API 모듈 import (DB가 준비된 후)
+# API 모듈 import
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -31,16 +20,20 @@ from typing import List, Dict, Any, Optional
 from Fast_api.api import signup, login, schedule
 from Fast_api.auth.jwt_handle import get_current_user
 from Fast_api.models.user import User
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from contextlib import asynccontextmanager
+import asyncio
+from Fast_api.core.config import settings
+from Fast_api.core import rate_limit
+from Fast_api.services import archive_service
 
 # 환경 변수로 개발/프로덕션 모드 구분
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 IS_PRODUCTION = ENVIRONMENT == "production"
 
-# SlowAPI Rate Limiter 초기화
-limiter = Limiter(key_func=get_remote_address)
+# SlowAPI Rate Limiter (모든 라우터/워커가 공유하는 인스턴스)
+limiter = rate_limit.limiter
 
 # Rate Limit 커스텀 에러 핸들러
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
@@ -89,11 +82,27 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         }
     )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 버전 확인 (개발 환경에서는 뒤처진 단계를 바로 적용, 운영에서는 CLI로 먼저 마이그레이션)
+    logging.info(f"Database URL: {SQLALCHEMY_DATABASE_URL}")
+    version = migrations.ensure_schema(engine, auto_migrate=not IS_PRODUCTION)
+    logging.info(f"Database schema version: {version}")
+
+    # 완료 일정 아카이브 주기 실행 (설정 시에만)
+    archive_task = None
+    if settings.SCHEDULE_ARCHIVE_INTERVAL_MINUTES > 0:
+        archive_task = asyncio.create_task(archive_service.archive_loop(settings.SCHEDULE_ARCHIVE_INTERVAL_MINUTES * 60))
+    yield
+    if archive_task is not None:
+        archive_task.cancel()
+
 # 프로덕션에서는 문서 비활성화 (기본값: 비활성화)
 app = FastAPI(
     docs_url=None,
     redoc_url=None,
-    openapi_url=None
+    openapi_url=None,
+    lifespan=lifespan
 )
 
 # SlowAPI 설정 추가
@@ -111,7 +120,8 @@ app.add_middleware(
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["Content-Type", "Authorization"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # @app.get("/")
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
 from Fast_api.db.base_class import Base
+from Fast_api.db.types import timestamp_type
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -8,11 +9,43 @@ KST = ZoneInfo('Asia/Seoul')
 class Schedule(Base):
     __tablename__ = "schedules"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    scheduled_at = Column(DateTime, nullable=False)
+    scheduled_at = Column(timestamp_type(), nullable=False)
     is_completed = Column(Boolean, default=False)
     user_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=lambda: datetime.now(KST))
-    updated_at = Column(DateTime, default=lambda: datetime.now(KST), onupdate=lambda: datetime.now(KST))
+    created_at = Column(timestamp_type(), default=lambda: datetime.now(KST))
+    updated_at = Column(timestamp_type(), default=lambda: datetime.now(KST), onupdate=lambda: datetime.now(KST))
+    version = Column(Integer, default=0, server_default="0", nullable=False)  # 마지막 변경 시점의 users.schedule_version
+    deleted_at = Column(DateTime, nullable=True)  # soft-delete (델타 동기화용 tombstone)
+
+    # 달력/주간 요약의 기간 조회용 복합 인덱스 (user_id 고정 + scheduled_at 범위 스캔)
+    __table_args__ = (
+        Index("ix_schedules_user_id_scheduled_at", "user_id", "scheduled_at"),
+        Index("ix_schedules_user_id_version", "user_id", "version"),
+    )
+
+
+class ScheduleArchive(Base):
+    """
+    완료 후 오래된 일정의 콜드 저장소 (services/archive_service.py의 압축 작업이 schedules에서 이동)
+    id는 원래 일정 id를 그대로 유지, 수정/삭제 요청이 오면 schedules로 복원한 뒤 처리합니다.
+    """
+    __tablename__ = "schedules_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    scheduled_at = Column(timestamp_type(), nullable=False)
+    is_completed = Column(Boolean, default=False)
+    user_id = Column(Integer, nullable=False)
+    created_at = Column(timestamp_type())
+    updated_at = Column(timestamp_type())
+    version = Column(Integer, default=0, server_default="0", nullable=False)
+    deleted_at = Column(DateTime, nullable=True)  # 항상 NULL (삭제 tombstone은 hot 테이블에 유지)
+
+    __table_args__ = (
+        Index("ix_schedules_archive_user_id_scheduled_at", "user_id", "scheduled_at"),
+        Index("ix_schedules_archive_user_id_version", "user_id", "version"),
+    )
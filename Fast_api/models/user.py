@@ -2,7 +2,7 @@ from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime
 from Fast_api.db.base_class import Base
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from passlib.context import CryptContext
+from Fast_api.core.security import pwd_context
 
 # KST 타임존 정의
 KST = ZoneInfo('Asia/Seoul')
@@ -11,7 +11,7 @@ time_stamp = Column(DateTime, default=lambda: datetime.now(KST))
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, index=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
@@ -20,9 +20,9 @@ class User(Base):
     request_count = Column(Integer, default=0)  # 현재 요청 수
     last_reset_date = Column(Date, default=lambda: datetime.now(KST))  # 마지막 초기화 날짜
     paid_user = Column(Boolean, default=False)  # 유료 사용자 여부 기본값 설정
+    schedule_version = Column(Integer, default=0, server_default="0", nullable=False)  # 일정 변경 시마다 증가 (ETag용)
 
 
     def verify_password(self, password: str) -> bool:
-        pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
-        """저장된 해시와 입력된 비밀번호를 비교"""
+        """저장된 해시와 입력된 비밀번호를 비교 (동기 호출용, API에서는 password_service 사용)"""
         return pwd_context.verify(password, self.hashed_password)
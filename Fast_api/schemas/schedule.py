@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, date
+from typing import Annotated, List, Literal, Optional, Union
 
 class ScheduleCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
@@ -26,5 +26,59 @@ class ScheduleResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ScheduleChanges(BaseModel):
+    version: int  # 다음 요청의 since로 사용
+    changed: List[ScheduleResponse]  # since 이후 생성/수정된 일정
+    deleted: List[int]  # since 이후 삭제된 일정 id (tombstone)
+
+class BatchCreateOperation(BaseModel):
+    op: Literal["create"]
+    schedule: ScheduleCreate
+
+class BatchUpdateOperation(BaseModel):
+    op: Literal["update"]
+    id: int
+    changes: ScheduleUpdate
+
+class BatchDeleteOperation(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+class BatchCompleteOperation(BaseModel):
+    op: Literal["complete"]
+    id: int
+    is_completed: bool = True
+
+BatchOperation = Annotated[
+    Union[BatchCreateOperation, BatchUpdateOperation, BatchDeleteOperation, BatchCompleteOperation],
+    Field(discriminator="op")
+]
+
+class ScheduleBatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=500)
+
+class BatchOperationResult(BaseModel):
+    op: str
+    id: Optional[int]  # create는 새로 생성된 id
+    status: Literal["ok", "not_found"]
+
+class ScheduleBatchResponse(BaseModel):
+    version: int
+    results: List[BatchOperationResult]  # operations와 같은 순서
+
+class DailySummary(BaseModel):
+    date: date
+    total: int
+    completed: int
+
+class ScheduleSummary(BaseModel):
+    period: str
+    start: date  # 포함
+    end: date  # 미포함
+    total: int
+    completed: int
+    completion_rate: float
+    days: List[DailySummary]  # 일정이 있는 날만 포함
+
 class NaturalLanguageInput(BaseModel):
     text: str = Field(..., min_length=1)
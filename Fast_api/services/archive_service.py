@@ -0,0 +1,115 @@
+"""
+일정 hot/cold 분리: 완료 후 오래된 일정을 schedules → schedules_archive로 옮기는 압축 작업
+목록/요약/단건/델타 조회는 schedule_service에서 요청 범위가 아카이브 구간에 걸칠 때만 콜드 테이블을 함께 읽습니다.
+
+실행 (cron 등에서 한 번 실행): python -m Fast_api.services.archive_service [--days 90]
+서버 안에서 주기 실행: SCHEDULE_ARCHIVE_INTERVAL_MINUTES > 0
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from Fast_api.core.config import settings
+from Fast_api.db import migrations, shards
+from Fast_api.db.session import SessionLocal, engine
+from Fast_api.models.schedule import Schedule, ScheduleArchive, KST
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_BATCH_SIZE = 1000  # 배치마다 커밋해 쓰기 락을 짧게 유지
+
+
+def archive_completed_schedules(db: Session, before: datetime, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """
+    scheduled_at이 before 이전이고 완료된(삭제되지 않은) 일정을 아카이브 테이블로 옮깁니다.
+
+    Args:
+        db: 데이터베이스 세션 (기본 DB 또는 샤드)
+        before: 이 시각(KST naive) 이전 일정만 이동
+        batch_size: 한 트랜잭션에서 옮길 최대 행 수
+
+    Returns:
+        int: 이동한 일정 수
+    """
+    table = Schedule.__table__
+    archive = ScheduleArchive.__table__
+    columns = [column.name for column in archive.columns]
+    # rowid는 max(id) + 1로 발급되므로 가장 큰 id 행은 남겨 두어 id가 재사용되지 않도록 함
+    max_id = select(func.max(table.c.id)).scalar_subquery()
+
+    # id SELECT는 쓰기 트랜잭션 밖(첫 DML 전)에서 실행되므로, 그 사이 완료 해제/수정/삭제된 행을 옮기지 않도록
+    # INSERT와 DELETE에서도 같은 조건을 다시 확인 (INSERT부터 DELETE까지는 같은 쓰기 트랜잭션)
+    eligible = (
+        table.c.is_completed.is_(True),
+        table.c.deleted_at.is_(None),
+        table.c.scheduled_at < before,
+        table.c.id != max_id
+    )
+
+    moved = 0
+    last_id = 0
+    while True:
+        # id 순 keyset으로 이어서 스캔 (배치마다 테이블 처음부터 다시 읽지 않음)
+        ids = db.execute(
+            select(table.c.id).where(table.c.id > last_id, *eligible).order_by(table.c.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return moved
+        last_id = ids[-1]
+        db.execute(
+            insert(archive).from_select(
+                columns, select(*(table.c[name] for name in columns)).where(table.c.id.in_(ids), *eligible)
+            )
+        )
+        moved += db.execute(delete(table).where(table.c.id.in_(ids), *eligible)).rowcount
+        db.commit()
+
+
+def archive_sessions() -> Iterator[Session]:
+    """압축 대상 DB 세션 (기본 DB + 샤딩 시 모든 샤드)"""
+    yield SessionLocal()
+    if shards.is_enabled():
+        for index in range(settings.SCHEDULE_SHARD_COUNT):
+            yield shards.shard_session_factory(index)()
+
+
+def run_archive(days: Optional[int] = None, now: Optional[datetime] = None) -> int:
+    """설정된 기간(기본 SCHEDULE_ARCHIVE_AFTER_DAYS)보다 오래된 완료 일정을 모든 DB에서 아카이브"""
+    now = now or datetime.now(KST).replace(tzinfo=None)
+    cutoff = now - timedelta(days=settings.SCHEDULE_ARCHIVE_AFTER_DAYS if days is None else days)
+    total = 0
+    for db in archive_sessions():
+        try:
+            total += archive_completed_schedules(db, cutoff)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"일정 아카이브 실패: error={str(e)}", exc_info=True)
+        finally:
+            db.close()
+    if total:
+        logger.info(f"일정 {total}개 아카이브 (기준: {cutoff.isoformat()} 이전 완료 일정)")
+    return total
+
+
+async def archive_loop(interval_seconds: float) -> None:
+    """서버 실행 중 주기적으로 압축 작업 실행 (DB 작업은 스레드풀에서)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await loop.run_in_executor(None, run_archive)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="완료된 오래된 일정 아카이브")
+    parser.add_argument("--days", type=int, default=None, help="이 일수보다 오래된 완료 일정을 이동 (기본: 설정값)")
+    args = parser.parse_args(argv)
+    migrations.ensure_schema(engine)  # schedules_archive 테이블은 마이그레이션 4단계에서 생성
+    print(f"아카이브한 일정: {run_archive(args.days)}개")
+
+
+if __name__ == "__main__":
+    main()
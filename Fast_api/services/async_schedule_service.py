@@ -0,0 +1,36 @@
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from Fast_api.models.schedule import Schedule
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleCreate
+from typing import List
+
+# schedule_service의 async def 엔드포인트용 버전 (AsyncSession, 이벤트 루프를 막지 않음)
+
+async def bump_schedule_version(db: AsyncSession, user_id: int) -> int:
+    # 호출한 쪽의 트랜잭션 안에서 일정 변경과 함께 커밋됨, 증가된 버전을 반환
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(schedule_version=User.schedule_version + 1)
+        .returning(User.schedule_version)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one()
+
+async def create_schedules(db: AsyncSession, schedules: List[ScheduleCreate], user_id: int) -> List[Schedule]:
+    # 여러 일정을 버전 1회 증가로 추가, id 채번을 위해 flush만 하고 커밋은 호출한 쪽에서 수행
+    version = await bump_schedule_version(db, user_id)
+    db_schedules = [
+        Schedule(
+            title=schedule.title,
+            description=schedule.description,
+            scheduled_at=schedule.scheduled_at,
+            user_id=user_id,
+            version=version
+        )
+        for schedule in schedules
+    ]
+    db.add_all(db_schedules)
+    await db.flush()
+    return db_schedules
@@ -0,0 +1,36 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from Fast_api.models.user import User
+from Fast_api.schemas.user import UserCreate
+from Fast_api.services.password_service import password_hasher
+
+# user_service의 async def 엔드포인트용 버전 (AsyncSession, 이벤트 루프를 막지 않음)
+
+async def get_user_by(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+async def get_user_by_username(db: AsyncSession, username: str):
+    result = await db.execute(select(User).where(User.username == username))
+    return result.scalars().first()
+
+async def create_user(db: AsyncSession, user: UserCreate):
+    # 해싱은 CPU 작업이므로 전용 프로세스 풀에서 수행
+    hashed_password = await password_hasher.hash(user.password)
+    db_user = User(username=user.username, email=user.email, hashed_password=hashed_password)
+    db.add(db_user)
+    try:
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return db_user
+
+async def update_password_hash(db: AsyncSession, user_id: int, hashed_password: str) -> None:
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(hashed_password=hashed_password)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
@@ -0,0 +1,184 @@
+"""
+비밀번호 해싱 전용 프로세스 풀
+
+pbkdf2 해싱/검증은 GIL을 잡는 CPU 작업이라 기본 스레드풀(LLM 호출과 공유)에서 돌리면
+로그인이 몰릴 때 다른 요청과 LLM 호출까지 함께 밀립니다.
+- 별도 프로세스 풀(PASSWORD_HASH_WORKERS개)에서 실행해 이벤트 루프/스레드풀과 분리
+- 대기 + 실행 중인 작업이 PASSWORD_HASH_MAX_PENDING개 이상이면 바로 503 (Retry-After)
+- 워커는 처음 사용할 때 생성, 워커가 죽으면 다음 요청에서 풀을 다시 생성
+
+반복 횟수 보정 (목표 검증 시간에 맞는 PASSWORD_HASH_ROUNDS 계산):
+  python -m Fast_api.services.password_service --target-ms 50
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from Fast_api.core.config import settings
+from Fast_api.core.security import DEFAULT_PBKDF2_ROUNDS, build_pwd_context, pwd_context
+
+logger = logging.getLogger(__name__)
+
+# 사용자가 없을 때 검증할 해시 (워커마다 현재 반복 횟수로 한 번 생성, 실제 검증과 같은 비용 → 타이밍 공격 방지)
+_dummy_hash: Optional[str] = None
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    # 검증에 성공했고 반복 횟수가 현재 설정과 다르면 새 해시도 함께 반환
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+def _verify_dummy(password: str) -> bool:
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = pwd_context.hash(secrets.token_urlsafe(16))
+    pwd_context.verify(password, _dummy_hash)
+    return False
+
+
+def calibrate_rounds(target_ms: float, probe_rounds: int = 20000, samples: int = 5) -> int:
+    """
+    현재 하드웨어에서 한 번 검증하는 데 target_ms가 걸리는 pbkdf2 반복 횟수 (1000 단위, 하한 DEFAULT_PBKDF2_ROUNDS)
+
+    Args:
+        target_ms: 목표 검증 시간 (밀리초)
+        probe_rounds: 측정에 사용할 반복 횟수
+        samples: 측정 횟수 (가장 빠른 값 사용)
+
+    Returns:
+        int: 반복 횟수
+    """
+    context = build_pwd_context(probe_rounds)
+    hashed = context.hash("calibration")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration", hashed)
+        timings.append(time.perf_counter() - start)
+    per_round_ms = min(timings) * 1000 / probe_rounds
+    rounds = int(round(target_ms / per_round_ms, -3))
+    return max(rounds, DEFAULT_PBKDF2_ROUNDS)
+
+
+class PasswordHasher:
+    """
+    프로세스 풀 기반 비밀번호 해싱 서비스 (이벤트 루프에서 await로 사용)
+
+    Args:
+        workers: 워커 프로세스 수
+        max_pending: 동시에 받아들일 최대 작업 수 (대기 + 실행 중)
+        retry_after: 포화 시 클라이언트에 알려줄 재시도 대기 시간 (초)
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, retry_after: int = 1):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.stats = {"completed": 0, "rejected": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0, "total_ms": 0.0}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> ProcessPoolExecutor:
+        """워커 프로세스 풀 생성 (이미 있으면 그대로 반환)"""
+        with self._lock:
+            if self._executor is None:
+                # fork는 부모의 스레드/DB 커넥션 상태를 복사하므로 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _run(self, fn: Callable, *args):
+        with self._lock:
+            if self.stats["in_flight"] >= self.max_pending:
+                self.stats["rejected"] += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                    headers={"Retry-After": str(self.retry_after)}
+                )
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+
+        executor = self.start()
+        started = time.perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 버리고 다음 요청에서 새로 생성
+            logger.error("비밀번호 해싱 프로세스 풀 손상, 다시 생성합니다.", exc_info=True)
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self.stats["in_flight"] -= 1
+        with self._lock:
+            self.stats["completed"] += 1
+            self.stats["total_ms"] += (time.perf_counter() - started) * 1000
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(검증 결과, 재해싱이 필요할 때의 새 해시 또는 None)"""
+        return await self._run(_verify_and_update, password, hashed_password)
+
+    async def verify_dummy(self, password: str) -> None:
+        """존재하지 않는 사용자 로그인에서 실제 검증과 같은 비용을 소모"""
+        await self._run(_verify_dummy, password)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS
+)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="pbkdf2 반복 횟수 보정")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="로그인 1회 검증 목표 시간 (밀리초)")
+    args = parser.parse_args(argv)
+
+    rounds = calibrate_rounds(args.target_ms)
+    context = build_pwd_context(rounds)
+    hashed = context.hash("calibration")
+    start = time.perf_counter()
+    context.verify("calibration", hashed)
+    verify_ms = (time.perf_counter() - start) * 1000
+    print(f"PASSWORD_HASH_ROUNDS={rounds}")
+    print(f"검증 {verify_ms:.1f} ms → 코어당 약 {1000 / verify_ms:.0f} 로그인/초 (현재 설정: {settings.PASSWORD_HASH_ROUNDS})")
+    print("설정을 바꾸면 기존 해시는 각 사용자의 다음 로그인 때 새 반복 횟수로 재해싱됩니다.")
+
+
+if __name__ == "__main__":
+    main()
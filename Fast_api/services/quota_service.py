@@ -0,0 +1,95 @@
+"""
+무료 사용자 일일 요청 한도 (LLM 호출 전 예약, 실패 시 환불)
+
+예약은 조건부 UPDATE 한 문장으로 처리해 같은 사용자의 동시 요청도 한도를 넘지 못합니다.
+- 날짜가 바뀌었으면 1로 초기화, 아니면 request_count < daily_limit 인 경우에만 1 증가
+- 예약은 바로 커밋 (LLM 호출 동안 쓰기 락을 잡지 않고, 일정 저장 실패와도 독립)
+- LLM 호출이나 일정 저장이 실패하면 refund로 같은 날의 예약만 되돌림
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from Fast_api.auth.user_cache import UserSnapshot
+from Fast_api.models.user import KST, User
+
+
+@dataclass(frozen=True)
+class QuotaReservation:
+    user_id: int
+    day: date
+    request_count: int  # 예약 후 오늘 사용한 요청 수
+
+
+def today_kst() -> date:
+    return datetime.now(KST).date()
+
+
+async def reserve_request(db: AsyncSession, user: UserSnapshot, today: Optional[date] = None) -> Optional[QuotaReservation]:
+    """
+    무료 사용자의 오늘 요청 1건을 예약합니다. (유료 사용자는 제한 없음)
+
+    Args:
+        db: 기본 DB 세션 (users 테이블)
+        user: 인증된 사용자
+        today: 기준 날짜 (기본: 오늘 KST)
+
+    Returns:
+        Optional[QuotaReservation]: 예약 정보 (유료 사용자는 None)
+
+    Raises:
+        HTTPException: 429 - 오늘 한도를 모두 사용한 경우
+    """
+    if user.paid_user:
+        return None
+    today = today or today_kst()
+    same_day = User.last_reset_date == today
+    result = await db.execute(
+        update(User)
+        .where(
+            User.id == user.id,
+            or_(~same_day, User.last_reset_date.is_(None), func.coalesce(User.request_count, 0) < User.daily_limit)
+        )
+        .values(
+            request_count=case((same_day, func.coalesce(User.request_count, 0) + 1), else_=1),
+            last_reset_date=today
+        )
+        .returning(User.request_count)
+        .execution_options(synchronize_session=False)
+    )
+    request_count = result.scalar_one_or_none()
+    await db.commit()
+    if request_count is None:
+        used, limit = (await db.execute(select(User.request_count, User.daily_limit).where(User.id == user.id))).one()
+        raise HTTPException(
+            status_code=429,
+            detail=f"무료 사용자 일일 요청 한도를 초과했습니다. (오늘: {used}/{limit})"
+        )
+    return QuotaReservation(user_id=user.id, day=today, request_count=request_count)
+
+
+async def refund_request(db: AsyncSession, reservation: Optional[QuotaReservation]) -> None:
+    """예약한 요청 1건을 되돌립니다. (날짜가 이미 바뀌어 초기화된 경우에는 그대로 둠)"""
+    if reservation is None:
+        return
+    await db.execute(
+        update(User)
+        .where(and_(User.id == reservation.user_id, User.last_reset_date == reservation.day, User.request_count > 0))
+        .values(request_count=User.request_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+@asynccontextmanager
+async def refund_on_error(db: AsyncSession, reservation: Optional[QuotaReservation]) -> AsyncIterator[None]:
+    """블록에서 예외(요청 취소 포함)가 나면 예약을 환불하고 예외를 그대로 전달"""
+    try:
+        yield
+    except BaseException:
+        await refund_request(db, reservation)
+        raise
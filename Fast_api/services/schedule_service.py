@@ -1,45 +1,371 @@
+from sqlalchemy import bindparam, case, delete, func, insert, literal, select, tuple_, union_all, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from Fast_api.models.schedule import Schedule
-from Fast_api.schemas.schedule import ScheduleCreate, ScheduleUpdate
-from typing import List, Optional
+from Fast_api.db import write_queue
+from Fast_api.db.types import kst_date
+from Fast_api.models.schedule import Schedule, ScheduleArchive
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleCreate, ScheduleUpdate, BatchOperation, BatchOperationResult
+from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime, date, timedelta
+import base64
+from Fast_api.models.schedule import KST
+
+def get_schedule_version(db: Session, user_id: int) -> int:
+    # PK 단일 행 조회 (목록 쿼리 없이 ETag 비교용)
+    return db.execute(select(User.schedule_version).where(User.id == user_id)).scalar() or 0
+
+def bump_schedule_version(db: Session, user_id: int) -> int:
+    # 호출한 쪽의 트랜잭션 안에서 일정 변경과 함께 커밋됨, 증가된 버전을 반환
+    return db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(schedule_version=User.schedule_version + 1)
+        .returning(User.schedule_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
 
 def create_schedule(db: Session, schedule: ScheduleCreate, user_id: int) -> Schedule:
     db_schedule = Schedule(
         title=schedule.title,
         description=schedule.description,
         scheduled_at=schedule.scheduled_at,
-        user_id=user_id
+        user_id=user_id,
+        version=bump_schedule_version(db, user_id)
     )
     db.add(db_schedule)
     return db_schedule
 
-def get_user_schedules(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Schedule]:
-    return db.query(Schedule).filter(Schedule.user_id == user_id).offset(skip).limit(limit).all()
+def save_schedule(db: Session, schedule: ScheduleCreate, user_id: int) -> Schedule:
+    # 생성 후 커밋까지 수행 (group-commit 큐가 켜져 있으면 writer의 배치 트랜잭션에서 커밋)
+    if write_queue.is_enabled():
+        return write_queue.run(db, lambda session: create_schedule(session, schedule, user_id))
+    db_schedule = create_schedule(db, schedule, user_id)
+    db.commit()
+    db.refresh(db_schedule)
+    return db_schedule
+
+def to_kst_naive(value: datetime) -> datetime:
+    # DB에는 KST 기준 naive datetime이 저장되므로 timezone-aware 값은 KST로 변환 후 tzinfo 제거
+    if value.tzinfo is not None:
+        return value.astimezone(KST).replace(tzinfo=None)
+    return value
+
+def encode_cursor(schedule: Union[Schedule, Row]) -> str:
+    # 클라이언트에는 (scheduled_at, id)를 불투명한 문자열로만 노출
+    raw = f"{schedule.scheduled_at.isoformat()}|{schedule.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    # 형식이 잘못된 커서는 ValueError
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        scheduled_at, schedule_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(scheduled_at), int(schedule_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+# ScheduleResponse 필드와 1:1로 대응하는 컬럼 (목록 조회는 ORM 인스턴스 대신 Row로 반환)
+SCHEDULE_RESPONSE_COLUMNS = (
+    Schedule.id,
+    Schedule.title,
+    Schedule.description,
+    Schedule.scheduled_at,
+    Schedule.is_completed,
+    Schedule.user_id,
+    Schedule.created_at,
+    Schedule.updated_at,
+)
+
+def get_archive_horizon(db: Session, user_id: int) -> Optional[datetime]:
+    # 사용자의 아카이브된 일정 중 가장 늦은 scheduled_at ((user_id, scheduled_at) 인덱스 끝값 seek 한 번)
+    return db.execute(
+        select(func.max(ScheduleArchive.scheduled_at)).where(ScheduleArchive.user_id == user_id)
+    ).scalar()
+
+def _reaches_archive(db: Session, user_id: int, start: Optional[datetime]) -> bool:
+    # 요청 범위의 시작이 아카이브 구간 안이면 콜드 테이블까지 조회
+    horizon = get_archive_horizon(db, user_id)
+    return horizon is not None and (start is None or to_kst_naive(start) <= horizon)
 
-def get_schedule(db: Session, schedule_id: int, user_id: int) -> Optional[Schedule]:
-    return db.query(Schedule).filter(
+def _response_columns(model) -> list:
+    # Schedule / ScheduleArchive 공용 (컬럼 이름이 같음)
+    return [getattr(model, column.key) for column in SCHEDULE_RESPONSE_COLUMNS]
+
+def _list_select(model, user_id: int, start: Optional[datetime], end: Optional[datetime], after: Optional[Tuple[datetime, int]]):
+    stmt = select(*_response_columns(model)).where(model.user_id == user_id, model.deleted_at.is_(None))
+    if start is not None:
+        stmt = stmt.where(model.scheduled_at >= to_kst_naive(start))
+    if end is not None:
+        stmt = stmt.where(model.scheduled_at < to_kst_naive(end))
+    if after is not None:
+        # keyset: 마지막으로 본 (scheduled_at, id) 이후부터 인덱스 seek (OFFSET 스캔 없음)
+        # tuple_ 비교는 우변에 컬럼 타입을 적용하지 않으므로 저장 형식(텍스트/epoch)에 맞춰 명시적으로 바인딩
+        after_scheduled_at, after_id = after
+        stmt = stmt.where(
+            tuple_(model.scheduled_at, model.id) > tuple_(literal(after_scheduled_at, model.scheduled_at.type), after_id)
+        )
+    return stmt
+
+def get_user_schedules(
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None
+) -> List[Row]:
+    # 필요한 컬럼만 select (identity map/ORM 인스턴스 생성 없음), Row는 속성 접근이 가능해 응답 모델에 그대로 사용
+    # (user_id, scheduled_at) 인덱스를 타도록 범위 조건과 정렬을 같은 컬럼으로 구성
+    after = decode_cursor(cursor) if cursor is not None else None
+    stmt = _list_select(Schedule, user_id, start, end, after)
+    if _reaches_archive(db, user_id, start):
+        # 범위가 아카이브 구간에 걸치면 같은 조건의 콜드 테이블 결과와 합쳐서 정렬
+        combined = union_all(stmt, _list_select(ScheduleArchive, user_id, start, end, after)).subquery()
+        stmt = select(combined).order_by(combined.c.scheduled_at, combined.c.id)
+    else:
+        stmt = stmt.order_by(Schedule.scheduled_at, Schedule.id)
+    return db.execute(stmt.offset(skip).limit(limit)).all()
+
+def get_period_range(period: str, anchor: date) -> Tuple[date, date]:
+    # week: anchor가 속한 일요일~토요일 (프론트 주간 요약과 동일), month: anchor가 속한 달
+    if period == "week":
+        start = anchor - timedelta(days=(anchor.weekday() + 1) % 7)
+        return start, start + timedelta(days=7)
+    if period == "month":
+        start = anchor.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return start, end
+    raise ValueError(f"Unsupported period: {period}")
+
+def get_daily_summary(db: Session, user_id: int, start: date, end: date) -> List[Tuple[date, int, int]]:
+    # 저장 형식(텍스트/epoch)에 맞춰 KST 기준 날짜로 그룹화
+    start_at = datetime.combine(start, datetime.min.time())
+    end_at = datetime.combine(end, datetime.min.time())
+
+    def period_rows(model):
+        return select(model.scheduled_at, model.is_completed).where(
+            model.user_id == user_id,
+            model.deleted_at.is_(None),
+            model.scheduled_at >= start_at,
+            model.scheduled_at < end_at
+        )
+
+    source = period_rows(Schedule)
+    if _reaches_archive(db, user_id, start_at):
+        source = union_all(source, period_rows(ScheduleArchive))
+    source = source.subquery()
+    day = kst_date(source.c.scheduled_at).label("day")
+    rows = db.execute(
+        select(
+            day,
+            func.count(),
+            func.sum(case((source.c.is_completed.is_(True), 1), else_=0))
+        ).group_by(day).order_by(day)
+    ).all()
+    return [(date.fromisoformat(d), total, completed or 0) for d, total, completed in rows]
+
+def get_schedule(db: Session, schedule_id: int, user_id: int) -> Optional[Union[Schedule, ScheduleArchive]]:
+    schedule = db.query(Schedule).filter(
         Schedule.id == schedule_id,
-        Schedule.user_id == user_id
+        Schedule.user_id == user_id,
+        Schedule.deleted_at.is_(None)
     ).first()
+    if schedule is None:
+        # hot 테이블에 없으면 아카이브에서 조회 (응답 필드는 동일)
+        schedule = db.query(ScheduleArchive).filter(
+            ScheduleArchive.id == schedule_id,
+            ScheduleArchive.user_id == user_id,
+            ScheduleArchive.deleted_at.is_(None)
+        ).first()
+    return schedule
 
-def update_schedule(db: Session, schedule_id: int, user_id: int, schedule_update: ScheduleUpdate) -> Optional[Schedule]:
-    db_schedule = get_schedule(db, schedule_id, user_id)
-    if not db_schedule:
-        return None
+def get_schedule_changes(db: Session, user_id: int, since: int) -> Tuple[List[Row], List[int]]:
+    # since=0은 최초 동기화: 살아있는 일정 전체 (기존 행은 version=0일 수 있음)
+    # 아카이브로 옮겨진 행도 버전을 유지하므로 같은 조건으로 함께 조회
+    def changed_rows(model):
+        stmt = select(*_response_columns(model), model.deleted_at, model.version).where(model.user_id == user_id)
+        if since == 0:
+            return stmt.where(model.deleted_at.is_(None))
+        return stmt.where(model.version > since)
+
+    combined = union_all(changed_rows(Schedule), changed_rows(ScheduleArchive)).subquery()
+    changed, deleted = [], []
+    for row in db.execute(select(combined).order_by(combined.c.version, combined.c.id)):
+        if row.deleted_at is None:
+            changed.append(row)
+        else:
+            deleted.append(row.id)
+    return changed, deleted
+
+ARCHIVE_COLUMN_NAMES = [column.name for column in ScheduleArchive.__table__.columns]
 
+def _restore_archived(db: Session, user_id: int, schedule_ids: List[int]) -> List[int]:
+    # 수정/삭제 대상이 아카이브에 있으면 schedules로 되돌림 (id 유지, 커밋은 호출한 쪽에서)
+    restored = db.execute(
+        select(ScheduleArchive.id).where(ScheduleArchive.user_id == user_id, ScheduleArchive.id.in_(schedule_ids))
+    ).scalars().all()
+    if restored:
+        archive = ScheduleArchive.__table__
+        db.execute(
+            insert(Schedule.__table__).from_select(
+                ARCHIVE_COLUMN_NAMES,
+                select(*(archive.c[name] for name in ARCHIVE_COLUMN_NAMES)).where(archive.c.id.in_(restored))
+            )
+        )
+        db.execute(delete(archive).where(archive.c.id.in_(restored)))
+    return restored
+
+def _next_version(user_id: int):
+    # 행에 기록할 버전 (users.schedule_version + 1) 을 같은 UPDATE 문 안에서 계산, 이후 bump_schedule_version으로 맞춤
+    return select(User.schedule_version + 1).where(User.id == user_id).scalar_subquery()
+
+def _update_schedule_row(db: Session, schedule_id: int, user_id: int, schedule_update: ScheduleUpdate) -> Optional[Schedule]:
+    # UPDATE ... WHERE id AND user_id RETURNING: 조회/갱신/refresh를 한 문장으로 (커밋은 호출한 쪽에서)
     update_data = schedule_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_schedule, field, value)
+    stmt = (
+        update(Schedule)
+        .where(
+            Schedule.id == schedule_id,
+            Schedule.user_id == user_id,
+            Schedule.deleted_at.is_(None)
+        )
+        .values(version=_next_version(user_id), **update_data)
+        .returning(Schedule)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    db_schedule = db.execute(stmt).scalar_one_or_none()
+    if db_schedule is None and _restore_archived(db, user_id, [schedule_id]):
+        db_schedule = db.execute(stmt).scalar_one_or_none()
+    if db_schedule is not None:
+        bump_schedule_version(db, user_id)
+    return db_schedule
 
+def update_schedule(db: Session, schedule_id: int, user_id: int, schedule_update: ScheduleUpdate) -> Optional[Schedule]:
+    # 없으면 None -> 404
+    if write_queue.is_enabled():
+        return write_queue.run(db, lambda session: _update_schedule_row(session, schedule_id, user_id, schedule_update))
+    db_schedule = _update_schedule_row(db, schedule_id, user_id, schedule_update)
+    if db_schedule is None:
+        db.rollback()
+        return None
+
+    # RETURNING으로 채운 값이 커밋 시 expire되어 다시 SELECT되지 않도록 세션에서 분리
+    db.expunge(db_schedule)
     db.commit()
-    db.refresh(db_schedule)
     return db_schedule
 
-def delete_schedule(db: Session, schedule_id: int, user_id: int) -> bool:
-    db_schedule = get_schedule(db, schedule_id, user_id)
-    if not db_schedule:
+def _delete_schedule_row(db: Session, schedule_id: int, user_id: int) -> bool:
+    # 행을 지우지 않고 tombstone으로 남겨 /schedules/changes에서 삭제를 전달 (UPDATE ... RETURNING id)
+    stmt = (
+        update(Schedule.__table__)
+        .where(
+            Schedule.id == schedule_id,
+            Schedule.user_id == user_id,
+            Schedule.deleted_at.is_(None)
+        )
+        .values(deleted_at=datetime.now(KST), version=_next_version(user_id))
+        .returning(Schedule.id)
+    )
+    deleted_id = db.execute(stmt).scalar_one_or_none()
+    if deleted_id is None and _restore_archived(db, user_id, [schedule_id]):
+        deleted_id = db.execute(stmt).scalar_one_or_none()
+    if deleted_id is None:
         return False
+    bump_schedule_version(db, user_id)
+    return True
 
-    db.delete(db_schedule)
+def delete_schedule(db: Session, schedule_id: int, user_id: int) -> bool:
+    if write_queue.is_enabled():
+        return write_queue.run(db, lambda session: _delete_schedule_row(session, schedule_id, user_id))
+    if not _delete_schedule_row(db, schedule_id, user_id):
+        db.rollback()
+        return False
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+class DuplicateBatchIdError(ValueError):
+    """배치에서 같은 일정 id를 여러 작업이 참조한 경우"""
+
+def apply_schedule_batch(db: Session, user_id: int, operations: List[BatchOperation]) -> Tuple[int, List[BatchOperationResult]]:
+    """
+    create/update/delete/complete 작업을 종류별 집합 연산으로 묶어 한 트랜잭션(커밋 1회)에 적용합니다.
+    같은 id를 여러 작업에서 참조하면 DuplicateBatchIdError. 커밋은 호출한 쪽에서 수행합니다.
+    """
+    target_ids = [op.id for op in operations if op.op != "create"]
+    if len(target_ids) != len(set(target_ids)):
+        raise DuplicateBatchIdError("Duplicate schedule id in batch")
+
+    # 대상 존재 여부는 SELECT 한 번으로 확인
+    existing = set()
+    if target_ids:
+        existing = set(db.execute(
+            select(Schedule.id).where(
+                Schedule.user_id == user_id,
+                Schedule.deleted_at.is_(None),
+                Schedule.id.in_(target_ids)
+            )
+        ).scalars())
+        missing = set(target_ids) - existing
+        if missing:
+            existing.update(_restore_archived(db, user_id, list(missing)))
+
+    has_changes = any(op.op == "create" or op.id in existing for op in operations)
+    version = bump_schedule_version(db, user_id) if has_changes else get_schedule_version(db, user_id)
+    table = Schedule.__table__
+    now = datetime.now(KST)
+
+    # create: executemany INSERT ... RETURNING id (입력 순서 보장)
+    creates = [op for op in operations if op.op == "create"]
+    created_ids = []
+    if creates:
+        created_ids = db.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            [{
+                "title": op.schedule.title,
+                "description": op.schedule.description,
+                "scheduled_at": op.schedule.scheduled_at,
+                "user_id": user_id,
+                "version": version,
+            } for op in creates]
+        ).scalars().all()
+
+    # delete / complete: 같은 값으로 바뀌는 id들을 UPDATE ... WHERE id IN (...) 한 번으로 처리
+    grouped: Dict[tuple, List[int]] = {}
+    for op in operations:
+        if op.op == "delete" and op.id in existing:
+            grouped.setdefault((("deleted_at", now),), []).append(op.id)
+        elif op.op == "complete" and op.id in existing:
+            grouped.setdefault((("is_completed", op.is_completed),), []).append(op.id)
+    for values, ids in grouped.items():
+        db.execute(
+            update(table)
+            .where(table.c.id.in_(ids))
+            .values(version=version, updated_at=now, **dict(values))
+        )
+
+    # update: 변경 필드 조합이 같은 작업끼리 executemany
+    update_groups: Dict[frozenset, List[dict]] = {}
+    for op in operations:
+        if op.op == "update" and op.id in existing:
+            changes = op.changes.model_dump(exclude_unset=True)
+            update_groups.setdefault(frozenset(changes), []).append({"_id": op.id, **changes})
+    for fields, params in update_groups.items():
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(version=version, updated_at=now, **{field: bindparam(field) for field in fields}),
+            params
+        )
+
+    created_iter = iter(created_ids)
+    results = []
+    for op in operations:
+        if op.op == "create":
+            results.append(BatchOperationResult(op=op.op, id=next(created_iter), status="ok"))
+        else:
+            results.append(BatchOperationResult(op=op.op, id=op.id, status="ok" if op.id in existing else "not_found"))
+    return version, results
+
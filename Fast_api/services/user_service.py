@@ -1,11 +1,8 @@
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from Fast_api.core.security import pwd_context
 from Fast_api.models.user import User
 from Fast_api.schemas.user import UserCreate, UserSchema
 
-# bcrypt 대신 pbkdf2_sha256 사용 (Python 내장 라이브러리 기반으로 안정적)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
-
 def get_user_by(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
 
@@ -3,9 +3,13 @@ pytest 설정 및 공통 fixture 정의
 """
 import pytest
 import os
+import shutil
+import tempfile
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from passlib.context import CryptContext
 
 # 테스트용 환경 변수 설정 (import 전에 먼저 설정)
@@ -17,11 +21,14 @@ os.environ["ENVIRONMENT"] = "testing"
 os.environ["model_name"] = "test-model"
 os.environ["provider"] = "test-provider"
 os.environ["api_key"] = "test-api-key"
+# rate limit 카운터는 개발용 rate_limits.db 대신 테스트 세션 전용 임시 디렉토리에 저장 (세션 종료 시 삭제)
+RATE_LIMIT_DIR = tempfile.mkdtemp(prefix="test_rate_limits_")
+os.environ["RATE_LIMIT_STORAGE_URI"] = "sqlite:///" + os.path.join(RATE_LIMIT_DIR, "rate_limits.db")
 
 # 이제 app import (환경 변수 설정 후)
 from Fast_api.main import app
 from Fast_api.db.base_class import Base
-from Fast_api.db.session import get_db
+from Fast_api.db.session import get_db, get_async_db
 from Fast_api.models.user import User
 from Fast_api.models.schedule import Schedule
 
@@ -40,9 +47,42 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 엔드포인트용 (같은 테스트 DB 파일, TestClient마다 이벤트 루프가 달라 커넥션 풀 미사용)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def rate_limit_storage_dir():
+    """테스트 세션이 끝나면 rate limit 카운터 파일(-wal/-shm 포함) 삭제"""
+    yield
+    shutil.rmtree(RATE_LIMIT_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """
+    공유 Limiter의 카운터를 테스트마다 초기화 (테스트 간 요청 수 누적 방지)
+    """
+    from Fast_api.core.rate_limit import limiter
+    limiter.reset()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_caches():
+    """
+    인증 사용자/토큰 캐시 초기화 (테스트마다 DB를 다시 만들어 같은 username의 id/권한이 달라질 수 있음)
+    """
+    from Fast_api.auth.token_cache import token_cache
+    from Fast_api.auth.user_cache import user_cache
+    user_cache.clear()
+    token_cache.clear()
+    yield
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """
@@ -68,7 +108,12 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -159,6 +159,187 @@ class TestJWT:
         assert "Refresh token이 없습니다" in response.json()["detail"]
 
 
+class TestUserCache:
+    """인증 사용자 스냅샷 캐시 테스트"""
+
+    def test_repeated_requests_use_cache(self, client, auth_headers):
+        """같은 사용자의 두 번째 요청부터는 DB 조회 없이 캐시 사용"""
+        from Fast_api.auth.user_cache import user_cache
+        before = dict(user_cache.stats)
+        assert client.get("/api/schedules", headers=auth_headers).status_code == 200
+        assert client.get("/api/schedules", headers=auth_headers).status_code == 200
+        assert user_cache.stats["misses"] - before["misses"] == 1
+        assert user_cache.stats["hits"] - before["hits"] == 1
+
+    def test_orm_update_invalidates(self, client, auth_headers, db_session, test_user):
+        """User 행을 수정하면 캐시 항목이 제거되고 다음 요청에서 새 값을 읽음"""
+        from Fast_api.auth.user_cache import user_cache
+        client.get("/api/schedules", headers=auth_headers)
+        assert user_cache.get("testuser").paid_user is False
+
+        test_user.paid_user = True
+        db_session.commit()
+        assert user_cache.get("testuser") is None
+
+        client.get("/api/schedules", headers=auth_headers)
+        assert user_cache.get("testuser").paid_user is True
+
+    def test_invalidated_after_commit_not_flush(self, db_session, test_user):
+        """flush와 commit 사이에 이전 값이 다시 캐시되어도 commit 후에는 제거, rollback이면 기록만 버림"""
+        from Fast_api.auth.user_cache import UserSnapshot, user_cache
+        stale = UserSnapshot.from_user(test_user)
+
+        test_user.paid_user = True
+        db_session.flush()
+        # commit 전 다른 요청이 아직 커밋되지 않은 행 대신 이전 값을 캐시한 상황
+        user_cache.put(stale)
+        assert user_cache.get("testuser") == stale
+
+        db_session.commit()
+        assert user_cache.get("testuser") is None
+
+        test_user.paid_user = False
+        db_session.flush()
+        db_session.rollback()
+        user_cache.put(UserSnapshot.from_user(test_user))
+        db_session.commit()
+        assert user_cache.get("testuser").paid_user is True
+
+    def test_lru_eviction_and_ttl(self, monkeypatch):
+        """최대 개수를 넘으면 가장 오래 쓰지 않은 항목부터 제거, TTL이 지나면 미스"""
+        from Fast_api.auth import user_cache as user_cache_module
+        from Fast_api.auth.user_cache import UserCache, UserSnapshot
+        now = [1000.0]
+        monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: now[0])
+        cache = UserCache(max_size=2, ttl=10)
+        for i in (1, 2):
+            cache.put(UserSnapshot(id=i, username=f"u{i}", paid_user=False, daily_limit=10))
+        assert cache.get("u1").id == 1  # u2가 가장 오래 쓰지 않은 항목
+        cache.put(UserSnapshot(id=3, username="u3", paid_user=False, daily_limit=10))
+        assert cache.get("u2") is None and cache.stats["evictions"] == 1
+
+        now[0] += 11
+        assert cache.get("u1") is None and len(cache) == 1
+
+
+class TestTokenCache:
+    """검증된 JWT 메모이제이션 테스트"""
+
+    def test_repeated_verification_uses_cache(self, test_user):
+        """같은 토큰의 두 번째 검증부터는 캐시된 페이로드 반환"""
+        from Fast_api.auth.jwt_handle import create_access_token, verify_token
+        from Fast_api.auth.token_cache import token_cache
+        token = create_access_token("testuser")
+        first = verify_token(token)
+        hits = token_cache.stats["hits"]
+        assert verify_token(token) == first and first["sub"] == "testuser"
+        assert token_cache.stats["hits"] == hits + 1
+
+    def test_expired_payload_is_never_returned(self, monkeypatch):
+        """exp가 지난 항목은 캐시에 있어도 반환하지 않고 제거"""
+        from Fast_api.auth import token_cache as token_cache_module
+        from Fast_api.auth.token_cache import TokenCache
+        cache = TokenCache(max_size=8)
+        now = [1_000_000.0]
+        monkeypatch.setattr(token_cache_module.time, "time", lambda: now[0])
+        cache.put("token", {"sub": "testuser", "exp": 1_000_010})
+        assert cache.get("token")["sub"] == "testuser"
+        now[0] = 1_000_010
+        assert cache.get("token") is None and len(cache) == 0
+
+    def test_invalid_token_is_not_cached(self, client):
+        """검증에 실패한 토큰은 캐시하지 않음"""
+        from Fast_api.auth.token_cache import token_cache
+        for _ in range(2):
+            response = client.get("/api/schedules", headers={"Authorization": "Bearer invalid_token_here"})
+            assert response.status_code == 401
+        assert len(token_cache) == 0
+
+    def test_cache_is_bounded(self):
+        """최대 개수를 넘으면 가장 오래 쓰지 않은 토큰부터 제거"""
+        from Fast_api.auth.token_cache import TokenCache
+        cache = TokenCache(max_size=2)
+        exp = int(time.time()) + 60
+        for name in ("a", "b", "c"):
+            cache.put(name, {"sub": name, "exp": exp})
+        assert cache.get("a") is None and cache.get("c")["sub"] == "c"
+        assert len(cache) == 2 and cache.stats["evictions"] == 1
+
+
+class TestPasswordHasher:
+    """비밀번호 해싱 프로세스 풀 테스트"""
+
+    def test_hash_and_verify_in_pool(self):
+        """풀에서 만든 해시를 풀에서 검증"""
+        import asyncio
+        from Fast_api.services.password_service import password_hasher
+
+        async def round_trip():
+            hashed = await password_hasher.hash("poolpassword")
+            return await password_hasher.verify("poolpassword", hashed), await password_hasher.verify("wrong", hashed)
+
+        completed = password_hasher.stats["completed"]
+        assert asyncio.run(round_trip()) == (True, False)
+        assert password_hasher.stats["completed"] == completed + 3
+        assert password_hasher.stats["in_flight"] == 0
+
+    def test_saturated_pool_returns_503(self, client, test_user, monkeypatch):
+        """대기 작업이 한도에 도달하면 해싱 없이 503 + Retry-After"""
+        from Fast_api.services.password_service import password_hasher
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+        rejected = password_hasher.stats["rejected"]
+
+        response = client.post("/api/login", json={"username": "testuser", "password": "testpassword123"})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(password_hasher.retry_after)
+        assert password_hasher.stats["rejected"] == rejected + 1
+
+    def test_saturated_pool_signup_returns_503(self, client, monkeypatch):
+        """회원가입도 해싱 풀 포화 시 중복 사용자 400이 아닌 503 + Retry-After"""
+        from Fast_api.services.password_service import password_hasher
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+        response = client.post(
+            "/api/signup",
+            json={"username": "busyuser", "email": "busy@example.com", "password": "securepassword123"}
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(password_hasher.retry_after)
+
+
+class TestPasswordRehash:
+    """pbkdf2 반복 횟수 보정 / 로그인 시 재해싱 테스트"""
+
+    def test_login_upgrades_outdated_hash(self, client, db_session):
+        """반복 횟수가 설정과 다른 해시는 로그인 성공 시 현재 설정으로 재해싱"""
+        from Fast_api.core.config import settings
+        from Fast_api.core.security import build_pwd_context
+        from Fast_api.models.user import User
+        user = User(
+            username="legacyhash", email="legacy@example.com",
+            hashed_password=build_pwd_context(10000).hash("legacypassword")
+        )
+        db_session.add(user)
+        db_session.commit()
+
+        response = client.post("/api/login", json={"username": "legacyhash", "password": "legacypassword"})
+        assert response.status_code == 200
+        db_session.refresh(user)
+        assert user.hashed_password.startswith(f"$pbkdf2-sha256${settings.PASSWORD_HASH_ROUNDS}$")
+
+        # 새 해시로 다시 로그인 가능
+        response = client.post("/api/login", json={"username": "legacyhash", "password": "legacypassword"})
+        assert response.status_code == 200
+
+    def test_calibrate_rounds(self):
+        """목표 시간에 비례한 반복 횟수 (1000 단위), 기존 기본값 미만으로는 내려가지 않음"""
+        from Fast_api.core.security import DEFAULT_PBKDF2_ROUNDS
+        from Fast_api.services.password_service import calibrate_rounds
+        assert calibrate_rounds(0.001, probe_rounds=2000, samples=1) == DEFAULT_PBKDF2_ROUNDS
+        rounds = calibrate_rounds(2000, probe_rounds=2000, samples=1)
+        assert rounds > DEFAULT_PBKDF2_ROUNDS and rounds % 1000 == 0
+
+
 class TestLogout:
     """로그아웃 테스트"""
 
@@ -202,3 +383,113 @@ class TestRateLimiting:
                 data = response.json()
                 assert "요청 제한 초과" in data["error"]
                 assert "retry_after_seconds" in data
+
+
+class TestSharedRateLimitStorage:
+    """워커 간 공유 rate limit 저장소 (SQLite) 테스트"""
+
+    @pytest.fixture
+    def storage_uri(self, tmp_path):
+        return f"sqlite:///{tmp_path / 'rate_limits.db'}"
+
+    def test_limit_shared_between_workers(self, storage_uri):
+        """같은 파일을 쓰는 두 저장소(워커)가 한도를 나눠 쓰는지"""
+        from limits import parse
+        from limits.strategies import SlidingWindowCounterRateLimiter
+        from Fast_api.core.rate_limit import SQLiteStorage
+
+        worker_a = SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri))
+        worker_b = SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri))
+        item = parse("4/minute")
+
+        results = [worker.hit(item, "127.0.0.1") for worker in (worker_a, worker_b) * 3]
+        assert results == [True, True, True, True, False, False]
+        assert worker_a.get_window_stats(item, "127.0.0.1").remaining == 0
+        # 다른 키는 영향 없음
+        assert worker_b.hit(item, "10.0.0.1")
+
+    def test_concurrent_hits_do_not_exceed_limit(self, storage_uri):
+        """여러 스레드가 동시에 요청해도 한도만큼만 통과"""
+        from concurrent.futures import ThreadPoolExecutor
+        from limits import parse
+        from limits.strategies import SlidingWindowCounterRateLimiter
+        from Fast_api.core.rate_limit import SQLiteStorage
+
+        limiters = [SlidingWindowCounterRateLimiter(SQLiteStorage(storage_uri)) for _ in range(4)]
+        item = parse("10/minute")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: limiters[i % 4].hit(item, "key"), range(40)))
+        assert results.count(True) == 10
+
+    def test_incr_and_reset(self, storage_uri):
+        """고정 창 카운터 증가 / 만료 시각 / 초기화"""
+        from Fast_api.core.rate_limit import SQLiteStorage
+
+        storage = SQLiteStorage(storage_uri)
+        assert storage.incr("counter", 60) == 1
+        assert storage.incr("counter", 60, amount=2) == 3
+        assert storage.get("counter") == 3
+        assert storage.get_expiry("counter") > time.time()
+        assert storage.check()
+
+        storage.clear("counter")
+        assert storage.get("counter") == 0
+        storage.incr("counter", 60)
+        assert storage.reset() == 1
+        assert storage.get("counter") == 0
+
+
+class TestUserRateLimitKey:
+    """토큰 기반 사용자별 rate limit 키 테스트"""
+
+    @staticmethod
+    def make_request(headers=None, client_ip="10.0.0.1"):
+        from starlette.requests import Request
+        raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+        return Request({"type": "http", "headers": raw_headers, "client": (client_ip, 1234)})
+
+    def test_key_from_token_without_db(self):
+        """토큰의 sub / paid_user 클레임으로 키 생성 (DB에 없는 사용자도 DB 조회 없이 키 생성)"""
+        from Fast_api.auth.jwt_handle import create_access_token
+        from Fast_api.core.rate_limit import user_key
+
+        free = create_access_token("nobody")
+        paid = create_access_token("vip", paid_user=True)
+        assert user_key(self.make_request({"Authorization": f"Bearer {free}"})) == "user:nobody"
+        assert user_key(self.make_request({"Authorization": f"Bearer {paid}"})) == "paid:vip"
+        # 같은 사용자는 IP가 달라도 같은 키
+        assert user_key(self.make_request({"Authorization": f"Bearer {free}"}, client_ip="10.0.0.2")) == "user:nobody"
+
+    def test_ip_fallback(self):
+        """토큰이 없거나 유효하지 않으면 클라이언트 IP"""
+        from Fast_api.core.rate_limit import user_key
+
+        assert user_key(self.make_request()) == "10.0.0.1"
+        assert user_key(self.make_request({"Authorization": "Bearer invalid_token_here"})) == "10.0.0.1"
+        assert user_key(self.make_request({"Authorization": "Basic abc"})) == "10.0.0.1"
+
+    def test_tiered_limit(self):
+        """키 등급에 따라 한도 선택 (IP 키는 무료 한도)"""
+        from Fast_api.core.rate_limit import tiered_limit
+
+        provider = tiered_limit(free="20/minute", paid="60/minute")
+        assert provider("user:testuser") == "20/minute"
+        assert provider("10.0.0.1") == "20/minute"
+        assert provider("paid:testuser") == "60/minute"
+
+    def test_paid_user_claim_issued(self, client, test_user, db_session):
+        """로그인 / refresh 시 현재 유료 여부가 access token에 들어가는지"""
+        from Fast_api.auth.jwt_handle import verify_token
+
+        login_response = client.post(
+            "/api/login",
+            json={"username": "testuser", "password": "testpassword123"}
+        )
+        assert verify_token(login_response.json()["access_token"])["paid_user"] is False
+
+        test_user.paid_user = True
+        db_session.commit()
+
+        refresh_response = client.post("/api/refresh")
+        assert refresh_response.status_code == 200
+        assert verify_token(refresh_response.json()["access_token"])["paid_user"] is True
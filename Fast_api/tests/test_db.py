@@ -0,0 +1,394 @@
+"""
+데이터베이스 엔진/스키마 관련 테스트
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import column, inspect, select, text
+
+from Fast_api.core.config import settings
+from Fast_api.db import migrations, shards
+from Fast_api.db.base_class import Base
+from Fast_api.db.rebalance_shards import rebalance
+from Fast_api.db.engine_profile import create_sqlite_engine, create_async_sqlite_engine
+from Fast_api.db.migrate_timestamps import convert_timestamps
+from Fast_api.db.types import EpochDateTime, kst_date
+from Fast_api.db.write_queue import GroupCommitWriter
+from Fast_api.models.schedule import Schedule
+from Fast_api.models.user import User
+from Fast_api.schemas.schedule import ScheduleCreate
+from Fast_api.services import schedule_service
+
+
+class TestSQLiteEngineProfile:
+    """SQLite 엔진 프로파일(PRAGMA, 풀 설정) 테스트"""
+
+    def test_sync_engine_pragmas(self, tmp_path):
+        """새 커넥션마다 WAL/synchronous/busy_timeout/cache_size 적용"""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+                assert conn.execute(text("PRAGMA cache_size")).scalar() == -16384
+                # 성능 프로파일은 FK 제약 동작을 바꾸지 않음 (SQLite 기본값 OFF 유지)
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 0
+            assert engine.pool.size() == 5
+        finally:
+            engine.dispose()
+
+    def test_async_engine_pragmas(self, tmp_path):
+        """aiosqlite 엔진에도 동일한 PRAGMA 적용"""
+        async def read_pragmas():
+            async_engine = create_async_sqlite_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+            try:
+                async with async_engine.connect() as conn:
+                    journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                    busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+                return journal_mode, busy_timeout
+            finally:
+                await async_engine.dispose()
+
+        assert asyncio.run(read_pragmas()) == ("wal", 5000)
+
+
+class TestGroupCommitWriter:
+    """group-commit 쓰기 큐 테스트"""
+
+    @pytest.fixture
+    def writer(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'queue.db'}"
+        engine = create_sqlite_engine(url)
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert().values(id=1, username="writer", email="w@example.com", hashed_password="x"))
+        engine.dispose()
+        # 동시 제출이 한 배치로 모이도록 대기 시간을 넉넉히
+        writer = GroupCommitWriter(url, max_batch=64, max_delay=0.05)
+        yield writer
+        writer.close()
+
+    @staticmethod
+    def create(title):
+        return lambda db: schedule_service.create_schedule(
+            db, ScheduleCreate(title=title, scheduled_at=datetime(2025, 10, 20, 9)), 1
+        )
+
+    def test_concurrent_writes_share_commit(self, writer):
+        """동시에 들어온 쓰기를 적은 수의 트랜잭션으로 커밋하고 각자 결과를 반환"""
+        start = threading.Barrier(20)
+        results = [None] * 20
+
+        def worker(i):
+            start.wait()
+            results[i] = writer.submit(self.create(f"일정 {i}")).result()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert [s.title for s in results] == [f"일정 {i}" for i in range(20)]
+        assert len({s.id for s in results}) == 20
+        # 사용자 버전은 작업마다 증가 (같은 배치 안에서도 순서대로)
+        assert sorted(s.version for s in results) == list(range(1, 21))
+        assert writer.stats["operations"] == 20
+        assert writer.stats["batches"] < 20
+
+    def test_failed_write_does_not_abort_batch(self, writer):
+        """한 작업의 예외는 그 호출자에게만 전달되고 같은 배치의 다른 작업은 커밋"""
+        def failing(db):
+            schedule_service.create_schedule(
+                db, ScheduleCreate(title="실패", scheduled_at=datetime(2025, 10, 20, 9)), 1
+            )
+            db.flush()
+            raise RuntimeError("boom")
+
+        futures = [writer.submit(self.create("앞")), writer.submit(failing), writer.submit(self.create("뒤"))]
+
+        assert futures[0].result().title == "앞"
+        with pytest.raises(RuntimeError):
+            futures[1].result()
+        assert futures[2].result().title == "뒤"
+
+        check = writer.submit(lambda db: db.execute(select(Schedule.title).order_by(Schedule.id)).scalars().all())
+        assert check.result() == ["앞", "뒤"]
+
+    def test_close_rejects_new_writes(self, writer):
+        """close() 이후 제출하면 RuntimeError"""
+        assert writer.submit(self.create("마지막")).result().id is not None
+        writer.close()
+        with pytest.raises(RuntimeError):
+            writer.submit(self.create("거부"))
+
+    def test_batch_failure_resolves_every_future(self, writer, monkeypatch):
+        """세션 생성이 실패해도 배치의 모든 호출자에게 예외 전달 (무기한 대기 없음)"""
+        def broken_session_factory():
+            raise RuntimeError("no session")
+
+        monkeypatch.setattr(writer, "_session_factory", broken_session_factory)
+        futures = [writer.submit(self.create(f"일정 {i}")) for i in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="no session"):
+                future.result(timeout=5)
+
+    @staticmethod
+    def slow(seconds, write):
+        def run(db):
+            time.sleep(seconds)
+            return write(db)
+        return run
+
+    @staticmethod
+    def titles(writer):
+        with writer._session_factory() as db:
+            return [s.title for s in db.query(Schedule).all()]
+
+    def test_run_cancels_write_not_started(self, writer, monkeypatch):
+        """시작 전에 대기 시간을 넘긴 작업은 취소되고 반영되지 않음 (WriteNotAppliedError)"""
+        from Fast_api.db import write_queue
+
+        url = writer._engine.url.render_as_string(hide_password=False)
+        monkeypatch.setitem(write_queue._writers, url, writer)
+        monkeypatch.setattr(settings, "WRITE_QUEUE_RESULT_TIMEOUT_SECONDS", 0.05)
+        release = threading.Event()
+        blocked = writer.submit(lambda db: release.wait(5))
+
+        session = writer._session_factory()
+        try:
+            with pytest.raises(write_queue.WriteNotAppliedError):
+                write_queue.run(session, self.create("늦은 작업"))
+        finally:
+            release.set()
+            session.close()
+        assert blocked.result(timeout=5) is True
+        assert self.titles(writer) == []
+
+    def test_run_waits_for_running_batch(self, writer, monkeypatch):
+        """이미 실행 중인 느린 작업은 버리지 않고 배치가 끝날 때까지 기다려 결과 반환"""
+        from Fast_api.db import write_queue
+
+        url = writer._engine.url.render_as_string(hide_password=False)
+        monkeypatch.setitem(write_queue._writers, url, writer)
+        monkeypatch.setattr(settings, "WRITE_QUEUE_RESULT_TIMEOUT_SECONDS", 0.2)
+
+        session = writer._session_factory()
+        try:
+            schedule_id = write_queue.run(session, self.slow(0.3, self.create("느린 작업")))
+        finally:
+            session.close()
+        assert schedule_id is not None
+        assert self.titles(writer) == ["느린 작업"]
+
+    def test_run_outcome_unknown_when_running_batch_overruns(self, writer, monkeypatch):
+        """실행 중인 배치가 추가 대기 후에도 끝나지 않으면 WriteOutcomeUnknownError (작업은 그대로 커밋됨)"""
+        from Fast_api.db import write_queue
+
+        url = writer._engine.url.render_as_string(hide_password=False)
+        monkeypatch.setitem(write_queue._writers, url, writer)
+        monkeypatch.setattr(settings, "WRITE_QUEUE_RESULT_TIMEOUT_SECONDS", 0.2)
+        release = threading.Event()
+
+        def stalled(db):
+            release.wait(5)
+            return self.create("멈춘 작업")(db)
+
+        session = writer._session_factory()
+        try:
+            with pytest.raises(write_queue.WriteOutcomeUnknownError):
+                write_queue.run(session, stalled)
+        finally:
+            release.set()
+            session.close()
+        writer.submit(lambda db: None).result(timeout=5)
+        assert self.titles(writer) == ["멈춘 작업"]
+
+
+class TestScheduleShards:
+    """사용자별 일정 샤딩 / 재분배 테스트"""
+
+    @pytest.fixture
+    def sharded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "SCHEDULE_SHARD_COUNT", 2)
+        monkeypatch.setattr(settings, "SCHEDULE_SHARD_DIR", str(tmp_path))
+        yield tmp_path
+        shards.dispose_shards()
+
+    def test_jump_hash_moves_only_to_new_shard(self):
+        """샤드를 4 → 5개로 늘리면 이동하는 사용자는 모두 새 샤드(4)로만 이동"""
+        before = {uid: shards.jump_hash(uid, 4) for uid in range(1, 2001)}
+        after = {uid: shards.jump_hash(uid, 5) for uid in range(1, 2001)}
+        moved = [uid for uid in before if before[uid] != after[uid]]
+        assert all(after[uid] == 4 for uid in moved)
+        assert 300 < len(moved) < 500  # 약 1/5
+        assert set(before.values()) == {0, 1, 2, 3}
+
+    def test_shard_sessions_use_disjoint_id_ranges(self, sharded):
+        """사용자는 해시된 샤드에 저장되고 샤드마다 일정 id 구간이 다름"""
+        created = {}
+        for user_id in range(1, 9):
+            db = shards.shard_session(user_id)
+            try:
+                schedule = schedule_service.save_schedule(
+                    db, ScheduleCreate(title=f"u{user_id}", scheduled_at=datetime(2025, 10, 20, 9)), user_id
+                )
+                created[user_id] = schedule.id
+            finally:
+                db.close()
+
+        for user_id, schedule_id in created.items():
+            index = shards.shard_for_user(user_id)
+            assert (index + 1) * shards.SHARD_ID_SPAN < schedule_id < (index + 2) * shards.SHARD_ID_SPAN
+        assert (sharded / "schedules_shard_0.db").exists() and (sharded / "schedules_shard_1.db").exists()
+
+    def test_rebalance_keeps_ids_and_bumps_version(self, sharded):
+        """2 → 3개로 재분배 후 모든 일정이 새 위치에 같은 id로 존재하고 옮긴 사용자의 버전이 증가"""
+        created = {}
+        for user_id in range(1, 13):
+            db = shards.shard_session(user_id)
+            try:
+                created[user_id] = schedule_service.save_schedule(
+                    db, ScheduleCreate(title=f"u{user_id}", scheduled_at=datetime(2025, 10, 20, 9)), user_id
+                ).id
+            finally:
+                db.close()
+        shards.dispose_shards()
+
+        stats = rebalance(3, str(sharded))
+        moved = [uid for uid in created if shards.jump_hash(uid, 3) != shards.jump_hash(uid, 2)]
+        assert moved and stats["users"] == len(moved) and stats["rekeyed"] == 0
+
+        engines = [create_sqlite_engine(f"sqlite:///{sharded / f'schedules_shard_{i}.db'}") for i in range(3)]
+        try:
+            for user_id, schedule_id in created.items():
+                engine = engines[shards.jump_hash(user_id, 3)]
+                with engine.connect() as conn:
+                    ids = conn.execute(select(Schedule.id).where(Schedule.user_id == user_id)).scalars().all()
+                    version = conn.execute(select(User.schedule_version).where(User.id == user_id)).scalar()
+                assert ids == [schedule_id]
+                assert version == (2 if user_id in moved else 1)
+            # 원래 샤드에는 옮긴 사용자의 행이 남지 않음
+            for user_id in moved:
+                with engines[shards.jump_hash(user_id, 2)].connect() as conn:
+                    assert conn.execute(select(Schedule.id).where(Schedule.user_id == user_id)).first() is None
+        finally:
+            for engine in engines:
+                engine.dispose()
+
+
+class TestTimestampStorage:
+    """일정 시각 epoch 저장 형식 / 변환 도구 테스트"""
+
+    def test_epoch_type_round_trip(self):
+        """naive 값은 KST, aware 값은 그 시각으로 UTC epoch 초 변환, 읽을 때는 KST naive"""
+        epoch_type = EpochDateTime()
+        kst_nine = datetime(2025, 10, 20, 9, 0)
+        assert epoch_type.process_bind_param(kst_nine, None) == 1760918400  # 2025-10-20T00:00Z
+        assert epoch_type.process_bind_param(datetime(2025, 10, 20, 0, 0, tzinfo=timezone.utc), None) == 1760918400
+        assert epoch_type.process_result_value(1760918400, None) == kst_nine
+        assert epoch_type.process_bind_param(None, None) is None
+
+    def test_kst_date_on_epoch_column(self, tmp_path):
+        """epoch 컬럼의 일별 집계 날짜는 KST 기준 (UTC 15시 = 다음 날 0시)"""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'date.db'}")
+        epoch_column = column("ts", EpochDateTime())
+        try:
+            with engine.connect() as conn:
+                for kst, expected in ((datetime(2025, 10, 20, 23, 30), "2025-10-20"), (datetime(2025, 10, 21, 0, 30), "2025-10-21")):
+                    day = conn.execute(
+                        select(kst_date(epoch_column)).select_from(text("(SELECT :ts AS ts)")),
+                        {"ts": EpochDateTime().process_bind_param(kst, None)}
+                    ).scalar()
+                    assert day == expected
+        finally:
+            engine.dispose()
+
+    def test_convert_existing_rows(self, tmp_path):
+        """텍스트 → epoch → 텍스트 변환 후 값이 보존되고, 다시 실행해도 변하지 않음"""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+        Base.metadata.create_all(bind=engine)
+        scheduled_at = datetime(2025, 10, 20, 9, 0)
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert().values(id=1, username="m", email="m@example.com"))
+            # 모델 타입은 설정에 따라 달라지므로 기존(텍스트) 형식 값을 직접 저장
+            conn.execute(text(
+                "INSERT INTO schedules (id, title, scheduled_at, user_id, created_at, updated_at) "
+                "VALUES (1, '변환', '2025-10-20 09:00:00.000000', 1, '2025-10-01 12:00:30.000000', '2025-10-01 12:00:30.000000')"
+            ))
+        raw = "SELECT scheduled_at, created_at FROM schedules"
+        try:
+            with engine.connect() as conn:
+                original = conn.execute(text(raw)).one()
+
+            assert convert_timestamps(engine, "epoch") == {"schedules": 3, "schedules_archive": 0}
+            assert convert_timestamps(engine, "epoch") == {"schedules": 0, "schedules_archive": 0}
+            with engine.connect() as conn:
+                stored = conn.execute(text(raw)).one()
+                loaded = conn.execute(
+                    text(raw).columns(scheduled_at=EpochDateTime(), created_at=EpochDateTime())
+                ).one()
+            assert stored == (1760918400, 1759287630)
+            assert loaded == (scheduled_at, datetime(2025, 10, 1, 12, 0, 30))
+
+            convert_timestamps(engine, "datetime")
+            with engine.connect() as conn:
+                assert conn.execute(text(raw)).one() == original
+        finally:
+            engine.dispose()
+
+
+class TestSchemaMigrations:
+    """버전 기반 스키마 마이그레이션 테스트"""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+        yield engine
+        engine.dispose()
+
+    def test_fresh_database(self, engine):
+        """빈 DB에 모든 단계를 적용하고 다시 실행하면 아무것도 하지 않음"""
+        assert migrations.migrate(engine) == list(range(1, migrations.LATEST_VERSION + 1))
+        assert migrations.migrate(engine) == []
+
+        inspector = inspect(engine)
+        assert {"users", "schedules", "schedules_archive", "schema_version"} <= set(inspector.get_table_names())
+        index_names = {i["name"] for i in inspector.get_indexes("schedules")}
+        assert "ix_schedules_user_id_scheduled_at" in index_names
+        assert "ix_schedules_id" not in index_names
+        assert migrations.ensure_schema(engine) == migrations.LATEST_VERSION
+
+    def test_upgrade_legacy_database(self, engine):
+        """schema_version이 없는 이전 DB는 누락 컬럼/인덱스/테이블만 추가되고 기존 행은 유지"""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR, email VARCHAR, hashed_password VARCHAR)"))
+            conn.execute(text(
+                "CREATE TABLE schedules (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, description VARCHAR, "
+                "scheduled_at DATETIME NOT NULL, is_completed BOOLEAN, user_id INTEGER REFERENCES users(id), "
+                "created_at DATETIME, updated_at DATETIME)"
+            ))
+            conn.execute(text("CREATE INDEX ix_schedules_id ON schedules (id)"))
+            conn.execute(text("INSERT INTO users (id, username) VALUES (1, 'legacy')"))
+            conn.execute(text("INSERT INTO schedules (id, title, scheduled_at, user_id) VALUES (1, '기존', '2025-10-20 09:00:00', 1)"))
+
+        with pytest.raises(RuntimeError):
+            migrations.ensure_schema(engine)
+        assert migrations.ensure_schema(engine, auto_migrate=True) == migrations.LATEST_VERSION
+
+        inspector = inspect(engine)
+        assert {"version", "deleted_at"} <= {c["name"] for c in inspector.get_columns("schedules")}
+        assert "schedule_version" in {c["name"] for c in inspector.get_columns("users")}
+        assert "ix_schedules_id" not in {i["name"] for i in inspector.get_indexes("schedules")}
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT title, version FROM schedules")).one() == ("기존", 0)
+
+    def test_target_version(self, engine):
+        """target까지만 적용하고 이후 실행에서 나머지 단계를 이어서 적용"""
+        assert migrations.migrate(engine, target=2) == [1, 2]
+        assert "schedules_archive" not in inspect(engine).get_table_names()
+        assert migrations.migrate(engine) == list(range(3, migrations.LATEST_VERSION + 1))
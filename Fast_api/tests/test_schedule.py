@@ -47,6 +47,19 @@ class TestScheduleCRUD:
         data = response.json()
         assert len(data) == 2
 
+    def test_list_item_matches_detail(self, client, auth_headers):
+        """목록(직접 인코딩)과 개별 조회(응답 모델 검증)의 직렬화 결과가 동일"""
+        created = client.post(
+            "/api/schedules",
+            json={"title": "형식 비교", "description": None, "scheduled_at": "2025-10-22T09:30:15"},
+            headers=auth_headers
+        ).json()
+
+        listed = client.get("/api/schedules", headers=auth_headers).json()
+        detail = client.get(f"/api/schedules/{created['id']}", headers=auth_headers).json()
+        assert listed == [detail]
+        assert listed[0]["scheduled_at"] == "2025-10-22T09:30:15"
+
     def test_get_schedule_by_id(self, client, auth_headers):
         """특정 일정 조회"""
         # 일정 생성
@@ -91,6 +104,16 @@ class TestScheduleCRUD:
         assert data["title"] == "수정 후"
         assert data["is_completed"] is True
 
+    def test_update_nonexistent_schedule(self, client, auth_headers):
+        """존재하지 않는 일정 수정/삭제는 404, 버전 변화 없음"""
+        before = client.get("/api/schedules/changes", headers=auth_headers).json()["version"]
+        response = client.put("/api/schedules/99999", json={"title": "없음"}, headers=auth_headers)
+        assert response.status_code == 404
+        response = client.delete("/api/schedules/99999", headers=auth_headers)
+        assert response.status_code == 404
+        after = client.get("/api/schedules/changes", headers=auth_headers).json()["version"]
+        assert before == after
+
     def test_delete_schedule(self, client, auth_headers):
         """일정 삭제"""
         # 일정 생성
@@ -111,6 +134,631 @@ class TestScheduleCRUD:
         assert get_response.status_code == 404
 
 
+class TestScheduleDateRange:
+    """기간(from/to) 조회 테스트"""
+
+    def _create(self, client, auth_headers, title, scheduled_at):
+        response = client.post(
+            "/api/schedules",
+            json={"title": title, "scheduled_at": scheduled_at},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_get_schedules_ordered_by_time(self, client, auth_headers):
+        """기간 없이 조회해도 scheduled_at 오름차순"""
+        self._create(client, auth_headers, "늦은 일정", "2025-10-22T09:00:00")
+        self._create(client, auth_headers, "이른 일정", "2025-10-20T09:00:00")
+
+        response = client.get("/api/schedules", headers=auth_headers)
+        assert response.status_code == 200
+        assert [s["title"] for s in response.json()] == ["이른 일정", "늦은 일정"]
+
+    def test_get_schedules_in_range(self, client, auth_headers):
+        """from 이상, to 미만 구간만 반환"""
+        self._create(client, auth_headers, "9월", "2025-09-30T23:00:00")
+        self._create(client, auth_headers, "10월 초", "2025-10-01T00:00:00")
+        self._create(client, auth_headers, "10월 말", "2025-10-31T18:00:00")
+        self._create(client, auth_headers, "11월", "2025-11-01T00:00:00")
+
+        response = client.get(
+            "/api/schedules",
+            params={"from": "2025-10-01T00:00:00", "to": "2025-11-01T00:00:00"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [s["title"] for s in response.json()] == ["10월 초", "10월 말"]
+
+    def test_get_schedules_range_with_timezone(self, client, auth_headers):
+        """timezone이 포함된 경계는 KST로 변환해 비교"""
+        self._create(client, auth_headers, "KST 오전 9시", "2025-10-20T09:00:00")
+
+        # 2025-10-20T00:00:00Z == 2025-10-20T09:00:00 KST
+        response = client.get(
+            "/api/schedules",
+            params={"from": "2025-10-20T00:00:00Z", "to": "2025-10-20T01:00:00Z"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [s["title"] for s in response.json()] == ["KST 오전 9시"]
+
+    def test_get_schedules_invalid_range(self, client, auth_headers):
+        """from이 to보다 늦으면 400"""
+        response = client.get(
+            "/api/schedules",
+            params={"from": "2025-11-01T00:00:00", "to": "2025-10-01T00:00:00"},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestScheduleCursorPagination:
+    """cursor(keyset) 페이지네이션 테스트"""
+
+    def test_paginate_with_cursor(self, client, auth_headers):
+        """X-Next-Cursor를 따라가면 중복/누락 없이 전체 순회"""
+        # 같은 시각의 일정을 섞어 id 보조 정렬까지 검증
+        times = ["2025-10-20T09:00:00", "2025-10-20T09:00:00", "2025-10-21T09:00:00",
+                 "2025-10-22T09:00:00", "2025-10-22T09:00:00"]
+        for i, scheduled_at in enumerate(times):
+            client.post(
+                "/api/schedules",
+                json={"title": f"일정 {i}", "scheduled_at": scheduled_at},
+                headers=auth_headers
+            )
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/api/schedules", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            seen.extend(s["title"] for s in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert seen == [f"일정 {i}" for i in range(5)]
+
+    def test_last_page_has_no_cursor(self, client, auth_headers):
+        """마지막 페이지(limit 미만)에는 커서 헤더 없음"""
+        client.post(
+            "/api/schedules",
+            json={"title": "하나", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        )
+        response = client.get("/api/schedules", params={"limit": 10}, headers=auth_headers)
+        assert response.status_code == 200
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_invalid_cursor(self, client, auth_headers):
+        """잘못된 커서는 400"""
+        response = client.get(
+            "/api/schedules",
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestScheduleSummary:
+    """주간/월간 요약 집계 테스트"""
+
+    def _create(self, client, auth_headers, scheduled_at, completed=False):
+        response = client.post(
+            "/api/schedules",
+            json={"title": "요약 테스트", "scheduled_at": scheduled_at},
+            headers=auth_headers
+        )
+        if completed:
+            client.put(
+                f"/api/schedules/{response.json()['id']}",
+                json={"is_completed": True},
+                headers=auth_headers
+            )
+
+    def test_weekly_summary(self, client, auth_headers):
+        """일요일 시작 주간 범위에서 일자별 합계/완료 수 집계"""
+        self._create(client, auth_headers, "2025-10-18T23:00:00")  # 이전 주 토요일
+        self._create(client, auth_headers, "2025-10-19T00:00:00", completed=True)  # 일요일
+        self._create(client, auth_headers, "2025-10-22T09:00:00")
+        self._create(client, auth_headers, "2025-10-22T18:00:00", completed=True)
+        self._create(client, auth_headers, "2025-10-26T00:00:00")  # 다음 주 일요일
+
+        response = client.get(
+            "/api/schedules/summary",
+            params={"period": "week", "anchor": "2025-10-22"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["start"] == "2025-10-19"
+        assert data["end"] == "2025-10-26"
+        assert data["total"] == 3
+        assert data["completed"] == 2
+        assert data["completion_rate"] == 66.7
+        assert data["days"] == [
+            {"date": "2025-10-19", "total": 1, "completed": 1},
+            {"date": "2025-10-22", "total": 2, "completed": 1},
+        ]
+
+    def test_monthly_summary(self, client, auth_headers):
+        """월간 범위는 해당 월 1일부터 다음 달 1일 전까지"""
+        self._create(client, auth_headers, "2025-10-01T09:00:00")
+        self._create(client, auth_headers, "2025-10-31T23:59:00")
+        self._create(client, auth_headers, "2025-11-01T00:00:00")
+
+        response = client.get(
+            "/api/schedules/summary",
+            params={"period": "month", "anchor": "2025-10-15"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["start"] == "2025-10-01"
+        assert data["end"] == "2025-11-01"
+        assert data["total"] == 2
+        assert data["completion_rate"] == 0.0
+
+    def test_invalid_period(self, client, auth_headers):
+        """지원하지 않는 period는 422"""
+        response = client.get(
+            "/api/schedules/summary",
+            params={"period": "year"},
+            headers=auth_headers
+        )
+        assert response.status_code == 422
+
+
+class TestScheduleETag:
+    """ETag / If-None-Match 조건부 조회 테스트"""
+
+    def test_list_not_modified(self, client, auth_headers):
+        """변경이 없으면 304, 본문 없음"""
+        client.post(
+            "/api/schedules",
+            json={"title": "ETag", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        )
+        first = client.get("/api/schedules", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/schedules", headers={**auth_headers, "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.content == b""
+
+    def test_etag_changes_after_each_write(self, client, auth_headers):
+        """생성/수정/삭제마다 버전이 올라 ETag가 바뀜"""
+        etags = [client.get("/api/schedules", headers=auth_headers).headers["ETag"]]
+
+        created = client.post(
+            "/api/schedules",
+            json={"title": "버전", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        ).json()
+        etags.append(client.get("/api/schedules", headers=auth_headers).headers["ETag"])
+
+        client.put(f"/api/schedules/{created['id']}", json={"is_completed": True}, headers=auth_headers)
+        etags.append(client.get("/api/schedules", headers=auth_headers).headers["ETag"])
+
+        client.delete(f"/api/schedules/{created['id']}", headers=auth_headers)
+        etags.append(client.get("/api/schedules", headers=auth_headers).headers["ETag"])
+
+        assert len(set(etags)) == 4
+
+        # 이전 ETag로 요청하면 최신 목록을 200으로 받음
+        response = client.get("/api/schedules", headers={**auth_headers, "If-None-Match": etags[0]})
+        assert response.status_code == 200
+
+    def test_single_schedule_not_modified(self, client, auth_headers):
+        """개별 조회도 동일한 ETag로 304"""
+        created = client.post(
+            "/api/schedules",
+            json={"title": "개별", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        ).json()
+        first = client.get(f"/api/schedules/{created['id']}", headers=auth_headers)
+        assert first.status_code == 200
+
+        second = client.get(
+            f"/api/schedules/{created['id']}",
+            headers={**auth_headers, "If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == 304
+
+
+class TestScheduleChanges:
+    """델타 동기화(/schedules/changes) 테스트"""
+
+    def test_initial_sync_returns_live_schedules(self, client, auth_headers):
+        """since=0이면 삭제되지 않은 전체 일정과 현재 버전 반환"""
+        for title in ["A", "B"]:
+            client.post(
+                "/api/schedules",
+                json={"title": title, "scheduled_at": "2025-10-20T09:00:00"},
+                headers=auth_headers
+            )
+
+        response = client.get("/api/schedules/changes", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["version"] == 2
+        assert [s["title"] for s in data["changed"]] == ["A", "B"]
+        assert data["deleted"] == []
+
+    def test_changes_since_version(self, client, auth_headers):
+        """since 이후의 생성/수정과 삭제 tombstone만 반환"""
+        ids = []
+        for title in ["유지", "수정", "삭제"]:
+            ids.append(client.post(
+                "/api/schedules",
+                json={"title": title, "scheduled_at": "2025-10-20T09:00:00"},
+                headers=auth_headers
+            ).json()["id"])
+        since = client.get("/api/schedules/changes", headers=auth_headers).json()["version"]
+
+        client.put(f"/api/schedules/{ids[1]}", json={"title": "수정됨"}, headers=auth_headers)
+        client.delete(f"/api/schedules/{ids[2]}", headers=auth_headers)
+        new = client.post(
+            "/api/schedules",
+            json={"title": "신규", "scheduled_at": "2025-10-21T09:00:00"},
+            headers=auth_headers
+        ).json()
+
+        response = client.get("/api/schedules/changes", params={"since": since}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["version"] == since + 3
+        assert [s["id"] for s in data["changed"]] == [ids[1], new["id"]]
+        assert data["changed"][0]["title"] == "수정됨"
+        assert data["deleted"] == [ids[2]]
+
+        # 최신 버전 기준으로는 변경 없음
+        response = client.get("/api/schedules/changes", params={"since": data["version"]}, headers=auth_headers)
+        assert response.json() == {"version": data["version"], "changed": [], "deleted": []}
+
+    def test_deleted_schedule_hidden_from_reads(self, client, auth_headers):
+        """soft-delete된 일정은 목록/요약에서 제외"""
+        created = client.post(
+            "/api/schedules",
+            json={"title": "삭제", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        ).json()
+        client.delete(f"/api/schedules/{created['id']}", headers=auth_headers)
+
+        assert client.get("/api/schedules", headers=auth_headers).json() == []
+        summary = client.get(
+            "/api/schedules/summary",
+            params={"anchor": "2025-10-20"},
+            headers=auth_headers
+        ).json()
+        assert summary["total"] == 0
+        # 두 번째 삭제는 404
+        assert client.delete(f"/api/schedules/{created['id']}", headers=auth_headers).status_code == 404
+
+    def test_since_ahead_of_server(self, client, auth_headers):
+        """서버보다 앞선 버전은 410 (전체 재동기화 필요)"""
+        response = client.get("/api/schedules/changes", params={"since": 999}, headers=auth_headers)
+        assert response.status_code == 410
+
+
+class TestScheduleWriteQueue:
+    """group-commit 쓰기 큐를 켠 상태의 생성/수정/삭제 테스트"""
+
+    @pytest.fixture
+    def write_queue_enabled(self, monkeypatch, db_session):
+        from Fast_api.core.config import settings
+        from Fast_api.db import write_queue
+
+        url = str(db_session.get_bind().url)
+        writer = write_queue.GroupCommitWriter(url)
+        monkeypatch.setattr(settings, "SCHEDULE_WRITE_QUEUE_ENABLED", True)
+        monkeypatch.setitem(write_queue._writers, url, writer)
+        yield writer
+        writer.close()
+
+    def test_crud_through_write_queue(self, client, auth_headers, write_queue_enabled):
+        """writer 스레드에서 커밋한 결과가 응답과 이후 조회에 반영"""
+        created = client.post(
+            "/api/schedules",
+            json={"title": "큐 일정", "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        )
+        assert created.status_code == 200
+        schedule_id = created.json()["id"]
+        assert schedule_id is not None
+
+        updated = client.put(f"/api/schedules/{schedule_id}", json={"is_completed": True}, headers=auth_headers)
+        assert updated.status_code == 200
+        assert updated.json()["is_completed"] is True
+
+        assert client.get(f"/api/schedules/{schedule_id}", headers=auth_headers).json()["is_completed"] is True
+
+        assert client.delete(f"/api/schedules/{schedule_id}", headers=auth_headers).status_code == 200
+        assert client.delete(f"/api/schedules/{schedule_id}", headers=auth_headers).status_code == 404
+        assert write_queue_enabled.stats["operations"] == 4
+
+    def test_queue_timeout_before_start_returns_503(self, client, auth_headers, db_session, write_queue_enabled, monkeypatch):
+        """쓰기가 시작되기 전에 대기 시간을 넘기면 반영되지 않았음을 알리는 503"""
+        import threading
+        from Fast_api.core.config import settings
+        from Fast_api.models.schedule import Schedule
+
+        monkeypatch.setattr(settings, "WRITE_QUEUE_RESULT_TIMEOUT_SECONDS", 0.05)
+        release = threading.Event()
+        blocked = write_queue_enabled.submit(lambda db: release.wait(5))
+        try:
+            response = client.post(
+                "/api/schedules",
+                json={"title": "밀린 일정", "scheduled_at": "2025-10-20T09:00:00"},
+                headers=auth_headers
+            )
+        finally:
+            release.set()
+        blocked.result(timeout=5)
+
+        assert response.status_code == 503
+        assert "변경되지 않았으니" in response.json()["detail"]
+        assert response.headers["Retry-After"] == "1"
+        assert db_session.query(Schedule).filter(Schedule.title == "밀린 일정").count() == 0
+
+    @pytest.mark.parametrize("method, path", [
+        ("post", "/api/schedules"),
+        ("put", "/api/schedules/1"),
+        ("delete", "/api/schedules/1"),
+    ])
+    def test_queue_timeout_while_running_returns_504(self, client, auth_headers, write_queue_enabled, monkeypatch, method, path):
+        """실행 중인 배치가 끝나지 않으면 반영되었을 수 있음을 알리는 504"""
+        from Fast_api.db import write_queue
+
+        def overrun(db, write):
+            raise write_queue.WriteOutcomeUnknownError()
+
+        monkeypatch.setattr(write_queue, "run", overrun)
+        body = {"title": "일정", "scheduled_at": "2025-10-20T09:00:00"} if method != "delete" else None
+        response = client.request(method.upper(), path, json=body, headers=auth_headers)
+
+        assert response.status_code == 504
+        assert "반영되었을 수 있으니" in response.json()["detail"]
+
+
+class TestScheduleShards:
+    """샤딩을 켠 상태의 일정 API 테스트"""
+
+    def test_schedules_stored_in_user_shard(self, client, auth_headers, db_session, test_user, tmp_path, monkeypatch):
+        """일정은 사용자의 샤드 파일에 저장되고 기본 DB에는 쓰지 않음"""
+        from Fast_api.core.config import settings
+        from Fast_api.db import shards
+        from Fast_api.models.schedule import Schedule
+
+        monkeypatch.setattr(settings, "SCHEDULE_SHARD_COUNT", 4)
+        monkeypatch.setattr(settings, "SCHEDULE_SHARD_DIR", str(tmp_path))
+        try:
+            created = client.post(
+                "/api/schedules",
+                json={"title": "샤드 일정", "scheduled_at": "2025-10-20T09:00:00"},
+                headers=auth_headers
+            )
+            assert created.status_code == 200
+            schedule_id = created.json()["id"]
+
+            listed = client.get("/api/schedules", headers=auth_headers)
+            assert [s["id"] for s in listed.json()] == [schedule_id]
+            assert listed.headers["ETag"] == f'W/"{test_user.id}-1"'
+            assert client.delete(f"/api/schedules/{schedule_id}", headers=auth_headers).status_code == 200
+
+            index = shards.shard_for_user(test_user.id)
+            assert (tmp_path / f"schedules_shard_{index}.db").exists()
+            assert db_session.query(Schedule).count() == 0
+        finally:
+            shards.dispose_shards()
+
+
+class TestScheduleArchive:
+    """완료 일정 아카이브(hot/cold 분리)와 조회 fall-through 테스트"""
+
+    @pytest.fixture
+    def archived(self, client, auth_headers, db_session):
+        from Fast_api.models.schedule import Schedule
+        from Fast_api.services.archive_service import archive_completed_schedules
+
+        ids = {}
+        for key, title, scheduled_at, completed in [
+            ("old_done", "지난 완료", "2025-01-10T09:00:00", True),
+            ("old_open", "지난 미완료", "2025-01-11T09:00:00", False),
+            ("recent", "최근 완료", "2025-10-20T09:00:00", True),
+        ]:
+            created = client.post("/api/schedules", json={"title": title, "scheduled_at": scheduled_at}, headers=auth_headers)
+            ids[key] = created.json()["id"]
+            if completed:
+                client.put(f"/api/schedules/{ids[key]}", json={"is_completed": True}, headers=auth_headers)
+
+        assert archive_completed_schedules(db_session, before=datetime(2025, 6, 1)) == 1
+        assert db_session.query(Schedule).filter(Schedule.id == ids["old_done"]).first() is None
+        return ids
+
+    def test_reads_fall_through_to_archive(self, client, auth_headers, archived):
+        """전체/과거 범위 목록, 단건, 요약, 초기 동기화에 아카이브 일정 포함"""
+        listed = client.get("/api/schedules", headers=auth_headers).json()
+        assert [s["id"] for s in listed] == [archived["old_done"], archived["old_open"], archived["recent"]]
+
+        january = client.get(
+            "/api/schedules",
+            params={"from": "2025-01-01T00:00:00", "to": "2025-02-01T00:00:00"},
+            headers=auth_headers
+        ).json()
+        assert [s["title"] for s in january] == ["지난 완료", "지난 미완료"]
+
+        recent = client.get("/api/schedules", params={"from": "2025-10-01T00:00:00"}, headers=auth_headers).json()
+        assert [s["id"] for s in recent] == [archived["recent"]]
+
+        detail = client.get(f"/api/schedules/{archived['old_done']}", headers=auth_headers)
+        assert detail.status_code == 200 and detail.json()["is_completed"] is True
+
+        summary = client.get(
+            "/api/schedules/summary", params={"period": "month", "anchor": "2025-01-15"}, headers=auth_headers
+        ).json()
+        assert (summary["total"], summary["completed"]) == (2, 1)
+
+        changes = client.get("/api/schedules/changes", params={"since": 0}, headers=auth_headers).json()
+        assert len(changes["changed"]) == 3
+
+    def test_write_restores_archived_schedule(self, client, auth_headers, db_session, archived):
+        """아카이브된 일정을 수정하면 hot 테이블로 복원된 뒤 갱신"""
+        from Fast_api.models.schedule import Schedule, ScheduleArchive
+
+        response = client.put(
+            f"/api/schedules/{archived['old_done']}", json={"title": "다시 열기"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["id"] == archived["old_done"]
+        assert db_session.query(ScheduleArchive).count() == 0
+        assert db_session.query(Schedule).filter(Schedule.id == archived["old_done"]).one().title == "다시 열기"
+
+    def test_newest_row_is_not_archived(self, client, auth_headers, db_session):
+        """가장 큰 id의 행은 id 재사용을 막기 위해 아카이브하지 않음"""
+        from Fast_api.services.archive_service import archive_completed_schedules
+
+        created = client.post(
+            "/api/schedules", json={"title": "지난 완료", "scheduled_at": "2025-01-10T09:00:00"}, headers=auth_headers
+        ).json()
+        client.put(f"/api/schedules/{created['id']}", json={"is_completed": True}, headers=auth_headers)
+        assert archive_completed_schedules(db_session, before=datetime(2025, 6, 1)) == 0
+
+    def test_row_changed_after_select_is_not_archived(self, client, auth_headers, db_session, monkeypatch):
+        """id 조회 후 이동 전에 삭제/완료 해제된 일정은 옮기지 않음"""
+        from sqlalchemy import text
+        from Fast_api.models.schedule import Schedule, ScheduleArchive
+        from Fast_api.services.archive_service import archive_completed_schedules
+
+        ids = []
+        for title, scheduled_at in [("지난 완료 1", "2025-01-10T09:00:00"), ("지난 완료 2", "2025-01-11T09:00:00"),
+                                    ("지난 완료 3", "2025-01-12T09:00:00"), ("최근", "2025-10-20T09:00:00")]:
+            created = client.post("/api/schedules", json={"title": title, "scheduled_at": scheduled_at}, headers=auth_headers)
+            ids.append(created.json()["id"])
+        for schedule_id in ids[:3]:
+            client.put(f"/api/schedules/{schedule_id}", json={"is_completed": True}, headers=auth_headers)
+
+        execute = db_session.execute
+        calls = []
+
+        def racing_execute(statement, *args, **kwargs):
+            calls.append(statement)
+            if len(calls) == 2:
+                # id SELECT 이후, 이동(INSERT) 전에 다른 요청이 한 일정은 삭제, 한 일정은 완료 해제
+                execute(text("UPDATE schedules SET deleted_at = '2025-10-20 09:00:00' WHERE id = :id"), {"id": ids[1]})
+                execute(text("UPDATE schedules SET is_completed = 0 WHERE id = :id"), {"id": ids[2]})
+            return execute(statement, *args, **kwargs)
+
+        monkeypatch.setattr(db_session, "execute", racing_execute)
+        assert archive_completed_schedules(db_session, before=datetime(2025, 6, 1)) == 1
+        monkeypatch.undo()
+
+        assert [row.id for row in db_session.query(ScheduleArchive)] == [ids[0]]
+        assert db_session.query(Schedule).filter(Schedule.id.in_(ids[1:3])).count() == 2
+        assert client.get(f"/api/schedules/{ids[1]}", headers=auth_headers).status_code == 404
+
+
+class TestScheduleBatch:
+    """일괄 처리(/schedules/batch) 테스트"""
+
+    def _create(self, client, auth_headers, title):
+        return client.post(
+            "/api/schedules",
+            json={"title": title, "scheduled_at": "2025-10-20T09:00:00"},
+            headers=auth_headers
+        ).json()["id"]
+
+    def test_batch_mixed_operations(self, client, auth_headers):
+        """생성/수정/완료/삭제를 한 번에 처리하고 작업별 결과를 순서대로 반환"""
+        update_id = self._create(client, auth_headers, "수정 대상")
+        complete_id = self._create(client, auth_headers, "완료 대상")
+        delete_id = self._create(client, auth_headers, "삭제 대상")
+
+        response = client.post(
+            "/api/schedules/batch",
+            json={"operations": [
+                {"op": "create", "schedule": {"title": "새 일정", "scheduled_at": "2025-10-21T10:00:00"}},
+                {"op": "update", "id": update_id, "changes": {"title": "수정 완료"}},
+                {"op": "complete", "id": complete_id},
+                {"op": "delete", "id": delete_id},
+                {"op": "delete", "id": 99999},
+            ]},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["version"] == 4  # 생성 3번 + 배치 1번
+        results = data["results"]
+        assert [r["status"] for r in results] == ["ok", "ok", "ok", "ok", "not_found"]
+        new_id = results[0]["id"]
+
+        schedules = {s["id"]: s for s in client.get("/api/schedules", headers=auth_headers).json()}
+        assert set(schedules) == {update_id, complete_id, new_id}
+        assert schedules[new_id]["title"] == "새 일정"
+        assert schedules[new_id]["is_completed"] is False
+        assert schedules[update_id]["title"] == "수정 완료"
+        assert schedules[complete_id]["is_completed"] is True
+
+        changes = client.get("/api/schedules/changes", params={"since": 3}, headers=auth_headers).json()
+        assert changes["deleted"] == [delete_id]
+        assert {s["id"] for s in changes["changed"]} == {new_id, update_id, complete_id}
+
+    def test_batch_other_value_error_is_not_duplicate(self, client, auth_headers, monkeypatch):
+        """중복 id가 아닌 ValueError는 중복 id 400으로 바꾸지 않음 (500)"""
+        from Fast_api.services import schedule_service
+
+        def broken_batch(db, user_id, operations):
+            raise ValueError("unexpected")
+
+        monkeypatch.setattr(schedule_service, "apply_schedule_batch", broken_batch)
+        response = client.post(
+            "/api/schedules/batch",
+            json={"operations": [{"op": "delete", "id": 1}]},
+            headers=auth_headers
+        )
+        assert response.status_code == 500
+
+    def test_batch_duplicate_id(self, client, auth_headers):
+        """같은 id를 두 번 참조하면 400, 아무것도 적용되지 않음"""
+        schedule_id = self._create(client, auth_headers, "중복")
+        response = client.post(
+            "/api/schedules/batch",
+            json={"operations": [
+                {"op": "complete", "id": schedule_id},
+                {"op": "delete", "id": schedule_id},
+            ]},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert len(client.get("/api/schedules", headers=auth_headers).json()) == 1
+
+    def test_batch_cannot_touch_other_users_schedule(self, client, auth_headers, db_session):
+        """다른 사용자의 일정은 not_found"""
+        from Fast_api.models.user import User
+        from Fast_api.models.schedule import Schedule
+
+        other = User(username="other", email="other@test.com", hashed_password="x")
+        db_session.add(other)
+        db_session.commit()
+        schedule = Schedule(title="남의 일정", scheduled_at=datetime(2025, 10, 20, 9), user_id=other.id)
+        db_session.add(schedule)
+        db_session.commit()
+
+        response = client.post(
+            "/api/schedules/batch",
+            json={"operations": [{"op": "delete", "id": schedule.id}]},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == "not_found"
+        db_session.refresh(schedule)
+        assert schedule.deleted_at is None
+
+
 class TestScheduleAuthorization:
     """일정 권한 테스트 (다른 사용자의 일정 접근 불가)"""
 
@@ -175,6 +823,33 @@ class TestNaturalLanguageParsing:
             assert len(data) > 0
             assert "title" in data[0]
 
+    def test_parse_and_create_with_stubbed_llm(self, client, auth_headers, db_session, test_user, monkeypatch):
+        """LLM 파싱 결과를 async 세션으로 저장하고 무료 사용자 요청 수를 증가"""
+        from Fast_api.api import schedule as schedule_api
+        from Fast_api.schemas.schedule import ScheduleCreate
+
+        async def fake_parse(text):
+            return [
+                ScheduleCreate(title="회의", scheduled_at=datetime(2025, 10, 21, 14, 0)),
+                ScheduleCreate(title="저녁 약속", scheduled_at=datetime(2025, 10, 21, 19, 0)),
+            ]
+
+        monkeypatch.setattr(schedule_api, "parse_natural_language_to_schedules", fake_parse)
+        response = client.post(
+            "/api/schedules/parse-and-create",
+            json={"text": "내일 오후 2시 회의, 저녁 7시 약속"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["title"] for s in data] == ["회의", "저녁 약속"]
+        assert all(s["id"] and s["created_at"] and s["is_completed"] is False for s in data)
+
+        listed = client.get("/api/schedules", headers=auth_headers).json()
+        assert [s["id"] for s in listed] == [s["id"] for s in data]
+        db_session.refresh(test_user)
+        assert test_user.request_count == 1
+
     def test_parse_with_dangerous_input(self, client, auth_headers):
         """
         프롬프트 인젝션 시도 차단
@@ -217,6 +892,249 @@ class TestNaturalLanguageParsing:
         assert "입력이 너무 짧습니다" in response.json()["detail"]
 
 
+class TestLLMClientRegistry:
+    """LLM 클라이언트 재사용 테스트"""
+
+    def test_reuses_client_per_key(self):
+        """(provider, model, api_key)가 같으면 같은 클라이언트, 다르면 새 클라이언트"""
+        from module.llm_agent import LLMClientRegistry
+
+        registry = LLMClientRegistry()
+        client = registry.get("openai", "gpt-test", "key-1")
+        assert registry.get("openai", "gpt-test", "key-1") is client
+        assert registry.get("openai", "gpt-test", "key-2") is not client
+        assert registry.get("openai", "other-model", "key-1") is not client
+        registry.clear()
+        assert registry.get("openai", "gpt-test", "key-1") is not client
+        registry.clear()
+
+    def test_concurrent_get_creates_one_client(self):
+        """여러 스레드가 동시에 요청해도 클라이언트는 하나만 생성"""
+        from concurrent.futures import ThreadPoolExecutor
+        from module.llm_agent import LLMClientRegistry
+
+        registry = LLMClientRegistry()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: registry.get("ollama", "llama-test"), range(32)))
+        assert all(client is clients[0] for client in clients)
+        registry.clear()
+
+    def test_genai_single_api_key(self):
+        """genai 설정은 프로세스 전역이므로 다른 키는 거부 (clear() 후에는 허용)"""
+        from module.llm_agent import LLMClientRegistry
+
+        registry = LLMClientRegistry()
+        registry.get("genai", "gemini-test", "key-1")
+        registry.get("genai", "gemini-other", "key-1")
+        with pytest.raises(ValueError):
+            registry.get("genai", "gemini-test", "key-2")
+        registry.clear()
+        assert registry.get("genai", "gemini-test", "key-2") is not None
+        registry.clear()
+
+    def test_unknown_provider(self):
+        """지원하지 않는 provider는 ValueError"""
+        from module.llm_agent import LLMClientRegistry
+
+        with pytest.raises(ValueError):
+            LLMClientRegistry().get("unknown", "model")
+
+    def test_parser_reuses_agent(self):
+        """파서는 같은 설정이면 같은 LLM_Agent를 재사용"""
+        from Fast_api.services.llm_schedule_parser import get_schedule_agent
+
+        agent = get_schedule_agent("gpt-test", "openai", "key-1")
+        assert get_schedule_agent("gpt-test", "openai", "key-1") is agent
+        assert get_schedule_agent("gpt-test", "openai", "key-2") is not agent
+
+
+    def test_acall_limits_concurrency(self, monkeypatch):
+        """acall은 async 클라이언트를 사용하고 동시 호출을 max_concurrency개로 제한"""
+        import asyncio
+        from module.llm_agent import LLM_Agent, llm_clients
+
+        state = {"in_flight": 0, "max_in_flight": 0}
+
+        class FakeAsyncOllama:
+            async def chat(self, model, messages):
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                return {"message": {"content": messages[-1]["content"]}}
+
+        monkeypatch.setattr(llm_clients, "max_concurrency", 2)
+        monkeypatch.setattr(llm_clients, "get_async", lambda *args: FakeAsyncOllama())
+        agent = LLM_Agent(model_name="llama-test", provider="ollama")
+
+        async def run():
+            return await asyncio.gather(*(agent.acall("system", f"message {i}") for i in range(10)))
+
+        assert asyncio.run(run()) == [f"message {i}" for i in range(10)]
+        assert state["max_in_flight"] == 2
+
+    def test_acall_unsupported_provider(self):
+        """acall도 __call__처럼 지원하지 않는 provider는 "Unsupported provider." 반환"""
+        import asyncio
+        from module.llm_agent import LLM_Agent
+
+        agent = LLM_Agent(model_name="gpt-test", provider="openai")
+        agent.provider = "unknown"
+        assert agent("system", "message") == "Unsupported provider."
+        assert asyncio.run(agent.acall("system", "message")) == "Unsupported provider."
+
+    def test_acall_openai_against_local_server(self, monkeypatch):
+        """AsyncOpenAI 경로를 로컬 HTTP 서버로 확인"""
+        import asyncio
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from module.llm_agent import LLM_Agent
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                body = json.dumps({
+                    "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": request["model"],
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": request["messages"][-1]["content"]}}]
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+        try:
+            agent = LLM_Agent(model_name="gpt-test", provider="openai", api_key="local-server-key")
+            assert asyncio.run(agent.acall("system", "내일 오전 9시 회의")) == "내일 오전 9시 회의"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_parser_uses_acall(self, monkeypatch):
+        """파서는 스레드풀 대신 LLM_Agent.acall로 호출"""
+        import asyncio
+        from module.llm_agent import LLM_Agent
+        from Fast_api.services.llm_schedule_parser import parse_natural_language_to_schedules
+
+        async def fake_acall(self, system_prompt, user_message, **kwargs):
+            return '```json\n[{"title": "회의", "description": null, "scheduled_at": "2025-10-21T14:00:00"}]\n```'
+
+        def fail_call(self, *args, **kwargs):
+            raise AssertionError("동기 __call__을 사용하면 안 됨")
+
+        from Fast_api.core.config import settings
+        monkeypatch.setattr(settings, "provider", "openai")
+        monkeypatch.setattr(LLM_Agent, "acall", fake_acall)
+        monkeypatch.setattr(LLM_Agent, "__call__", fail_call)
+        schedules = asyncio.run(parse_natural_language_to_schedules("내일 오후 2시 회의"))
+        assert [(s.title, s.scheduled_at) for s in schedules] == [("회의", datetime(2025, 10, 21, 14, 0))]
+
+class TestParseQuota:
+    """무료 사용자 일일 요청 한도 예약/환불 테스트"""
+
+    @pytest.fixture
+    def llm_calls(self, monkeypatch):
+        from Fast_api.api import schedule as schedule_api
+        from Fast_api.schemas.schedule import ScheduleCreate
+        calls = []
+
+        async def fake_parse(text):
+            calls.append(text)
+            if text.startswith("실패"):
+                raise RuntimeError("LLM error")
+            return [ScheduleCreate(title="회의", scheduled_at=datetime(2025, 10, 21, 14, 0))]
+
+        monkeypatch.setattr(schedule_api, "parse_natural_language_to_schedules", fake_parse)
+        return calls
+
+    @staticmethod
+    def set_quota(db_session, user, request_count, last_reset_date, daily_limit=3):
+        user.request_count = request_count
+        user.last_reset_date = last_reset_date
+        user.daily_limit = daily_limit
+        db_session.commit()
+
+    def test_limit_reached_skips_llm(self, client, auth_headers, db_session, test_user, llm_calls):
+        """오늘 한도를 모두 쓴 사용자는 LLM 호출 없이 429"""
+        from Fast_api.services.quota_service import today_kst
+        self.set_quota(db_session, test_user, 3, today_kst())
+        response = client.post("/api/schedules/parse-and-create", json={"text": "내일 회의"}, headers=auth_headers)
+        assert response.status_code == 429
+        assert "3/3" in response.json()["detail"]
+        assert llm_calls == []
+
+    def test_llm_failure_refunds(self, client, auth_headers, db_session, test_user, llm_calls):
+        """LLM 호출이 실패하면 예약한 요청 수를 되돌림"""
+        from Fast_api.services.quota_service import today_kst
+        self.set_quota(db_session, test_user, 2, today_kst())
+        response = client.post("/api/schedules/parse-and-create", json={"text": "실패하는 요청"}, headers=auth_headers)
+        assert response.status_code == 500
+        db_session.refresh(test_user)
+        assert test_user.request_count == 2
+
+        response = client.post("/api/schedules/parse-and-create", json={"text": "내일 회의"}, headers=auth_headers)
+        assert response.status_code == 200
+        db_session.refresh(test_user)
+        assert test_user.request_count == 3
+
+    def test_new_day_resets_count(self, client, auth_headers, db_session, test_user, llm_calls):
+        """마지막 사용일이 오늘이 아니면 1부터 다시 계산"""
+        from Fast_api.services.quota_service import today_kst
+        self.set_quota(db_session, test_user, 3, today_kst() - timedelta(days=1))
+        response = client.post("/api/schedules/parse-and-create", json={"text": "내일 회의"}, headers=auth_headers)
+        assert response.status_code == 200
+        db_session.refresh(test_user)
+        assert (test_user.request_count, test_user.last_reset_date) == (1, today_kst())
+
+    def test_concurrent_reservations_respect_limit(self, db_session, test_user):
+        """같은 사용자의 동시 예약도 한도만큼만 성공"""
+        import asyncio
+        from fastapi import HTTPException
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from Fast_api.auth.user_cache import UserSnapshot
+        from Fast_api.services import quota_service
+        self.set_quota(db_session, test_user, 0, quota_service.today_kst())
+        user = UserSnapshot.from_user(test_user)
+
+        async def reserve_all():
+            engine = create_async_engine(str(db_session.get_bind().url).replace("sqlite://", "sqlite+aiosqlite://"))
+            factory = async_sessionmaker(engine, expire_on_commit=False)
+
+            async def reserve():
+                async with factory() as db:
+                    try:
+                        return await quota_service.reserve_request(db, user)
+                    except HTTPException as e:
+                        return e.status_code
+
+            try:
+                return await asyncio.gather(*(reserve() for _ in range(8)))
+            finally:
+                await engine.dispose()
+
+        results = asyncio.run(reserve_all())
+        assert sorted(r.request_count for r in results if r != 429) == [1, 2, 3]
+        assert results.count(429) == 5
+
+    def test_paid_user_not_counted(self, client, auth_headers, db_session, test_user, llm_calls):
+        """유료 사용자는 한도와 관계없이 호출하고 요청 수를 늘리지 않음"""
+        from Fast_api.services.quota_service import today_kst
+        test_user.paid_user = True
+        self.set_quota(db_session, test_user, 3, today_kst())
+        response = client.post("/api/schedules/parse-and-create", json={"text": "내일 회의"}, headers=auth_headers)
+        assert response.status_code == 200
+        db_session.refresh(test_user)
+        assert test_user.request_count == 3
+
+
 class TestScheduleValidation:
     """일정 데이터 검증 테스트"""
 
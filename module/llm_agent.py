@@ -1,8 +1,111 @@
+import asyncio
+import threading
+import weakref
 import ollama
 import google.generativeai as genai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from module.memory import MemoryManager
 
+
+class LLMClientRegistry:
+    """
+    프로세스 전역 LLM 클라이언트 저장소 (스레드 안전)
+    (provider, model_name, api_key)마다 클라이언트를 한 번만 만들어 재사용하므로
+    호출마다 HTTP 커넥션 풀 / TLS 핸드셰이크를 새로 만들지 않고 keep-alive 연결을 그대로 씁니다.
+    - openai: OpenAI 클라이언트 (httpx 커넥션 풀)
+    - ollama: ollama.Client (httpx 커넥션 풀, 호스트는 OLLAMA_HOST 환경 변수)
+    - genai: GenerativeModel. genai.configure는 프로세스 전역 설정이라 모든 GenerativeModel이 마지막으로 설정된 키를 쓰므로
+      genai는 프로세스당 api_key 하나만 허용 (다른 키를 요청하면 ValueError, clear() 후에는 다시 설정 가능)
+
+    async 클라이언트(AsyncOpenAI, ollama.AsyncClient, genai async)는 커넥션 풀이 만든 이벤트 루프에 묶이므로
+    이벤트 루프마다 따로 보관하고, max_concurrency는 루프마다 동시에 진행하는 LLM 호출 수를 제한합니다.
+    """
+    def __init__(self, max_concurrency:int=32):
+        self.max_concurrency = max_concurrency
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()  # 이벤트 루프 → {(provider, model_name, api_key): 클라이언트}
+        self._semaphores = weakref.WeakKeyDictionary()  # 이벤트 루프 → asyncio.Semaphore
+        self._genai_api_key = None  # genai.configure로 설정한 키 (프로세스 전역)
+        self._lock = threading.Lock()
+
+    def get(self, provider:str, model_name:str, api_key:str=None):
+        key = (provider, model_name, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._create(provider, model_name, api_key)
+                    self._clients[key] = client
+        return client
+
+    def _create(self, provider:str, model_name:str, api_key:str=None):
+        if provider == 'openai':
+            return OpenAI(api_key=api_key)
+        elif provider == 'ollama':
+            return ollama.Client()
+        elif provider == 'genai':
+            self._configure_genai(api_key)
+            return genai.GenerativeModel(model_name)
+        raise ValueError("Provider must be either 'ollama', 'genai' or 'openai'")
+
+    def _configure_genai(self, api_key:str=None):
+        # self._lock 안에서 호출 (클라이언트 생성 시). 이미 만든 GenerativeModel의 키가 바뀌지 않도록 다른 키는 거부
+        if self._genai_api_key is None:
+            genai.configure(api_key=api_key)
+            self._genai_api_key = api_key
+        elif self._genai_api_key != api_key:
+            raise ValueError("genai supports a single api_key per process; call clear() before switching keys")
+
+    def get_async(self, provider:str, model_name:str, api_key:str=None):
+        """현재 이벤트 루프에서 사용할 async 클라이언트"""
+        loop = asyncio.get_running_loop()
+        key = (provider, model_name, api_key)
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = self._create_async(provider, model_name, api_key)
+                clients[key] = client
+        return client
+
+    def _create_async(self, provider:str, model_name:str, api_key:str=None):
+        if provider == 'openai':
+            return AsyncOpenAI(api_key=api_key)
+        elif provider == 'ollama':
+            return ollama.AsyncClient()
+        elif provider == 'genai':
+            # GenerativeModel은 generate_content_async에서 async 클라이언트를 만들어 보관하므로 루프마다 새로 생성
+            self._configure_genai(api_key)
+            return genai.GenerativeModel(model_name)
+        raise ValueError("Provider must be either 'ollama', 'genai' or 'openai'")
+
+    def concurrency_limit(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 LLM 동시 호출 제한 (max_concurrency개를 넘는 호출은 스레드 없이 대기)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+        return semaphore
+
+    def clear(self):
+        """저장된 클라이언트를 모두 닫고 비움 (테스트 / 설정 변경 시, async 클라이언트는 참조만 제거)"""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._semaphores = weakref.WeakKeyDictionary()
+            self._genai_api_key = None
+        for client in clients:
+            close = getattr(client, 'close', None)
+            if close is not None:
+                close()
+
+
+llm_clients = LLMClientRegistry()
+
+
 class LLM_Agent:
     def __init__(self, model_name:str, provider:str='ollama', api_key:str=None, session_id:str ="default_session", max_history:int =10):
         self.model_name = model_name
@@ -67,7 +170,7 @@ class LLM_Agent:
             messages.append({"role": "user", "content": full_context})
 
             # 한 번만 호출
-            response = ollama.chat(model=self.model_name, messages=messages)
+            response = llm_clients.get(self.provider, self.model_name, self.api_key).chat(model=self.model_name, messages=messages)
             # print(messages) # 디버깅용 출력
             # 메모리에 저장
             if memory:
@@ -81,9 +184,8 @@ class LLM_Agent:
 
     def _generate_genai_response(self, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None):
         try:
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model_name)
-            
+            model = llm_clients.get(self.provider, self.model_name, self.api_key)
+
             # 모든 내용을 하나의 문자열로 결합
             combined_prompt = system_prompt
             
@@ -118,7 +220,7 @@ class LLM_Agent:
 
     def _generate_openai_response(self, system_prompt, user_message, memory=False, task=None, multi_agent_response=None) -> str:
         try:
-            client = OpenAI(api_key=self.api_key)
+            client = llm_clients.get(self.provider, self.model_name, self.api_key)
 
             # messages 리스트 구성 (Ollama와 유사한 방식)
             messages = [
@@ -158,6 +260,104 @@ class LLM_Agent:
             return f"Error generating response with OpenAI: {e}"
 
 
+    async def acall(self, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None) -> str:
+        """
+        __call__의 async 버전. provider의 async 클라이언트를 사용해 대기 중에 스레드를 점유하지 않음.
+        이벤트 루프당 동시에 진행하는 호출은 llm_clients.max_concurrency개로 제한되고, 나머지는 코루틴으로 대기.
+        Args:
+            system_prompt (str): 시스템 프롬프트
+            user_message (str): 사용자 메시지
+            memory (bool): 메모리 기능 활성화 여부
+            task (str, optional): 추가 작업 설명
+            multi_agent_response (str, optional): 다른 에이전트의 응답
+        Returns:
+            str: LLM의 응답
+        """
+        if not system_prompt or not user_message:
+            raise ValueError("Both system_prompt and user_message must be provided.")
+        try:
+            if self.provider == 'ollama':
+                generate = self._agenerate_ollama_response
+            elif self.provider == 'genai':
+                generate = self._agenerate_genai_response
+            elif self.provider == 'openai':
+                generate = self._agenerate_openai_response
+            else:
+                return "Unsupported provider."
+            async with llm_clients.concurrency_limit():
+                return await generate(system_prompt, user_message, memory, task, multi_agent_response)
+        except Exception as e:
+            return f"Error generating response: {e}"
+
+    def _load_history(self, memory:bool):
+        # 메모리 기능이 활성화된 경우 최근 max_history개 대화 기록을 불러옴
+        if not memory:
+            return None, []
+        memory_manager = MemoryManager()
+        history = memory_manager.get_history(self.session_id)
+        if self.max_history and len(history) > self.max_history:
+            history = history[-self.max_history:]
+        return memory_manager, history
+
+    async def _agenerate_ollama_response(self, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None) -> str:
+        async def complete(client, messages):
+            response = await client.chat(model=self.model_name, messages=messages)
+            return response["message"]["content"]
+        return await self._agenerate_chat_response('Ollama', complete, system_prompt, user_message, memory, task, multi_agent_response)
+
+    async def _agenerate_openai_response(self, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None) -> str:
+        async def complete(client, messages):
+            response = await client.chat.completions.create(model=self.model_name, messages=messages)
+            return response.choices[0].message.content
+        return await self._agenerate_chat_response('OpenAI', complete, system_prompt, user_message, memory, task, multi_agent_response)
+
+    async def _agenerate_chat_response(self, name:str, complete, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None) -> str:
+        # ollama / openai 공통 (messages 구성은 _generate_ollama_response, _generate_openai_response와 동일)
+        try:
+            memory_manager, history = self._load_history(memory)
+            messages = [{"role": "system", "content": system_prompt}, *history]
+
+            full_context = user_message
+            if task:
+                full_context += f' task: {str(task)}'
+            if multi_agent_response:
+                full_context += f' 다른 에이전트의 응답: {str(multi_agent_response)}'
+            messages.append({"role": "user", "content": full_context})
+
+            content = await complete(llm_clients.get_async(self.provider, self.model_name, self.api_key), messages)
+
+            if memory:
+                history.append({"role": "user", "content": full_context})
+                history.append({"role": "assistant", "content": content})
+                memory_manager.save_history(self.session_id, history)
+            return content
+        except Exception as e:
+            return f"Error generating response with {name}: {e}"
+
+    async def _agenerate_genai_response(self, system_prompt:str, user_message:str, memory:bool=False, task:str=None, multi_agent_response:str=None) -> str:
+        try:
+            # 프롬프트 구성은 _generate_genai_response와 동일
+            memory_manager, history = self._load_history(memory)
+            combined_prompt = system_prompt
+            for msg in history:
+                combined_prompt += f"\n\n이전 대화 기록:\n{msg['role']}: {msg['content']}"
+            if user_message:
+                combined_prompt += f"\n\n{user_message}"
+            if task:
+                combined_prompt += f"\n\n작업: {task}"
+            if multi_agent_response:
+                combined_prompt += f"\n\n다른 에이전트의 응답: {str(multi_agent_response)}"
+
+            model = llm_clients.get_async(self.provider, self.model_name, self.api_key)
+            response = await model.generate_content_async(combined_prompt)
+            if memory:
+                history.append({"role": "user", "content": combined_prompt})
+                history.append({"role": "assistant", "content": response.text})
+                memory_manager.save_history(self.session_id, history)
+            return response.text
+        except Exception as e:
+            return f"Error generating response with GenAI: {e}"
+
     def aggregate_responses(self, system_prompt:str, user_message:str, task:str=None, responses:list=None) -> str:
         
         # responses가 None일 경우 빈 리스트로 초기화
@@ -189,7 +389,7 @@ class Multi_modal_agent(LLM_Agent):
             if image_path:
                 if self.provider == 'ollama':
                     # Ollama의 이미지 입력 형식에 맞게 메시지 구성
-                    response = ollama.chat(
+                    response = llm_clients.get(self.provider, self.model_name, self.api_key).chat(
                         model=self.model_name,
                         messages=[{
                             'role': 'system',
@@ -209,11 +409,9 @@ class Multi_modal_agent(LLM_Agent):
                 
                 elif self.provider == 'genai':
                     # 새로운 genai 멀티모달 로직
-                    import google.generativeai as genai
                     from PIL import Image
-                    
-                    genai.configure(api_key=self.api_key)
-                    model = genai.GenerativeModel(self.model_name)
+
+                    model = llm_clients.get(self.provider, self.model_name, self.api_key)
                     
                     # 이미지 로드
                     image = Image.open(image_path)